@@ -13,6 +13,7 @@ from varats.data.databases.blame_diff_metrics_database import (
     build_report_pairs_tuple,
     get_predecessor_report_file,
     get_successor_report_file,
+    SampledRevisionIndex,
 )
 from varats.data.reports.blame_report import BlameReport
 from varats.mapping.commit_map import get_commit_map, CommitMap
@@ -239,3 +240,26 @@ class TestBlameDiffMetricsUtils(unittest.TestCase):
 
         self.assertEqual(successor_of_e6, self.br_paths_list[3])
         self.assertEqual(successor_of_5e, None)
+
+
+class TestSampledRevisionIndex(unittest.TestCase):
+    """Test if preceding and succeeding sampled revisions are found."""
+
+    def test_predecessor_successor(self) -> None:
+        """Check lookups of sampled and non-sampled revisions."""
+        time_ids = {
+            ShortCommitHash(f"{idx:010x}"): idx * 10 for idx in range(1, 6)
+        }
+        commit_map = mock.create_autospec(CommitMap, instance=True)
+        commit_map.short_time_id.side_effect = lambda rev: time_ids.get(rev, 25)
+        sampled_revs = [ShortCommitHash(f"{idx:010x}") for idx in (4, 1, 2, 4)]
+        index = SampledRevisionIndex(commit_map, sampled_revs)
+
+        self.assertIsNone(index.predecessor(sampled_revs[1]))
+        self.assertEqual(index.successor(sampled_revs[1]), sampled_revs[2])
+        self.assertEqual(index.predecessor(sampled_revs[0]), sampled_revs[2])
+        self.assertIsNone(index.successor(sampled_revs[0]))
+
+        not_sampled = ShortCommitHash("ffffffffff")
+        self.assertEqual(index.predecessor(not_sampled), sampled_revs[2])
+        self.assertEqual(index.successor(not_sampled), sampled_revs[0])
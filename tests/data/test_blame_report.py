@@ -7,6 +7,7 @@ from pathlib import Path
 
 import yaml
 
+from tests.helper_utils import run_in_test_environment, UnitTestFixtures
 from varats.data.reports.blame_report import (
     BlameReport,
     BlameReportDiff,
@@ -17,8 +18,14 @@ from varats.data.reports.blame_report import (
     gen_base_to_inter_commit_repo_pair_mapping,
     BlameTaintData,
     get_interacting_commits_for_commit,
+    generate_blame_metrics,
 )
-from varats.utils.git_util import CommitRepoPair, FullCommitHash
+from varats.utils.git_util import (
+    CommitMetadata,
+    CommitRepoPair,
+    FullCommitHash,
+)
+from varats.utils.settings import vara_cfg
 
 FAKE_REPORT_PATH = (
     "BRE-BR-xz-xz-fdbc0cfa71_63959faf-66d9-41e0-8dbb-abeee2c255eb_success.yaml"
@@ -593,6 +600,58 @@ class TestBlameReport(unittest.TestCase):
         self.assertEqual(next(func_entry_iter).name, '_Z7doStuffii')
 
 
+class TestCompiledBlameReport(unittest.TestCase):
+    """Test if a blame report is correctly loaded from its compiled form."""
+
+    @run_in_test_environment(UnitTestFixtures.RESULT_FILES)
+    def test_compiled_report_matches_yaml_report(self) -> None:
+        """Check whether loading a compiled report yields the same report."""
+        vara_cfg()["data_cache_settings"]["compile_blame_reports"] = True
+        report_path = Path(str(vara_cfg()["result_dir"])) / "xz" / (
+            "BRE-BR-xz-xz-2f0bc9cd40_"
+            "9e238675-ee7c-4325-8e9f-8ccf6fd3f05c_success.yaml"
+        )
+
+        with mock.patch("yaml.load_all", wraps=yaml.load_all) as load_all:
+            yaml_report = BlameReport(report_path)
+            compiled_report = BlameReport(report_path)
+            load_all.assert_called_once()
+
+        self.assertEqual(
+            yaml_report.meta_data.num_functions,
+            compiled_report.meta_data.num_functions
+        )
+        self.assertEqual(
+            yaml_report.blame_taint_scope, compiled_report.blame_taint_scope
+        )
+        self.assertEqual([
+            func_entry.name for func_entry in yaml_report.function_entries
+        ], [func_entry.name for func_entry in compiled_report.function_entries])
+        for func_entry in yaml_report.function_entries:
+            compiled_func_entry = compiled_report.get_blame_result_function_entry(
+                func_entry.name
+            )
+            self.assertEqual(
+                func_entry.demangled_name, compiled_func_entry.demangled_name
+            )
+            self.assertEqual(
+                func_entry.file_name, compiled_func_entry.file_name
+            )
+            self.assertEqual(func_entry.commits, compiled_func_entry.commits)
+            self.assertEqual(
+                func_entry.interactions, compiled_func_entry.interactions
+            )
+            self.assertEqual([
+                inter.amount for inter in func_entry.interactions
+            ], [inter.amount for inter in compiled_func_entry.interactions])
+
+        # modifying the report invalidates the compiled report
+        report_path.touch()
+        with mock.patch("yaml.load_all", wraps=yaml.load_all) as load_all:
+            BlameReport(report_path)
+            load_all.assert_called_once()
+
+
 class TestBlameReportWithRepoData(unittest.TestCase):
     """Test if a blame report, containing repo data , is correctly reconstructed
     from yaml."""
@@ -869,6 +928,20 @@ class TestBlameReportDiff(unittest.TestCase):
         )
         self.assertEqual(changed_func.interactions[0].amount, -3)
 
+    def test_diff_shares_unchanged_entries(self) -> None:
+        """Checks that entries only present in one report are shared and not
+        copied."""
+        diff = BlameReportDiff(self.reports[1], self.reports[0])
+        self.assertIs(
+            diff.get_blame_result_function_entry('_Z7doStuffdd'),
+            self.reports[1].get_blame_result_function_entry('_Z7doStuffdd')
+        )
+        self.assertRaises(
+            KeyError, diff.get_blame_result_function_entry,
+            'adjust_assignment_expression'
+        )
+        self.assertEqual(len(diff.function_entries), 3)
+
     def test_function_not_in_diff(self) -> None:
         """Checks that only functions that changed are in the diff."""
         # Report 2
@@ -916,6 +989,35 @@ class TestBlameReportHelperFunctions(unittest.TestCase):
         self.assertEqual(degree_tuples[0], (1, 24))
         self.assertEqual(degree_tuples[1], (2, 7))
 
+    def test_generate_blame_metrics(self) -> None:
+        """Test if all metrics are generated in a single pass."""
+        day = 24 * 60 * 60
+        metadata = {
+            "48f8ed5347aeb9d54e7ea041b1f8d67ffe74db33":
+                CommitMetadata("A", "a@a.com", 10 * day, ()),
+            "a387695a1a2e52dcb1c5b21e73d2fd5a6aadbaf9":
+                CommitMetadata("B", "b@b.com", 7 * day, ()),
+            "e8999a84efbd9c3e739bff7af39500d14e61bfbc":
+                CommitMetadata("B", "b@b.com", 11 * day, ()),
+        }
+
+        metrics = generate_blame_metrics(
+            self.reports[0], lambda crp: metadata[crp.commit_hash.hash], 1, 1
+        )
+
+        self.assertEqual(metrics.num_interactions, 31)
+        self.assertEqual(metrics.num_interacting_commits, 2)
+        self.assertEqual(metrics.num_interacting_authors, 1)
+        self.assertEqual(dict(metrics.degree_tuples), {1: 24, 2: 7})
+        self.assertEqual(dict(metrics.author_degree_tuples), {1: 31})
+        self.assertEqual(
+            dict(metrics.avg_time_distribution_tuples), {
+                3: 24,
+                2: 7
+            }
+        )
+        self.assertEqual(dict(metrics.max_time_distribution_tuples), {3: 31})
+
     def test_generate_lib_dependent_degrees(self) -> None:
         """Test if degree tuples per library generation works."""
 
@@ -1,13 +1,17 @@
 """Test the cache_helper module."""
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import pandas as pd
 
 from tests.helper_utils import run_in_test_environment
 from varats.data.cache_helper import (
     build_cached_report_table,
+    cache_dataframe,
+    CSVCacheBackend,
     get_data_file_path,
+    load_cached_df_or_none,
 )
 from varats.utils.settings import vara_cfg
 
@@ -30,6 +34,62 @@ class TestCacheHelper(unittest.TestCase):
             str(vara_cfg()["data_cache"]) + "/foo-tmux.csv.gz", str(path)
         )
 
+    @run_in_test_environment()
+    def test_get_data_file_path_parquet(self):
+        vara_cfg()["data_cache_settings"]["format"] = "parquet"
+        path = get_data_file_path("foo", "tmux")
+        self.assertEqual(
+            str(vara_cfg()["data_cache"]) + "/foo-tmux.parquet", str(path)
+        )
+
+    @run_in_test_environment()
+    def test_unknown_cache_format(self):
+        vara_cfg()["data_cache_settings"]["format"] = "foo"
+        self.assertRaises(ValueError, get_data_file_path, "foo", "tmux")
+
+    @run_in_test_environment()
+    def test_columnar_cache_roundtrip(self):
+        """Check whether columnar backends preserve types and load only the
+        selected columns."""
+        data_types = {"a": "int32", "b": "str"}
+        dataframe = pd.DataFrame({
+            "a": [1, 2],
+            "b": ["x", "y"]
+        }).astype(data_types)
+
+        for cache_format in ["parquet", "feather"]:
+            vara_cfg()["data_cache_settings"]["format"] = cache_format
+            cache_dataframe("roundtrip", "project", dataframe)
+
+            loaded_df = load_cached_df_or_none(
+                "roundtrip", "project", data_types
+            )
+            self.assertIsNotNone(loaded_df)
+            pd.testing.assert_frame_equal(dataframe, loaded_df)
+
+            loaded_df = load_cached_df_or_none(
+                "roundtrip", "project", data_types, ["a"]
+            )
+            self.assertEqual(["a"], list(loaded_df.columns))
+            self.assertEqual("int32", loaded_df["a"].dtype)
+
+    @run_in_test_environment()
+    def test_cache_format_migration(self):
+        """Check whether existing csv cache files are converted to the
+        selected format."""
+        data_types = {"a": "int64"}
+        dataframe = pd.DataFrame({"a": [1, 2]})
+        cache_dataframe("migration", "project", dataframe)
+        csv_path = get_data_file_path("migration", "project")
+        self.assertTrue(csv_path.exists())
+
+        vara_cfg()["data_cache_settings"]["format"] = "parquet"
+        loaded_df = load_cached_df_or_none("migration", "project", data_types)
+
+        self.assertFalse(csv_path.exists())
+        self.assertTrue(get_data_file_path("migration", "project").exists())
+        self.assertEqual([1, 2], list(loaded_df["a"]))
+
     @run_in_test_environment()
     def test_build_cached_report_table(self):
         """Check whether data items are correctly cached and updated/evicted."""
@@ -86,3 +146,169 @@ class TestCacheHelper(unittest.TestCase):
         self.assertNotIn("a2", df["entry"].values)
         self.assertIn("b", df["entry"].values)
         self.assertIn("c2", df["entry"].values)
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_columns(self):
+        """Check whether only the selected columns are returned."""
+        vara_cfg()["data_cache_settings"]["format"] = "parquet"
+
+        def create_empty_df():
+            return pd.DataFrame(columns=["entry", "value"])
+
+        def create_cache_entry_data(entry: str):
+            return pd.DataFrame({
+                "entry": entry,
+                "value": self.TEST_DATA[entry][1]
+            },
+                                index=[0]), self.TEST_DATA[entry][0], str(
+                                    self.TEST_DATA[entry][1]
+                                )
+
+        def build_table(data_to_load):
+            return build_cached_report_table(
+                "cache_test_data", "project", data_to_load, [], create_empty_df,
+                create_cache_entry_data, lambda entry: self.TEST_DATA[entry][0],
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda ts1, ts2: int(ts1) > int(ts2), ["entry"]
+            )
+
+        df = build_table(["a", "b"])
+        self.assertEqual(["entry"], list(df.columns))
+        self.assertEqual(["a", "b"], list(df["entry"]))
+
+        # unchanged cache
+        df = build_table(["a", "b"])
+        self.assertEqual(["entry"], list(df.columns))
+        self.assertEqual(["a", "b"], list(df["entry"]))
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_columns_csv(self):
+        """Check whether csv caches are parsed only once when columns are
+        selected."""
+        data_types = {"a": "int64", "b": "str"}
+        cache_dataframe(
+            "columns", "project", pd.DataFrame({
+                "a": [1, 2],
+                "b": ["x", "y"]
+            })
+        )
+        loaded_df = load_cached_df_or_none(
+            "columns", "project", data_types, ["b"]
+        )
+        self.assertEqual(["b"], list(loaded_df.columns))
+        self.assertEqual(["x", "y"], list(loaded_df["b"]))
+
+        def build_table():
+            return build_cached_report_table(
+                "cache_test_data", "project", ["a", "b"], [],
+                lambda: pd.DataFrame(columns=["entry"]), lambda entry: (
+                    pd.DataFrame({"entry": entry}, index=[0]), self.TEST_DATA[
+                        entry][0], str(self.TEST_DATA[entry][1])
+                ), lambda entry: self.TEST_DATA[entry][0],
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda ts1, ts2: int(ts1) > int(ts2), ["entry"]
+            )
+
+        build_table()
+        with mock.patch.object(
+            CSVCacheBackend, "read", wraps=CSVCacheBackend.read
+        ) as read_mock:
+            df = build_table()
+        self.assertEqual(["entry"], list(df.columns))
+        self.assertEqual(["a", "b"], list(df["entry"]))
+        self.assertEqual(1, read_mock.call_count)
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_incremental(self):
+        """Check whether updates are appended as segments and compacted."""
+        data_id = "cache_test_data"
+        project_name = "project"
+        vara_cfg()["data_cache_settings"]["max_segments"] = 2
+        cache_dir = Path(str(vara_cfg()["data_cache"]))
+
+        def cache_files():
+            return sorted(
+                path.name
+                for path in cache_dir.glob(f"{data_id}-{project_name}*")
+            )
+
+        def build_table(data_to_load, data_to_drop):
+            return build_cached_report_table(
+                data_id, project_name, data_to_load, data_to_drop,
+                lambda: pd.DataFrame(columns=["entry"]), lambda entry: (
+                    pd.DataFrame({"entry": entry}, index=[0]), self.TEST_DATA[
+                        entry][0], str(self.TEST_DATA[entry][1])
+                ), lambda entry: self.TEST_DATA[entry][0],
+                lambda entry: str(self.TEST_DATA[entry][1]),
+                lambda ts1, ts2: int(ts1) > int(ts2)
+            )
+
+        build_table(["a"], [])
+        self.assertEqual([f"{data_id}-{project_name}.csv.gz"], cache_files())
+
+        # unchanged cache is not written again
+        cache_file = get_data_file_path(data_id, project_name)
+        mtime = cache_file.stat().st_mtime_ns
+        build_table(["a"], [])
+        self.assertEqual(mtime, cache_file.stat().st_mtime_ns)
+
+        # new and updated entries are appended as segments
+        df = build_table(["a", "b"], [])
+        self.assertEqual(["a", "b"], sorted(df["entry"]))
+        df = build_table(["a2", "b"], [])
+        self.assertEqual(["a2", "b"], sorted(df["entry"]))
+        self.assertEqual([
+            f"{data_id}-{project_name}.1.csv.gz",
+            f"{data_id}-{project_name}.2.csv.gz",
+            f"{data_id}-{project_name}.csv.gz"
+        ], cache_files())
+        self.assertEqual(["a2", "b"],
+                         sorted(
+                             load_cached_df_or_none(
+                                 data_id, project_name, {"entry": "str"}
+                             )["entry"]
+                         ))
+
+        # too many segments are compacted
+        df = build_table(["c"], [])
+        self.assertEqual(["a2", "b", "c"], sorted(df["entry"]))
+        self.assertEqual([f"{data_id}-{project_name}.csv.gz"], cache_files())
+
+        # dropping entries rewrites the cache file
+        build_table(["a"], [])
+        df = build_table([], ["c2"])
+        self.assertEqual(["a2", "b"], sorted(df["entry"]))
+        self.assertEqual([f"{data_id}-{project_name}.csv.gz"], cache_files())
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_parallel(self):
+        """Check whether entries are created in order by multiple processes and
+        failing entries are skipped."""
+        self.__check_failing_entries_skipped(2)
+
+    @run_in_test_environment()
+    def test_build_cached_report_table_sequential_failure(self):
+        """Check whether failing entries are skipped when entries are created
+        sequentially."""
+        self.__check_failing_entries_skipped(1)
+
+    def __check_failing_entries_skipped(self, jobs: int) -> None:
+        vara_cfg()["data_cache_settings"]["jobs"] = jobs
+
+        def create_cache_entry_data(entry: str):
+            if entry == "b":
+                raise ValueError("broken report")
+            return pd.DataFrame({"entry": entry},
+                                index=[0]), self.TEST_DATA[entry][0], str(
+                                    self.TEST_DATA[entry][1]
+                                )
+
+        df = build_cached_report_table(
+            "cache_test_data", "project", ["a", "b", "c"], [],
+            lambda: pd.DataFrame(columns=["entry"]), create_cache_entry_data,
+            lambda entry: self.TEST_DATA[entry][0],
+            lambda entry: str(self.TEST_DATA[entry][1]),
+            lambda ts1, ts2: int(ts1) > int(ts2)
+        )
+
+        self.assertEqual(["a", "c"], list(df["entry"]))
@@ -6,7 +6,6 @@ import unittest.mock as mock
 from pathlib import Path
 
 import yaml
-from pygtrie import CharTrie
 
 from varats.data.reports.commit_report import (
     CommitReport,
@@ -15,7 +14,7 @@ from varats.data.reports.commit_report import (
     RegionMapping,
     generate_interactions,
 )
-from varats.mapping.commit_map import CommitMap
+from varats.mapping.commit_map import CommitMap, CommitMapIndex
 from varats.project.project_util import get_local_project_repo
 from varats.projects.discover_projects import initialize_projects
 from varats.report.report import FileStatusExtension, ReportFilename
@@ -443,12 +442,12 @@ ef58a957a6c1887930cc70d6199ae7e48aa8d716"""
 class MockCommitMap(CommitMap):
 
     def __init__(self, stream: tp.Iterable[str]) -> None:
-        self._hash_to_id: CharTrie = CharTrie()
-        self._hash_to_id_master: CharTrie = CharTrie()
+        items = []
         for line in stream:
             slices = line.strip().split(', ')
-            self._hash_to_id[slices[1]] = int(slices[0])
-            self._hash_to_id_master[slices[1]] = int(slices[0])
+            items.append((slices[1], int(slices[0])))
+        self._hash_to_id = CommitMapIndex.from_items(items)
+        self._hash_to_id_master = CommitMapIndex.from_items(items)
 
 
 def testing_gen_mock_commit_map() -> CommitMap:
@@ -0,0 +1,110 @@
+"""Test the DataManager cache."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from varats.data.data_manager import (
+    DataManager,
+    sampled_file_key,
+    stat_file_key,
+)
+from varats.report.report import BaseReport
+
+
+class TestDataManager(unittest.TestCase):
+    """Test if the DataManager caches and evicts loaded files."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.files = []
+        for num in range(3):
+            file_path = Path(self.tmp_dir.name) / f"file_{num}.txt"
+            file_path.write_text("x" * 10 * (num + 1))
+            self.files.append(file_path)
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_cache_hit(self) -> None:
+        """Check whether loading a file twice returns the cached object."""
+        data_manager = DataManager(max_entries=0, max_bytes=0)
+        first = data_manager.load_data_class_sync(self.files[0], BaseReport)
+        second = data_manager.load_data_class_sync(self.files[0], BaseReport)
+
+        self.assertIs(first, second)
+        self.assertEqual(1, data_manager.statistics.hits)
+        self.assertEqual(1, data_manager.statistics.misses)
+        self.assertEqual(10, data_manager.cached_bytes)
+
+    def test_evict_least_recently_used_entry(self) -> None:
+        """Check whether the least recently used entry is evicted if the
+        maximum number of entries is exceeded."""
+        data_manager = DataManager(max_entries=2, max_bytes=0)
+        first = data_manager.load_data_class_sync(self.files[0], BaseReport)
+        data_manager.load_data_class_sync(self.files[1], BaseReport)
+        data_manager.load_data_class_sync(self.files[0], BaseReport)
+        data_manager.load_data_class_sync(self.files[2], BaseReport)
+
+        self.assertEqual(2, len(data_manager.file_map))
+        self.assertEqual(1, data_manager.statistics.evictions)
+        self.assertIs(
+            first, data_manager.load_data_class_sync(self.files[0], BaseReport)
+        )
+
+    def test_evict_by_size(self) -> None:
+        """Check whether entries are evicted if the maximum size is
+        exceeded."""
+        data_manager = DataManager(max_entries=0, max_bytes=35)
+        data_manager.load_data_class_sync(self.files[0], BaseReport)
+        data_manager.load_data_class_sync(self.files[1], BaseReport)
+        data_manager.load_data_class_sync(self.files[2], BaseReport)
+
+        self.assertEqual(1, len(data_manager.file_map))
+        self.assertEqual(30, data_manager.cached_bytes)
+        self.assertEqual(2, data_manager.statistics.evictions)
+
+    def test_explicit_eviction(self) -> None:
+        """Check whether entries can be evicted and cleared explicitly."""
+        data_manager = DataManager(max_entries=0, max_bytes=0)
+        data_manager.load_data_class_sync(self.files[0], BaseReport)
+        data_manager.load_data_class_sync(self.files[1], BaseReport)
+
+        self.assertTrue(data_manager.evict(self.files[0]))
+        self.assertFalse(data_manager.evict(self.files[0]))
+        self.assertEqual(1, len(data_manager.file_map))
+        self.assertEqual(20, data_manager.cached_bytes)
+
+        data_manager.clear()
+        self.assertEqual(0, len(data_manager.file_map))
+        self.assertEqual(0, data_manager.cached_bytes)
+
+    def test_modified_file_is_reloaded(self) -> None:
+        """Check whether a modified file is loaded again and replaces the old
+        version in the cache."""
+        for key_mode in ["stat", "sampled", "sha256"]:
+            self.files[0].write_text("x" * 10)
+            data_manager = DataManager(
+                max_entries=0, max_bytes=0, key_mode=key_mode
+            )
+            first = data_manager.load_data_class_sync(self.files[0], BaseReport)
+            self.files[0].write_text("y" * 5)
+            second = data_manager.load_data_class_sync(
+                self.files[0], BaseReport
+            )
+
+            self.assertIsNot(first, second)
+            self.assertEqual(1, len(data_manager.file_map))
+            self.assertEqual(5, data_manager.cached_bytes)
+
+    def test_sampled_file_key(self) -> None:
+        """Check whether sampled keys only read parts of large files."""
+        large_file = Path(self.tmp_dir.name) / "large_file.txt"
+        large_file.write_bytes(bytes(1024 * 1024))
+        key = sampled_file_key(large_file, block_size=16, num_blocks=4)
+
+        self.assertEqual(key, sampled_file_key(large_file, 16, 4))
+        self.assertTrue(key.startswith(stat_file_key(large_file)))
+
+    def test_unknown_key_mode(self) -> None:
+        data_manager = DataManager(key_mode="foo")
+        self.assertRaises(ValueError, data_manager.compute_key, self.files[0])
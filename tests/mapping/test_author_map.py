@@ -1,7 +1,14 @@
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+
+from plumbum import local
 
 from varats.mapping.author_map import generate_author_map, Author, AuthorMap
 from varats.projects.discover_projects import initialize_projects
+from varats.utils.git_util import RepositoryHandle
+from varats.utils.settings import vara_cfg
 
 
 class TestAuthor(unittest.TestCase):
@@ -94,6 +101,70 @@ class TestAuthorMap(unittest.TestCase):
             {"jon_doe@jon_doe.com", "jon.d@gmail.com"}
         )
 
+    def test_author_merging_transitive(self) -> None:
+        amap = AuthorMap()
+        amap.add_entry("A", "a@a.com")
+        amap.add_entry("B", "b@b.com")
+        amap.add_entry("C", "c@c.com")
+        amap.add_entry("C", "b@b.com")
+        self.assertEqual(len(amap.authors), 2)
+        amap.add_entry("A", "c@c.com")
+        self.assertEqual(len(amap.authors), 1)
+        merged_author = amap.get_author("B", "a@a.com")
+        self.assertEqual(merged_author.author_id, 0)
+        self.assertEqual(merged_author.names, {"A", "B", "C"})
+        self.assertEqual(
+            merged_author.mail_addresses, {"a@a.com", "b@b.com", "c@c.com"}
+        )
+        self.assertIs(amap.get_author_by_email("c@c.com"), merged_author)
+
+    def test_generate_persisted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_data_cache = vara_cfg()["data_cache"].value
+            vara_cfg()["data_cache"] = str(Path(tmp_dir) / "cache")
+
+            repo_path = Path(tmp_dir) / "repo"
+            repo_path.mkdir()
+            git = local["git"]["-C", str(repo_path)]
+            git("init", "-q", "-b", "main")
+            for idx, (name, mail) in enumerate([("Jon Doe", "jd@doe.com"),
+                                                ("JD", "jd@doe.com")]):
+                git(
+                    "-c", f"user.name={name}", "-c", f"user.email={mail}",
+                    "commit", "-q", "--allow-empty", "-m", str(idx)
+                )
+            repo = RepositoryHandle(repo_path)
+
+            try:
+                with mock.patch(
+                    "varats.mapping.author_map.get_local_project_repo",
+                    return_value=repo
+                ):
+                    amap = generate_author_map("test")
+                    self.assertEqual(
+                        amap.get_author("JD", "jd@doe.com").names,
+                        {"Jon Doe", "JD"}
+                    )
+                    self.assertEqual(
+                        len(
+                            list((Path(tmp_dir) / "cache" /
+                                  "author_maps").iterdir())
+                        ), 1
+                    )
+
+                    with mock.patch.object(
+                        RepositoryHandle, "__call__"
+                    ) as git_call:
+                        persisted_amap = generate_author_map("test")
+                        git_call.assert_not_called()
+                    self.assertEqual(
+                        persisted_amap.get_author("Jon Doe",
+                                                  "jd@doe.com").names,
+                        {"Jon Doe", "JD"}
+                    )
+            finally:
+                vara_cfg()["data_cache"] = old_data_cache
+
     def test_author_merging_generate(self) -> None:
         initialize_projects()
         amap = generate_author_map("brotli")
@@ -0,0 +1,118 @@
+"""Test commit maps."""
+import tempfile
+import unittest
+from pathlib import Path
+
+from plumbum import local
+
+from varats.mapping.commit_map import CommitMap, CommitMapIndex
+from varats.utils.git_util import RepositoryHandle
+
+HASHES = [
+    "b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a",
+    "9872ba420c99323195e96cafe56ff247c3011ad5",
+    "1e7e3769dc4efd55249c475470152acbcf804bb3",
+    "e75f428c0ddc90a7011cfda82a7114a16c537e34",
+    "1e7e0000c99323195e96cafe56ff247c3011ad55",
+]
+
+
+class TestCommitMapIndex(unittest.TestCase):
+    """Test the lookups of the commit map index."""
+
+    index: CommitMapIndex
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # time ID 2 is not part of the map
+        cls.index = CommitMapIndex.from_items([(HASHES[0], 0), (HASHES[1], 1),
+                                               (HASHES[2], 3), (HASHES[3], 4),
+                                               (HASHES[4], 5)])
+
+    def test_time_id(self) -> None:
+        """Test the lookup of time IDs."""
+        self.assertEqual(self.index[HASHES[2]], 3)
+        self.assertEqual(self.index[HASHES[4]], 5)
+        with self.assertRaises(KeyError):
+            _ = self.index["1e7e3769dc4efd55249c475470152acbcf804bb4"]
+
+    def test_c_hash(self) -> None:
+        """Test the lookup of commit hashes."""
+        self.assertEqual(self.index.c_hash(1), HASHES[1])
+        self.assertEqual(self.index.c_hash(5), HASHES[4])
+        with self.assertRaises(KeyError):
+            self.index.c_hash(2)
+        with self.assertRaises(KeyError):
+            self.index.c_hash(6)
+
+    def test_complete(self) -> None:
+        """Test the completion of short commit hashes."""
+        self.assertEqual(self.index.complete("9872"), [HASHES[1]])
+        self.assertEqual(
+            set(self.index.complete("1e7e")), {HASHES[2], HASHES[4]}
+        )
+        self.assertEqual(self.index.complete("abc"), [])
+
+    def test_items_in_time_order(self) -> None:
+        """Test if the mapping items are ordered by time ID."""
+        self.assertEqual([time_id for _, time_id in self.index.items()],
+                         [0, 1, 3, 4, 5])
+        self.assertEqual(len(self.index), 5)
+        self.assertEqual(len(self.index.items()), 5)
+        self.assertIn((HASHES[2], 3), self.index.items())
+        self.assertNotIn((HASHES[2], 2), self.index.items())
+        self.assertEqual(
+            list(self.index.items()),
+            [(c_hash, self.index[c_hash]) for c_hash in self.index]
+        )
+
+    def test_store_and_load(self) -> None:
+        """Test if a stored index is loaded correctly."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_path = Path(tmp_dir) / "index"
+            self.index.store(index_path)
+            loaded_index = CommitMapIndex.load(index_path)
+
+            self.assertEqual(
+                dict(loaded_index.items()), dict(self.index.items())
+            )
+            self.assertEqual(loaded_index.c_hash(4), HASHES[3])
+            self.assertEqual(loaded_index.complete("e75f"), [HASHES[3]])
+
+
+class TestCommitMapGeneration(unittest.TestCase):
+    """Test the generation of commit maps from a local repository."""
+
+    def test_generate_without_checkout(self) -> None:
+        """Test if the map follows the refspec without changing HEAD."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            git = local["git"]["-C", tmp_dir]
+            git("init", "-q", "-b", "main")
+            git("config", "user.name", "Test")
+            git("config", "user.email", "test@test.com")
+            for commit in range(3):
+                git("commit", "-q", "--allow-empty", "-m", f"c{commit}")
+            git("checkout", "-q", "-b", "other", "HEAD~1")
+            git("commit", "-q", "--allow-empty", "-m", "other")
+            git("checkout", "-q", "main")
+
+            repo = RepositoryHandle(Path(tmp_dir))
+            main_head = git("rev-parse", "main").strip()
+            other_head = git("rev-parse", "other").strip()
+
+            cmap = CommitMap(repo, refspec="other")
+            hash_to_id = cmap.generate_hash_to_id(master=True)
+
+            self.assertEqual(len(hash_to_id), 3)
+            self.assertIn(other_head, hash_to_id)
+            self.assertNotIn(main_head, hash_to_id)
+            self.assertEqual(git("rev-parse", "HEAD").strip(), main_head)
+
+            all_hash_to_id = cmap.generate_hash_to_id()
+            self.assertEqual(len(all_hash_to_id), 4)
+            self.assertEqual(set(all_hash_to_id.values()), {0, 1, 2, 3})
+            for parent_head in ("main~1", "main~2"):
+                self.assertLess(
+                    all_hash_to_id[git("rev-parse", parent_head).strip()],
+                    all_hash_to_id[main_head]
+                )
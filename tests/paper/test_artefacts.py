@@ -2,7 +2,10 @@
 import typing as tp
 import unittest
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+from unittest import mock
+
+from rich.progress import Progress
 
 from tests.helper_utils import run_in_test_environment, UnitTestFixtures
 from varats.experiments.base.just_compile import JustCompileReport
@@ -16,6 +19,8 @@ from varats.paper_mgmt.artefacts import (
     initialize_artefact_types,
     Artefacts,
     Artefact,
+    generate_artefacts,
+    get_artefact_fingerprint,
     load_artefacts_from_file,
     load_artefacts,
 )
@@ -126,6 +131,81 @@ class TestArtefacts(unittest.TestCase):
             "paper_config_overview_plot.png", file_infos[0].file_name
         )
 
+    def test_artefact_parts_share_plots(self) -> None:
+        """Check if all parts of a plot artefact are generated from a single
+        call to the plot generator."""
+        plots = [mock.MagicMock(), mock.MagicMock()]
+        with TemporaryDirectory() as tmp_dir, mock.patch.object(
+            PaperConfigOverviewGenerator, "generate", return_value=plots
+        ) as generate_mock:
+            self.plot_artefact.common_options.plot_base_dir = Path(tmp_dir)
+            self.assertEqual(2, self.plot_artefact.get_num_artefact_parts())
+            for part in range(2):
+                self.plot_artefact.generate_artefact_part(part)
+
+        generate_mock.assert_called_once()
+        for plot in plots:
+            plot.save.assert_called_once()
+
+    def test_artefact_file_infos_share_plots(self) -> None:
+        """Check if file infos and generating a plot artefact share a single
+        call to the plot generator."""
+        plots = [mock.MagicMock(), mock.MagicMock()]
+        with TemporaryDirectory() as tmp_dir, mock.patch.object(
+            PaperConfigOverviewGenerator, "generate", return_value=plots
+        ) as generate_mock:
+            self.plot_artefact.common_options.plot_base_dir = Path(tmp_dir)
+            self.assertEqual(
+                2, len(self.plot_artefact.get_artefact_file_infos())
+            )
+            self.plot_artefact.generate_artefact()
+
+        generate_mock.assert_called_once()
+        for plot in plots:
+            plot.save.assert_called_once()
+
+    @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
+    def test_artefact_fingerprint_result_digests(self) -> None:
+        """Check if result files are only fingerprinted as they were when the
+        given result digests were computed."""
+        vara_cfg()['paper_config']['current_config'] = "test_artefacts_driver"
+        load_paper_config()
+
+        project_result_digests: tp.Dict[str, str] = {}
+        fingerprint = get_artefact_fingerprint(
+            self.plot_artefact, None, project_result_digests
+        )
+        self.assertIn("xz", project_result_digests)
+
+        result_dir = Path(str(vara_cfg()["result_dir"])) / "xz"
+        result_dir.mkdir(parents=True, exist_ok=True)
+        (result_dir / "new_result.txt").write_text("new result")
+
+        self.assertEqual(
+            fingerprint,
+            get_artefact_fingerprint(
+                self.plot_artefact, None, project_result_digests
+            )
+        )
+        self.assertNotEqual(
+            fingerprint, get_artefact_fingerprint(self.plot_artefact)
+        )
+
+    def test_generate_artefacts_sequential_failure(self) -> None:
+        """Check if a failing artefact is reported without aborting the
+        generation of the other artefacts."""
+        artefacts = [mock.MagicMock(), mock.MagicMock(), mock.MagicMock()]
+        for idx, artefact in enumerate(artefacts):
+            artefact.name = f"artefact_{idx}"
+        artefacts[1].generate_artefact.side_effect = ValueError("broken")
+
+        with Progress(disable=True) as progress:
+            failed_artefacts = generate_artefacts(artefacts, progress, 1)
+
+        self.assertEqual(["artefact_1"], failed_artefacts)
+        for artefact in artefacts:
+            artefact.generate_artefact.assert_called_once()
+
     @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
     def test_cli_option_converter(self) -> None:
         """Test whether CLI option conversion works correctly."""
@@ -10,7 +10,6 @@ from tempfile import NamedTemporaryFile
 
 from benchbuild.source import nosource
 from benchbuild.utils.revision_ranges import block_revisions, SingleRevision
-from pygtrie import CharTrie
 
 import varats.paper_mgmt.paper_config_manager as PCM
 from tests.helper_utils import DummyGit
@@ -19,7 +18,7 @@ from tests.utils.test_experiment_util import (
     MockExperiment,
     MockExperimentMultiReport,
 )
-from varats.mapping.commit_map import CommitMap
+from varats.mapping.commit_map import CommitMap, CommitMapIndex
 from varats.paper.case_study import load_case_study_from_file, CaseStudy
 from varats.projects.c_projects.gzip import Gzip
 from varats.report.report import FileStatusExtension
@@ -40,12 +39,12 @@ b8b25e7f1593f6dcc20660ff9fb1ed59ede15b7a"""
 class MockCommitMap(CommitMap):
 
     def __init__(self, stream: tp.Iterable[str]) -> None:
-        self._hash_to_id: CharTrie = CharTrie()
-        self._hash_to_id_master: CharTrie = CharTrie()
+        items = []
         for line in stream:
             slices = line.strip().split(', ')
-            self._hash_to_id[slices[1]] = int(slices[0])
-            self._hash_to_id_master[slices[1]] = int(slices[0])
+            items.append((slices[1], int(slices[0])))
+        self._hash_to_id = CommitMapIndex.from_items(items)
+        self._hash_to_id_master = CommitMapIndex.from_items(items)
 
 
 def mocked_get_commit_map(
@@ -2,12 +2,17 @@
 
 import tempfile
 import unittest
+from unittest import mock
 from pathlib import Path
 
 import numpy as np
 
 from varats.experiment.experiment_util import ZippedReportFolder
-from varats.report.gnu_time_report import TimeReportAggregate
+from varats.report.gnu_time_report import (
+    TimeReport,
+    TimeReportAggregate,
+    WLTimeReportAggregate,
+)
 
 GNU_TIME_OUTPUT1 = """	Command being timed: "sleep 2"
 	User time (seconds): 0.00
@@ -90,3 +95,33 @@ class TestTimeReportAggregate(unittest.TestCase):
                 np.std(time_aggregate.measurements_wall_clock_time)
             )
             self.assertEqual(mean_std, (3.0, 1.0))
+
+
+class TestWLTimeReportAggregate(unittest.TestCase):
+    """Test if workload specific time reports are parsed lazily."""
+
+    def test_reports_are_parsed_per_workload(self) -> None:
+        """Test that only reports of the accessed workload are parsed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file = Path(tmp_dir) / "WLTimeAggregateTest.zip"
+            with ZippedReportFolder(tmp_file) as time_reports_dir:
+                for workload in ["fast", "slow"]:
+                    for i in range(2):
+                        (
+                            Path(time_reports_dir) /
+                            f"time_report_{workload}_{i}.txt"
+                        ).write_text(GNU_TIME_OUTPUT1)
+
+            with mock.patch(
+                "varats.report.gnu_time_report.TimeReport", wraps=TimeReport
+            ) as time_report_mock:
+                time_aggregate = WLTimeReportAggregate(tmp_file)
+                self.assertEqual({"fast", "slow"},
+                                 set(time_aggregate.workload_names()))
+                self.assertEqual(0, time_report_mock.call_count)
+
+                self.assertEqual([
+                    2.0, 2.0
+                ], time_aggregate.measurements_wall_clock_time("fast"))
+                time_aggregate.reports("fast")
+                self.assertEqual(2, time_report_mock.call_count)
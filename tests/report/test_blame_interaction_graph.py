@@ -1,12 +1,17 @@
 """Test blame interaction graphs."""
 
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 
 import pytest
+from plumbum import local
 
 from tests.helper_utils import run_in_test_environment, UnitTestFixtures
 from varats.data.reports.blame_interaction_graph import (
     create_blame_interaction_graph,
+    _blame_file_commits,
     create_file_based_interaction_graph,
     get_author_data,
 )
@@ -19,6 +24,7 @@ from varats.paper_mgmt.case_study import (
     newest_processed_revision_for_case_study,
 )
 from varats.projects.discover_projects import initialize_projects
+from varats.utils.git_util import FullCommitHash, RepositoryHandle
 from varats.utils.settings import vara_cfg
 
 
@@ -115,3 +121,67 @@ class TestBlameInteractionGraphs(unittest.TestCase):
         self.assertEqual(author_data["neighbors"], set())
         self.assertEqual(0, len(author_data["in_attrs"]))
         self.assertEqual(0, len(author_data["out_attrs"]))
+
+    def test_file_based_interaction_graph_local_repo(self) -> None:
+        """Test file-based interaction graphs of a local repository and that
+        unchanged files are not blamed again for later revisions."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_data_cache = vara_cfg()["data_cache"].value
+            vara_cfg()["data_cache"] = str(Path(tmp_dir) / "cache")
+            Path(tmp_dir, "cache").mkdir()
+
+            repo_path = Path(tmp_dir) / "repo"
+            repo_path.mkdir()
+            git = local["git"]["-C", str(repo_path)]
+            git("init", "-q", "-b", "main")
+            git("config", "user.name", "Test")
+            git("config", "user.email", "test@test.com")
+
+            def commit(file_name: str, content: str) -> str:
+                with open(repo_path / file_name, "a") as file:
+                    file.write(content)
+                git("add", "-A")
+                git("commit", "-q", "-m", file_name)
+                return str(git("rev-parse", "HEAD").strip())
+
+            commit_a = commit("a.c", "int a;\n")
+            commit_b = commit("a.c", "int b;\n")
+            commit_c = commit("b.c", "int c;\n")
+            commit("README", "readme\n")
+            first_head = commit("b.c", "\n")
+            commit_d = commit("b.c", "int d;\n")
+
+            repo = RepositoryHandle(repo_path)
+            try:
+                with mock.patch(
+                    "varats.data.reports.blame_interaction_graph."
+                    "get_local_project_repo",
+                    return_value=repo
+                ), mock.patch(
+                    "varats.data.reports.blame_interaction_graph."
+                    "get_local_project_repos",
+                    return_value={"repo": repo}
+                ):
+                    cig = create_file_based_interaction_graph(
+                        "repo", FullCommitHash(first_head)
+                    ).commit_interaction_graph()
+                    self.assertEqual({commit_a, commit_b, commit_c}, {
+                        node.commit_hash.hash for node in cig.nodes
+                    })
+                    self.assertEqual(2, len(cig.edges))
+
+                    with mock.patch(
+                        "varats.data.reports.blame_interaction_graph."
+                        "_blame_file_commits",
+                        wraps=_blame_file_commits
+                    ) as blame_file:
+                        cig = create_file_based_interaction_graph(
+                            "repo", FullCommitHash(commit_d)
+                        ).commit_interaction_graph()
+                        blame_file.assert_called_once_with(
+                            repo, commit_d, "b.c"
+                        )
+                    self.assertEqual(4, len(cig.nodes))
+                    self.assertEqual(4, len(cig.edges))
+            finally:
+                vara_cfg()["data_cache"] = old_data_cache
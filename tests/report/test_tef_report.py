@@ -5,7 +5,12 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from varats.report.tef_report import TEFReport, TraceEvent, TraceEventType
+from varats.report.tef_report import (
+    TEFReport,
+    TraceEvent,
+    TraceEventType,
+    iter_trace_events,
+)
 
 TRACE_EVENT_FORMAT_OUTPUT = """{
     "traceEvents": [{
@@ -231,8 +236,113 @@ class TestTEFReportParser(unittest.TestCase):
 
         self.assertEqual(self.report.trace_events[0].name, "Base")
 
+    def test_parse_trace_event_columns(self) -> None:
+        """Test if the columnar view matches the listed trace events."""
+        columns = self.report.trace_event_columns
+
+        self.assertEqual(len(columns), 8)
+        self.assertEqual(
+            self.report.name_id_mapper.infer_name(columns["name_id"][1]), "Foo"
+        )
+        self.assertEqual(
+            self.report.category_id_mapper.infer_name(
+                columns["category_id"][0]
+            ), "Feature"
+        )
+        self.assertEqual(list(columns["phase"][:3]), [b"B", b"B", b"E"])
+        self.assertEqual(columns["ts"][7], 1637675341728008439)
+        self.assertEqual(columns["pid"][0], 91098)
+
+        for trace_event, trace_event_row in zip(
+            self.report.trace_events, columns
+        ):
+            self.assertEqual(trace_event.timestamp, trace_event_row["ts"])
+
     def test_parse_stack_frames(self) -> None:
         """Test if we correctly parse stack frames."""
         # Currently, not implemented so we should get an exception.
         with self.assertRaises(NotImplementedError):
             _ = self.report.stack_frames
+
+
+class TestNameIDMapper(unittest.TestCase):
+    """Test if names are correctly interned."""
+
+    def test_known_names_keep_their_id(self) -> None:
+        """Test if already known names are mapped to their original ID."""
+        name_id_mapper = TEFReport.NameIDMapper(["Base", "Foo", "Bar"])
+
+        self.assertEqual(name_id_mapper.get_or_add_id("Foo"), 1)
+        self.assertEqual(name_id_mapper.get_or_add_id("Base"), 0)
+        self.assertEqual(len(name_id_mapper), 3)
+
+    def test_new_names_are_appended(self) -> None:
+        """Test if unknown names get a new ID."""
+        name_id_mapper = TEFReport.NameIDMapper(["Base"])
+
+        self.assertEqual(name_id_mapper.get_or_add_id("Foo"), 1)
+        self.assertEqual(name_id_mapper.get_or_add_id("Foo"), 1)
+        self.assertEqual(name_id_mapper.infer_name(1), "Foo")
+
+
+class TestTEFReportStreaming(unittest.TestCase):
+    """Tests the streaming parts of the trace-event-format parser."""
+
+    def test_iter_trace_events(self) -> None:
+        """Test if we can lazily iterate over all trace events."""
+        name_id_mapper = TEFReport.NameIDMapper()
+        with mock.patch(
+            'builtins.open',
+            new=mock.mock_open(read_data=TRACE_EVENT_FORMAT_OUTPUT)
+        ):
+            trace_events = list(
+                iter_trace_events(Path("fake_file_path"), name_id_mapper)
+            )
+
+        self.assertEqual(len(trace_events), 8)
+        self.assertEqual(trace_events[1].name, "Foo")
+        self.assertEqual(trace_events[7].name, "Base")
+        self.assertEqual(list(name_id_mapper), ["Base", "Foo", "Bar", "Foo_2"])
+
+    def test_lost_events_are_skipped(self) -> None:
+        """Test if lost-event markers are removed without rewriting the
+        file."""
+        patched_output = TRACE_EVENT_FORMAT_OUTPUT.replace(
+            "}, {", "}, Lost 42 events {", 1
+        )
+        mocked_open = mock.mock_open(read_data=patched_output)
+        with mock.patch('builtins.open', new=mocked_open):
+            report = TEFReport(Path("fake_file_path"))
+
+        self.assertEqual(len(report.trace_events), 8)
+        self.assertEqual(report.timestamp_unit, "ns")
+        mocked_open().write.assert_not_called()
+
+    def test_timestamp_unit_before_trace_events(self) -> None:
+        """Test if the timestamp unit is found in front of the trace
+        events."""
+        data = json.loads(TRACE_EVENT_FORMAT_OUTPUT)
+        reordered_output = json.dumps({
+            "timestampUnit": "us",
+            "traceEvents": data["traceEvents"]
+        })
+        with mock.patch(
+            'builtins.open', new=mock.mock_open(read_data=reordered_output)
+        ):
+            report = TEFReport(Path("fake_file_path"))
+
+        self.assertEqual(len(report.trace_events), 8)
+        self.assertEqual(report.timestamp_unit, "us")
+
+    def test_timestamp_unit_in_event_args(self) -> None:
+        """Test if a timestamp unit in the arguments of an event is not taken
+        for the timestamp unit of the report."""
+        data = json.loads(TRACE_EVENT_FORMAT_OUTPUT)
+        data["traceEvents"][0]["args"] = {"timestampUnit": "ms"}
+        with mock.patch(
+            'builtins.open', new=mock.mock_open(read_data=json.dumps(data))
+        ):
+            report = TEFReport(Path("fake_file_path"))
+
+        self.assertEqual(len(report.trace_events), 8)
+        self.assertEqual(report.timestamp_unit, "ns")
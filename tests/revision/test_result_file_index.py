@@ -0,0 +1,77 @@
+"""Test the result file index."""
+
+import shutil
+import unittest
+from pathlib import Path
+
+from tests.helper_utils import run_in_test_environment, UnitTestFixtures
+from varats.report.report import FileStatusExtension
+from varats.revision.result_file_index import (
+    ResultFileIndex,
+    get_result_file_index,
+)
+from varats.utils.git_util import ShortCommitHash
+from varats.utils.settings import vara_cfg
+
+
+class TestResultFileIndex(unittest.TestCase):
+    """Test if result files are indexed correctly."""
+
+    @run_in_test_environment(UnitTestFixtures.RESULT_FILES)
+    def test_index_result_files(self) -> None:
+        """Check whether result files are found and parsed correctly."""
+        index = get_result_file_index("SynthSAContextSensitivity")
+
+        result_files = index.get_result_files("BBBaseO", "CR")
+        self.assertEqual(2, len(result_files))
+        result_file = [
+            result_file for result_file in result_files
+            if result_file.config_id == 1
+        ][0]
+        self.assertEqual(ShortCommitHash("06eac0edb6"), result_file.commit_hash)
+        self.assertEqual(FileStatusExtension.SUCCESS, result_file.file_status)
+        self.assertTrue(result_file.file_path.full_path().exists())
+
+        self.assertEqual(4, len(index.get_result_files(report_shorthand="CR")))
+        self.assertEqual(0, len(index.get_result_files("BBBaseO", "BR")))
+
+    @run_in_test_environment(UnitTestFixtures.RESULT_FILES)
+    def test_refresh_index(self) -> None:
+        """Check whether the index picks up added and removed files."""
+        project_dir = Path(
+            str(vara_cfg()["result_dir"])
+        ) / "SynthSAContextSensitivity"
+        index = ResultFileIndex("SynthSAContextSensitivity", project_dir)
+
+        self.assertTrue(index.refresh())
+        self.assertFalse(index.refresh())
+        self.assertEqual(4, len(index.get_result_files()))
+
+        new_dir = project_dir / "BBBaseO-CR-SynthSAContextSensitivity-" \
+                                "ContextSense-aaaaaaaaaa"
+        new_dir.mkdir()
+        (new_dir /
+         "8380144f-9a25-44c6-8ce0-08d0a29c677b_config-2_success.zip").touch()
+
+        self.assertTrue(index.refresh())
+        self.assertEqual(
+            [ShortCommitHash("aaaaaaaaaa")],
+            [
+                result_file.commit_hash
+                for result_file in index.get_result_files()
+                if result_file.config_id == 2
+            ],
+        )
+
+        shutil.rmtree(new_dir)
+        self.assertTrue(index.refresh())
+        self.assertEqual(4, len(index.get_result_files()))
+
+    @run_in_test_environment(UnitTestFixtures.RESULT_FILES)
+    def test_persisted_index(self) -> None:
+        """Check whether the index is persisted in the data cache."""
+        get_result_file_index("SynthSAContextSensitivity")
+        self.assertTrue((
+            Path(str(vara_cfg()["data_cache"])) /
+            "result_file_index-SynthSAContextSensitivity.pickle"
+        ).exists())
@@ -0,0 +1,109 @@
+"""Test feature performance analysis table."""
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from tests.report.test_tef_report import TRACE_EVENT_FORMAT_OUTPUT
+from varats.report.tef_report import TEFReport
+from varats.tables.feature_performance_analysis import (
+    FeaturePerformanceAnalysisTable,
+)
+
+MULTI_THREAD_TRACE_EVENT_FORMAT_OUTPUT = """{
+    "traceEvents": [
+        {"name": "Base", "cat": "Feature", "ph": "B", "ts": 0,
+         "pid": 1, "tid": 1, "ID": 0},
+        {"name": "FR(Foo)", "cat": "Feature", "ph": "B", "ts": 10,
+         "pid": 1, "tid": 1, "ID": 1},
+        {"name": "Bar", "cat": "Feature", "ph": "B", "ts": 15,
+         "pid": 1, "tid": 2, "ID": 2},
+        {"name": "Baz", "cat": "Other", "ph": "B", "ts": 16,
+         "pid": 1, "tid": 1, "ID": 3},
+        {"name": "FR(Foo)", "cat": "Feature", "ph": "E", "ts": 30,
+         "pid": 1, "tid": 1, "ID": 1},
+        {"name": "Bar", "cat": "Feature", "ph": "E", "ts": 40,
+         "pid": 1, "tid": 2, "ID": 2},
+        {"name": "Base", "cat": "Feature", "ph": "E", "ts": 100,
+         "pid": 1, "tid": 1, "ID": 0}
+    ],
+    "timestampUnit": "ns"
+}
+"""
+
+
+def _load_report(trace_event_format_output: str) -> TEFReport:
+    with mock.patch(
+        'builtins.open',
+        new=mock.mock_open(read_data=trace_event_format_output)
+    ):
+        return TEFReport(Path("fake_file_path"))
+
+
+class TestFeaturePerformanceAnalysis(unittest.TestCase):
+    """Test if feature performances are correctly computed from TEF
+    reports."""
+
+    def test_nested_features(self) -> None:
+        """Test if nested feature durations are subtracted from their
+        parent."""
+        feature_performances = FeaturePerformanceAnalysisTable\
+            .get_feature_performance_from_tef_report(
+                _load_report(TRACE_EVENT_FORMAT_OUTPUT)
+            )
+
+        self.assertEqual(
+            feature_performances, {
+                "Base": 7000215274,
+                "Foo": 5000093719,
+                "Bar": 3000283543,
+                "Foo_2": 6000111667,
+            }
+        )
+
+    def test_features_per_thread(self) -> None:
+        """Test if feature regions of different threads are matched
+        independently."""
+        feature_performances = FeaturePerformanceAnalysisTable\
+            .get_feature_performance_from_tef_report(
+                _load_report(MULTI_THREAD_TRACE_EVENT_FORMAT_OUTPUT)
+            )
+
+        self.assertEqual(
+            feature_performances, {
+                "Base": 80,
+                "Foo": 20,
+                "Bar": 25,
+            }
+        )
+
+    def test_feature_performances_of_aggregate(self) -> None:
+        """Test if the feature performances of all reports in an aggregate are
+        computed per workload."""
+        reports = {
+            "single": [_load_report(TRACE_EVENT_FORMAT_OUTPUT)],
+            "multi": [
+                _load_report(MULTI_THREAD_TRACE_EVENT_FORMAT_OUTPUT),
+                _load_report(TRACE_EVENT_FORMAT_OUTPUT)
+            ],
+        }
+        agg_tef_report = mock.Mock()
+        agg_tef_report.workload_names.return_value = reports.keys()
+        agg_tef_report.reports.side_effect = reports.__getitem__
+
+        workload_performances = FeaturePerformanceAnalysisTable\
+            .get_feature_performances_from_tef_reports(agg_tef_report)
+        self.assertEqual(set(workload_performances), {"single", "multi"})
+        self.assertEqual(len(workload_performances["multi"]), 2)
+        self.assertEqual(
+            workload_performances["multi"][0], {
+                "Base": 80,
+                "Foo": 20,
+                "Bar": 25,
+            }
+        )
+        self.assertEqual(workload_performances["multi"][1]["Base"], 7000215274)
+
+        first_performances = FeaturePerformanceAnalysisTable\
+            .get_feature_performances_from_tef_reports(agg_tef_report, 1)
+        self.assertEqual(len(first_performances["single"]), 1)
+        self.assertEqual(len(first_performances["multi"]), 1)
@@ -47,6 +47,57 @@ class TestDriverArtefacts(unittest.TestCase):
         for artefact in artefacts:
             self.__check_artefact_files_present(artefact)
 
+    @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
+    def test_artefacts_generate_parallel(self) -> None:
+        """Test whether `vara-art generate --jobs` generates all expected
+        files."""
+
+        # setup config
+        vara_cfg()['paper_config']['current_config'] = "test_artefacts_driver"
+        load_paper_config()
+        artefacts = load_artefacts(get_paper_config()).artefacts
+        base_output_dir = Artefact.base_output_dir()
+
+        # vara-art generate --jobs 2
+        runner = CliRunner()
+        result = runner.invoke(
+            driver_artefacts.main, ["generate", "--jobs", "2"]
+        )
+        self.assertEqual(0, result.exit_code, result.exception)
+
+        # check that overview files are present
+        self.assertTrue((base_output_dir / "index.html").exists())
+        self.assertTrue((base_output_dir / "plot_matrix.html").exists())
+        # check that artefact files are present
+        for artefact in artefacts:
+            self.__check_artefact_files_present(artefact)
+
+    @run_in_test_environment(UnitTestFixtures.PAPER_CONFIGS)
+    def test_artefacts_generate_skips_unchanged(self) -> None:
+        """Test whether `vara-art generate` skips artefacts whose inputs did
+        not change."""
+
+        # setup config
+        vara_cfg()['paper_config']['current_config'] = "test_artefacts_driver"
+        load_paper_config()
+        num_artefacts = len(load_artefacts(get_paper_config()))
+
+        runner = CliRunner()
+        result = runner.invoke(driver_artefacts.main, ["generate"])
+        self.assertEqual(0, result.exit_code, result.exception)
+        self.assertNotIn("Skipped", result.stdout)
+
+        result = runner.invoke(driver_artefacts.main, ["generate"])
+        self.assertEqual(0, result.exit_code, result.exception)
+        self.assertIn(
+            f"Skipped {num_artefacts} of {num_artefacts} artefacts",
+            result.stdout
+        )
+
+        result = runner.invoke(driver_artefacts.main, ["generate", "--force"])
+        self.assertEqual(0, result.exit_code, result.exception)
+        self.assertNotIn("Skipped", result.stdout)
+
     def __check_artefact_files_present(self, artefact: Artefact) -> None:
         for file_info in artefact.get_artefact_file_infos():
             self.assertTrue((artefact.output_dir / file_info.file_name).exists()
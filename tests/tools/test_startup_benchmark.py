@@ -0,0 +1,93 @@
+"""Test the startup benchmark harness."""
+import json
+import subprocess
+import sys
+import unittest
+
+from varats.tools.startup_benchmark import (
+    find_regressions,
+    ImportTime,
+    measure_cli_startup,
+    measure_startup,
+    parse_import_times,
+    StartupBenchmarkResult,
+)
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      3500 |       4000 | varats.utils.settings
+some unrelated output
+import time:     20000 |      24000 | varats.tools.driver_plot
+"""
+
+
+class TestStartupBenchmark(unittest.TestCase):
+    """Tests for the startup benchmark harness."""
+
+    def test_parse_import_times(self) -> None:
+        """Check that importtime output is parsed into seconds."""
+        import_times = parse_import_times(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(3, len(import_times))
+        self.assertEqual(ImportTime(0.00012, 0.00012), import_times["_io"])
+        self.assertEqual(
+            ImportTime(0.02, 0.024), import_times["varats.tools.driver_plot"]
+        )
+
+    def test_find_regressions(self) -> None:
+        """Check that only large slowdowns are reported as regressions."""
+        baseline = StartupBenchmarkResult(
+            cold_startup={"vara-plot": 2.0},
+            warm_startup={"vara-plot": 0.5},
+            setup_steps={
+                "vara_cfg": 0.01,
+                "initialize_plots": 1.0
+            }
+        )
+        result = StartupBenchmarkResult(
+            cold_startup={"vara-plot": 2.5},
+            warm_startup={"vara-plot": 1.0},
+            setup_steps={
+                "vara_cfg": 0.03,
+                "initialize_plots": 1.2,
+                "initialize_tables": 5.0
+            }
+        )
+
+        regressions = find_regressions(result, baseline)
+
+        self.assertEqual(1, len(regressions))
+        self.assertTrue(regressions[0].startswith("warm startup of vara-plot"))
+
+    def test_measure_startup(self) -> None:
+        """Check that startup measurements contain the imported modules."""
+        cold_time, warm_time, import_times = measure_startup(
+            "varats.utils.settings", runs=1
+        )
+
+        self.assertGreater(cold_time, 0)
+        self.assertGreater(warm_time, 0)
+        self.assertIn("varats.utils.settings", import_times)
+
+    def test_measure_cli_startup(self) -> None:
+        """Check that entry points are invoked like their console scripts."""
+        self.assertGreater(measure_cli_startup("vara-table", runs=1), 0)
+
+    def test_driver_plot_imports_no_plots(self) -> None:
+        """Check that the plot driver does not import plot modules or heavy
+        plotting libraries on startup."""
+        process = subprocess.run([
+            sys.executable, "-c", "import json, sys, varats.tools.driver_plot;"
+            "print(json.dumps(list(sys.modules)))"
+        ],
+                                 capture_output=True,
+                                 text=True,
+                                 check=True)
+        modules = json.loads(process.stdout)
+
+        self.assertNotIn("seaborn", modules)
+        self.assertFalse([
+            module for module in modules
+            if module.startswith("varats.plots.") and
+            module != "varats.plots.discover_plots"
+        ])
@@ -1,8 +1,12 @@
 """Test VaRA git utilities."""
+import tempfile
+import threading
+import typing as tp
 import unittest
 from pathlib import Path
 
 from benchbuild.utils.revision_ranges import RevisionRange, SingleRevision
+from plumbum import local
 
 from varats.project.project_util import (
     BinaryType,
@@ -26,8 +30,18 @@ from varats.utils.git_util import (
     get_initial_commit,
     get_submodule_head,
     calc_code_churn_range,
+    calc_code_churn_pairs,
+    calc_repo_loc,
+    calc_repo_locs,
+    CodeChurnStore,
+    CommitMetadata,
+    CommitMetadataCache,
+    SourceCodeCommitStore,
     RepositoryAtCommit,
+    RepositoryHandle,
+    _stream_git_with_stdin,
 )
+from varats.utils.settings import vara_cfg
 
 
 class TestGitInteractionHelpers(unittest.TestCase):
@@ -525,6 +539,235 @@ class TestCodeChurnCalculation(unittest.TestCase):
         self.assertEqual(deletions, 11)
 
 
+class TestCodeChurnStore(unittest.TestCase):
+    """Test if the code churn store answers churn queries from a local
+    repository."""
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.old_data_cache = vara_cfg()["data_cache"].value
+        vara_cfg()["data_cache"] = str(Path(self.tmp_dir.name) / "cache")
+
+        repo_path = Path(self.tmp_dir.name) / "repo"
+        repo_path.mkdir()
+        self.git = local["git"]["-C", str(repo_path)]
+        self.git("init", "-q", "-b", "main")
+        self.git("config", "user.name", "Test")
+        self.git("config", "user.email", "test@test.com")
+
+        (repo_path / "main.c").write_text("a\nb\nc\n")
+        (repo_path / "README").write_text("readme\n")
+        self.__commit("init")
+        (repo_path / "main.c").write_text("a\nc\nd\ne\n")
+        self.__commit("change")
+        (repo_path / "main.c").rename(repo_path / "foo.c")
+        (repo_path / "bar.h").write_text("x\n")
+        self.__commit("rename")
+
+        self.repo = RepositoryHandle(repo_path)
+        self.commits = [
+            FullCommitHash(self.git("rev-parse", f"HEAD~{idx}").strip())
+            for idx in (2, 1, 0)
+        ]
+
+    def tearDown(self) -> None:
+        vara_cfg()["data_cache"] = self.old_data_cache
+        self.tmp_dir.cleanup()
+
+    def __commit(self, message: str) -> None:
+        self.git("add", "-A")
+        self.git("commit", "-q", "-m", message)
+
+    def test_commit_churn(self) -> None:
+        """Check the churn of single commits with and without file
+        filters."""
+        self.assertEqual(
+            calc_commit_code_churn(self.repo, self.commits[0]), (2, 4, 0)
+        )
+        self.assertEqual(
+            calc_commit_code_churn(
+                self.repo, self.commits[1],
+                ChurnConfig.create_c_style_languages_config()
+            ), (1, 2, 1)
+        )
+        self.assertEqual(
+            CodeChurnStore.get(
+                self.repo, ChurnConfig.create_c_style_languages_config()
+            ).commit_file_churn(self.commits[2]),
+            (("bar.h", 1, 0), ("foo.c", 0, 0))
+        )
+
+    def test_range_churn(self) -> None:
+        """Check the churn of all commits in a range."""
+        churn = calc_code_churn_range(
+            self.repo, ChurnConfig.create_c_style_languages_config(),
+            self.commits[1], self.commits[2]
+        )
+
+        self.assertEqual(
+            churn, {
+                self.commits[1]: (1, 2, 1),
+                self.commits[2]: (2, 1, 0)
+            }
+        )
+
+    def test_pair_churn(self) -> None:
+        """Check if pair churn is computed in batches and persisted."""
+        churn_config = ChurnConfig.create_c_style_languages_config()
+        self.assertEqual(
+            calc_code_churn_pairs(
+                self.repo, [(self.commits[0], self.commits[2]),
+                            (self.commits[2], self.commits[2])], churn_config
+            ), {(self.commits[0], self.commits[2]): (2, 3, 1),
+                (self.commits[2], self.commits[2]): (0, 0, 0)}
+        )
+
+        # a new store instance must answer from the persisted pairs
+        store = CodeChurnStore(self.repo, churn_config)
+        self.assertEqual(
+            store.pair_churn(self.commits[0], self.commits[2]), (2, 3, 1)
+        )
+
+    def test_stdin_batch_larger_than_pipe_buffer(self) -> None:
+        """Check that git commands whose input and output exceed the pipe
+        buffers do not block."""
+        num_pairs = 20000
+        revs = [f"{self.commits[2].hash} {self.commits[0].hash}"] * num_pairs
+        output: tp.List[str] = []
+        reader = threading.Thread(
+            target=lambda: output.extend(
+                _stream_git_with_stdin(
+                    self.repo, ["diff-tree", "--stdin", "--numstat"], revs
+                )
+            ),
+            daemon=True
+        )
+        reader.start()
+        reader.join(timeout=120)
+
+        self.assertFalse(reader.is_alive())
+        self.assertEqual("".join(output).count(self.commits[2].hash), num_pairs)
+
+
+class TestSourceCodeCommitStore(unittest.TestCase):
+    """Test if the source code commit store classifies all commits of a local
+    repository."""
+
+    def test_contains_source_code(self) -> None:
+        """Check if commits and merges are classified by the files they
+        change."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_data_cache = vara_cfg()["data_cache"].value
+            vara_cfg()["data_cache"] = str(Path(tmp_dir) / "cache")
+
+            repo_path = Path(tmp_dir) / "repo"
+            repo_path.mkdir()
+            git = local["git"]["-C", str(repo_path)]
+            git("init", "-q", "-b", "main")
+            git("config", "user.name", "Test")
+            git("config", "user.email", "test@test.com")
+
+            def commit(file_name: str) -> FullCommitHash:
+                (repo_path / file_name).write_text(f"{file_name}\n")
+                git("add", "-A")
+                git("commit", "-q", "-m", file_name)
+                return FullCommitHash(git("rev-parse", "HEAD").strip())
+
+            readme = commit("README")
+            git("checkout", "-q", "-b", "side")
+            code = commit("main.c")
+            git("checkout", "-q", "main")
+            docs = commit("docs.txt")
+            git("merge", "-q", "--no-edit", "side")
+            merge = FullCommitHash(git("rev-parse", "HEAD").strip())
+
+            try:
+                repo = RepositoryHandle(repo_path)
+                churn_config = ChurnConfig.create_c_style_languages_config()
+                store = SourceCodeCommitStore.get(repo, churn_config)
+                self.assertFalse(store.contains_source_code(readme))
+                self.assertTrue(store.contains_source_code(code))
+                self.assertFalse(store.contains_source_code(docs))
+                self.assertTrue(store.contains_source_code(merge))
+
+                # new commits are classified incrementally
+                header = commit("main.h")
+                self.assertTrue(store.contains_source_code(header))
+
+                # a new store instance must answer from the persisted state
+                persisted_store = SourceCodeCommitStore(repo, churn_config)
+                self.assertTrue(persisted_store.contains_source_code(header))
+                self.assertFalse(persisted_store.contains_source_code(docs))
+            finally:
+                vara_cfg()["data_cache"] = old_data_cache
+
+
+class TestCommitMetadataCache(unittest.TestCase):
+    """Test if commit metadata is loaded from a local repository."""
+
+    def test_commit_metadata(self) -> None:
+        """Check the metadata of known, new, and missing commits."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            git = local["git"]["-C", tmp_dir]
+            git("init", "-q", "-b", "main")
+
+            def commit(name: str, timestamp: int) -> FullCommitHash:
+                with local.env(GIT_COMMITTER_DATE=f"{timestamp} +0000"):
+                    git(
+                        "-c", f"user.name={name}", "-c",
+                        f"user.email={name}@test.com", "commit", "-q",
+                        "--allow-empty", "-m", name
+                    )
+                return FullCommitHash(git("rev-parse", "HEAD").strip())
+
+            first = commit("Jon", 1000000000)
+            second = commit("Jane", 1000001000)
+
+            cache = CommitMetadataCache.get(RepositoryHandle(Path(tmp_dir)))
+            self.assertEqual(
+                cache[second],
+                CommitMetadata("Jane", "Jane@test.com", 1000001000, (first,))
+            )
+            self.assertEqual(cache[first].parents, ())
+
+            third = commit("Jon", 1000002000)
+            self.assertEqual(cache[third].author_name, "Jon")
+            self.assertRaises(
+                LookupError, cache.__getitem__, FullCommitHash("f" * 40)
+            )
+
+
+class TestRepoLoc(unittest.TestCase):
+    """Test if we correctly count the lines of code in a repository."""
+
+    def test_repo_loc(self) -> None:
+        """Check if only non-empty lines of C/C++ files are counted."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo_path = Path(tmp_dir)
+            git = local["git"]["-C", tmp_dir]
+            git("init", "-q", "-b", "main")
+            git("config", "user.name", "Test")
+            git("config", "user.email", "test@test.com")
+
+            (repo_path / "src").mkdir()
+            (repo_path / "src" / "main.c").write_text("int a;\n\n  \nb\n")
+            (repo_path / "README.md").write_text("readme\n")
+            git("add", "-A")
+            git("commit", "-q", "-m", "init")
+            (repo_path / "src" / "util.hpp").write_text("1\n2\n3")
+            git("add", "-A")
+            git("commit", "-q", "-m", "util")
+
+            repo = RepositoryHandle(repo_path)
+            self.assertEqual(calc_repo_loc(repo, "HEAD~1"), 3)
+            self.assertEqual(
+                calc_repo_locs(repo, ["HEAD", "HEAD~1"]), {
+                    "HEAD": 6,
+                    "HEAD~1": 3
+                }
+            )
+
+
 class TestRevisionBinaryMap(unittest.TestCase):
     """Test if we can correctly setup and use the RevisionBinaryMap."""
 
@@ -0,0 +1,151 @@
+"""Test registry manifests."""
+import importlib
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import benchbuild as bb
+
+from varats.data.discover_reports import (
+    get_report_manifest,
+    get_report_type,
+    initialize_reports,
+)
+from varats.plot.plots import PlotGenerator
+from varats.plots.discover_plots import (
+    get_plot_generator_manifest,
+    initialize_plots,
+)
+from varats.projects.discover_projects import (
+    get_project_manifest,
+    initialize_projects,
+)
+from varats.report.report import BaseReport
+from varats.utils.registry_manifest import (
+    _get_source_files,
+    _get_sources_state,
+    _load_persisted_manifest,
+    get_registry_manifest,
+    RegistryEntry,
+)
+from varats.utils.settings import vara_cfg
+
+
+class TestRegistryManifest(unittest.TestCase):
+    """Test if registry manifests find all registered classes."""
+
+    def test_plot_generator_manifest(self) -> None:
+        """Check that the manifest matches the plot generator registry."""
+        initialize_plots()
+        self.assertEqual({
+            name: generator.__module__
+            for name, generator in PlotGenerator.GENERATORS.items()
+            if generator.__module__.startswith("varats.plots.")
+        }, {
+            name: entry.module_name
+            for name, entry in get_plot_generator_manifest().items()
+        })
+        self.assertEqual(
+            "Generates a single pc-overview plot for the current paper config.",
+            get_plot_generator_manifest()["pc-overview-plot"].help
+        )
+
+    def test_project_manifest(self) -> None:
+        """Check that the manifest matches the project registry."""
+        initialize_projects()
+        self.assertEqual({
+            project.NAME: project.__module__
+            for project in bb.project.ProjectRegistry.projects.values()
+            if project.__module__.startswith("varats.projects.")
+        }, {
+            name: entry.module_name
+            for name, entry in get_project_manifest().items()
+        })
+
+    def test_report_manifest(self) -> None:
+        """Check that the manifest matches the report registry and that report
+        types are looked up by name."""
+        self.assertIs(
+            BaseReport.REPORT_TYPES["TimeReportAggregate"],
+            get_report_type("TimeReportAggregate")
+        )
+
+        initialize_reports()
+        self.assertEqual({
+            name: report_type.__module__
+            for name, report_type in BaseReport.REPORT_TYPES.items()
+            if report_type.__module__.
+            startswith(("varats.report.", "varats.data.reports."))
+        }, {
+            name: entry.module_name
+            for name, entry in get_report_manifest().items()
+        })
+
+    def test_persisted_manifest(self) -> None:
+        """Check that manifests are persisted and invalidated when a source
+        file changes."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_data_cache = vara_cfg()["data_cache"].value
+            vara_cfg()["data_cache"] = tmp_dir
+
+            package_path = Path(tmp_dir) / "manifest_test_pkg"
+            (package_path / "sub").mkdir(parents=True)
+            (package_path / "__init__.py").write_text("")
+            (package_path / "sub" / "__init__.py").write_text("")
+            module_a = package_path / "a.py"
+            module_a.write_text(
+                "class A(Base, generator_name='a'):\n    pass\n"
+            )
+            (package_path / "sub" / "b.py").write_text(
+                "class B(Base, generator_name='b', options=[]):\n"
+                "    \"\"\"Generates\n    b.\n\n    Details.\"\"\"\n"
+                "class C(Base, generator_name=NAME):\n    pass\n"
+                "class D(Base):\n    generator_name = 'd'\n"
+            )
+
+            sys.path.insert(0, tmp_dir)
+            try:
+                package = importlib.import_module("manifest_test_pkg")
+                manifest = get_registry_manifest(package, "generator_name")
+                self.assertEqual({
+                    "a":
+                        RegistryEntry("manifest_test_pkg.a", "A", ""),
+                    "b":
+                        RegistryEntry(
+                            "manifest_test_pkg.sub.b", "B", "Generates b."
+                        ),
+                    "d":
+                        RegistryEntry("manifest_test_pkg.sub.b", "D", "")
+                }, manifest)
+                self.assertEqual([
+                    "A", "B", "C", "D"
+                ], sorted(
+                    get_registry_manifest(package, "generator_name", True)
+                ))
+
+                manifest_path = Path(tmp_dir) / (
+                    "registry_manifest-manifest_test_pkg-generator_name-"
+                    "generator_name.json"
+                )
+                self.assertEqual(
+                    manifest,
+                    _load_persisted_manifest(
+                        manifest_path,
+                        _get_sources_state(_get_source_files(package))
+                    )
+                )
+
+                module_a.write_text(
+                    "class A(Base, generator_name='renamed'):\n    pass\n"
+                )
+                self.assertIsNone(
+                    _load_persisted_manifest(
+                        manifest_path,
+                        _get_sources_state(_get_source_files(package))
+                    )
+                )
+            finally:
+                sys.path.remove(tmp_dir)
+                sys.modules.pop("manifest_test_pkg", None)
+                vara_cfg()["data_cache"] = old_data_cache
@@ -12,6 +12,7 @@ setup(
     install_requires=[
         "benchbuild>=6.8",
         "ijson>=3.1.4",
+        "numpy>=1.24.2",
         "plumbum>=1.6",
         "PyGithub>=1.58",
         "PyDriller>=2.4.1",
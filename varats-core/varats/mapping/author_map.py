@@ -1,11 +1,17 @@
 """Author map module."""
 
+import hashlib
 import logging
+import os
+import pickle
 import re
+import tempfile
 import typing as tp
-from functools import reduce
+from pathlib import Path
 
 from varats.project.project_util import get_local_project_repo
+from varats.utils.git_util import RepositoryHandle, get_refs_state
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
@@ -55,7 +61,7 @@ class Author():
         """Add additional name and mail to the author."""
         if not name in self.names:
             self.names.add(name)
-        if not mail in self.mail:
+        if not mail in self.mail_addresses:
             self.mail_addresses.add(mail)
 
     def merge(self, other: 'Author') -> 'Author':
@@ -82,7 +88,12 @@ class AuthorMap():
         self.current_id = 0
         self.mail_dict: tp.Dict[str, Author] = {}
         self.name_dict: tp.Dict[str, Author] = {}
-        self.__authors: tp.Set[Author] = set()
+        # disjoint-set forest over author ids, where each set is represented
+        # by the author with the smallest id
+        self.__parent: tp.List[int] = []
+        self.__authors: tp.Dict[int, Author] = {}
+        self.__name_ids: tp.Dict[str, int] = {}
+        self.__mail_ids: tp.Dict[str, int] = {}
 
     def get_author_by_name(self, name: str) -> tp.Optional[Author]:
         if self._look_up_invalid:
@@ -96,7 +107,7 @@ class AuthorMap():
 
     @property
     def authors(self) -> tp.Set[Author]:
-        return self.__authors
+        return set(self.__authors.values())
 
     def get_author(self, name: str, mail: str) -> tp.Optional[Author]:
         """
@@ -122,35 +133,65 @@ class AuthorMap():
 
     def add_entry(self, name: str, mail: str) -> None:
         """Add authors to the map and invalidate look up dicts."""
-        ambiguos_authors = {
-            author for author in self.__authors
-            if name in author.names or mail in author.mail_addresses
-        }
-
-        if not ambiguos_authors:
-            self.__authors.add(Author(self.new_author_id(), name, mail))
-            self._look_up_invalid = True
-            return
-
-        if len(ambiguos_authors) > 1:
-            existing_author = reduce(
-                lambda accu, author: accu.merge(author), ambiguos_authors
+        name_id = self.__name_ids.get(name, None)
+        mail_id = self.__mail_ids.get(mail, None)
+
+        if name_id is None and mail_id is None:
+            author_id = self.new_author_id()
+            self.__parent.append(author_id)
+            self.__authors[author_id] = Author(author_id, name, mail)
+        elif name_id is None or mail_id is None:
+            author_id = self.__find(
+                name_id if name_id is not None else tp.cast(int, mail_id)
             )
+            self.__authors[author_id].add_data(name, mail)
         else:
-            existing_author = ambiguos_authors.pop()
+            author_id = self.__union(name_id, mail_id)
+            self.__authors[author_id].add_data(name, mail)
 
-        existing_author.add_data(name, mail)
-        self.__authors = self.__authors.difference(ambiguos_authors)
-        self.__authors.add(existing_author)
+        self.__name_ids.setdefault(name, author_id)
+        self.__mail_ids.setdefault(mail, author_id)
         self._look_up_invalid = True
 
+    def __find(self, author_id: int) -> int:
+        """Find the id of the author that represents the set of the given
+        author id."""
+        root = author_id
+        while self.__parent[root] != root:
+            root = self.__parent[root]
+
+        while self.__parent[author_id] != root:
+            self.__parent[author_id], author_id = root, self.__parent[author_id]
+
+        return root
+
+    def __union(self, first_id: int, second_id: int) -> int:
+        """Merge the sets of two author ids and return the id of the author
+        representing the merged set."""
+        first_root = self.__find(first_id)
+        second_root = self.__find(second_id)
+        if first_root == second_root:
+            return first_root
+
+        merged_author = self.__authors.pop(first_root).merge(
+            self.__authors.pop(second_root)
+        )
+        # merging keeps the author with the smaller id
+        self.__authors[merged_author.author_id] = merged_author
+        self.__parent[first_root] = merged_author.author_id
+        self.__parent[second_root] = merged_author.author_id
+        return merged_author.author_id
+
     def _gen_lookup_dicts(self) -> None:
         """Generate the dicts for name and mail lookups."""
-        for author in self.__authors:
-            for mail in author.mail_addresses:
-                self.mail_dict[mail] = author
-            for name in author.names:
-                self.name_dict[name] = author
+        self.mail_dict = {
+            mail: self.__authors[self.__find(author_id)]
+            for mail, author_id in self.__mail_ids.items()
+        }
+        self.name_dict = {
+            name: self.__authors[self.__find(author_id)]
+            for name, author_id in self.__name_ids.items()
+        }
 
         self._look_up_invalid = False
 
@@ -158,9 +199,54 @@ class AuthorMap():
         return f"{self.name_dict} \n {self.mail_dict}"
 
 
+_AUTHOR_MAP_VERSION = 1
+
+
+def _author_map_path(repo: RepositoryHandle) -> Path:
+    """Path of the persisted author map for the current state of a
+    repository."""
+    key = "\n".join([
+        str(_AUTHOR_MAP_VERSION),
+        str(repo.repo_path.absolute()),
+        get_refs_state(repo)
+    ])
+    return Path(str(vara_cfg()["data_cache"])) / "author_maps" / \
+        f"{hashlib.sha256(key.encode()).hexdigest()}.pickle"
+
+
+def _load_author_map(path: Path) -> tp.Optional[AuthorMap]:
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as author_map_file:
+            return tp.cast(AuthorMap, pickle.load(author_map_file))
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        LOG.warning(f"Could not load author map {path}.")
+        return None
+
+
+def _store_author_map(author_map: AuthorMap, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp_file:
+        pickle.dump(author_map, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file.name, path)
+
+
 def generate_author_map(project_name: str) -> AuthorMap:
-    """Generate an AuthorMap for the repository at the given path."""
+    """
+    Generate an AuthorMap for the repository of the given project.
+
+    The generated map is persisted in the data cache and reused as long as the
+    references of the repository do not change.
+    """
     repo = get_local_project_repo(project_name)
+    persist = vara_cfg()["data_cache_settings"]["persist_author_maps"]
+    if persist:
+        author_map_path = _author_map_path(repo)
+        if (author_map := _load_author_map(author_map_path)) is not None:
+            return author_map
+
     author_map = AuthorMap()
     test = repo("shortlog", "-sne", "--all").strip().split("\n")
     for line in test:
@@ -172,4 +258,7 @@ def generate_author_map(project_name: str) -> AuthorMap:
         email = match.group(2)
         author_map.add_entry(name, email)
 
+    if persist:
+        _store_author_map(author_map, author_map_path)
+
     return author_map
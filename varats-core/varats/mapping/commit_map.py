@@ -1,20 +1,28 @@
 """Commit map module."""
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 import typing as tp
 from collections.abc import ItemsView
+from pathlib import Path
 
-from pygtrie import CharTrie
+import numpy as np
+import numpy.typing as npt
+import pygit2
 
 from varats.project.project_util import (
     get_primary_project_source,
     get_local_project_repo,
 )
 from varats.utils.git_util import (
-    get_current_branch,
     FullCommitHash,
     ShortCommitHash,
     RepositoryHandle,
+    get_refs_state,
 )
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
@@ -23,6 +31,186 @@ class AmbiguousCommitHash(Exception):
     """Raised if an ambiguous commit hash is encountered."""
 
 
+class _CommitMapIndexItemsView(ItemsView):  # type: ignore[type-arg]
+    """Items view of a :class:`CommitMapIndex` that iterates over the items in
+    time ID order without looking up the time ID of every hash."""
+
+    _mapping: 'CommitMapIndex'
+
+    def __iter__(self) -> tp.Iterator[tp.Tuple[str, int]]:
+        return self._mapping.iter_items()
+
+
+class CommitMapIndex(tp.Mapping[str, int]):
+    """
+    Compact, read-only mapping from full commit hashes to time IDs.
+
+    The index consists of three arrays: the hashes of all time IDs, where
+    time IDs without a commit in the map have an empty entry, and the sorted
+    hashes together with their time IDs. This allows constant time lookups of
+    the hash of a time ID and logarithmic time lookups of the time ID of a
+    hash or all hashes with a given prefix. The arrays can be stored on disk
+    and are memory-mapped when loaded again.
+    """
+
+    __HASH_DTYPE = "S40"
+    __FILES = ("by_time_id.npy", "sorted_hashes.npy", "sorted_time_ids.npy")
+
+    def __init__(
+        self, by_time_id: npt.NDArray[tp.Any],
+        sorted_hashes: npt.NDArray[tp.Any],
+        sorted_time_ids: npt.NDArray[np.int64]
+    ) -> None:
+        self.__by_time_id = by_time_id
+        self.__sorted_hashes = sorted_hashes
+        self.__sorted_time_ids = sorted_time_ids
+
+    @classmethod
+    def from_items(
+        cls, items: tp.Iterable[tp.Tuple[str, int]]
+    ) -> 'CommitMapIndex':
+        """
+        Create an index from pairs of full commit hashes and time IDs.
+
+        Args:
+            items: pairs of commit hashes and their time IDs
+
+        Returns:
+            the index of the given commits
+        """
+        hashes: tp.List[str] = []
+        time_ids: tp.List[int] = []
+        for c_hash, time_id in items:
+            hashes.append(c_hash)
+            time_ids.append(time_id)
+
+        hash_array = np.array(hashes, dtype=cls.__HASH_DTYPE)
+        time_id_array = np.array(time_ids, dtype=np.int64)
+
+        by_time_id = np.zeros(
+            int(time_id_array.max()) + 1 if time_ids else 0,
+            dtype=cls.__HASH_DTYPE
+        )
+        by_time_id[time_id_array] = hash_array
+
+        order = np.argsort(hash_array, kind="stable")
+        return cls(by_time_id, hash_array[order], time_id_array[order])
+
+    @classmethod
+    def load(cls, path: Path) -> 'CommitMapIndex':
+        """Load an index stored with `store`, memory-mapping its arrays."""
+        return cls(
+            *(
+                np.load(path / file_name, mmap_mode="r")
+                for file_name in cls.__FILES
+            )
+        )
+
+    def store(self, path: Path) -> None:
+        """
+        Store the index in the directory ``path``.
+
+        The index is written to a temporary directory first, so concurrent
+        readers never see a partially written index.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(tempfile.mkdtemp(dir=path.parent))
+        try:
+            for file_name, array in zip(
+                self.__FILES, (
+                    self.__by_time_id, self.__sorted_hashes,
+                    self.__sorted_time_ids
+                )
+            ):
+                np.save(tmp_path / file_name, array)
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process stored the same index concurrently.
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def __getitem__(self, c_hash: str) -> int:
+        idx = int(np.searchsorted(self.__sorted_hashes, c_hash.encode()))
+        if idx < len(self.__sorted_hashes) and \
+                self.__sorted_hashes[idx].decode() == c_hash:
+            return int(self.__sorted_time_ids[idx])
+        raise KeyError(c_hash)
+
+    def __iter__(self) -> tp.Iterator[str]:
+        for c_hash in self.__by_time_id:
+            if c_hash:
+                yield c_hash.decode()
+
+    def __len__(self) -> int:
+        return len(self.__sorted_hashes)
+
+    def items(self) -> tp.ItemsView[str, int]:
+        return _CommitMapIndexItemsView(self)
+
+    def iter_items(self) -> tp.Iterator[tp.Tuple[str, int]]:
+        """Iterate over all pairs of commit hashes and time IDs in time ID
+        order."""
+        for time_id, c_hash in enumerate(self.__by_time_id.tolist()):
+            if c_hash:
+                yield c_hash.decode(), time_id
+
+    def c_hash(self, time_id: int) -> str:
+        """
+        Get the commit hash of a time ID.
+
+        Args:
+            time_id: unique time-ordered id
+
+        Returns:
+            the full commit hash
+        """
+        if 0 <= time_id < len(self.__by_time_id):
+            c_hash = self.__by_time_id[time_id]
+            if c_hash:
+                return str(c_hash.decode())
+        raise KeyError(time_id)
+
+    def complete(self, prefix: str) -> tp.List[str]:
+        """
+        Get all commit hashes that start with a given prefix.
+
+        Args:
+            prefix: the prefix of the commit hashes
+
+        Returns:
+            all commit hashes of the index that start with the prefix
+        """
+        start = np.searchsorted(self.__sorted_hashes, prefix.encode())
+        end = np.searchsorted(
+            self.__sorted_hashes, prefix.ljust(40, "f").encode(), side="right"
+        )
+        return [c_hash.decode() for c_hash in self.__sorted_hashes[start:end]]
+
+    def __str__(self) -> str:
+        return str(dict(self.items()))
+
+
+_COMMIT_MAP_INDEX_VERSION = 2
+
+_COMMIT_MAP_SORT_MODE = pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME
+
+
+def _get_ref_tips(pygit_repo: pygit2.Repository) -> tp.List[pygit2.Oid]:
+    """Get the commits HEAD and all references of a repository point to, like
+    ``git log --all`` does."""
+    tips = []
+    if not pygit_repo.head_is_unborn:
+        tips.append(pygit_repo.head.target)
+
+    for ref_name in pygit_repo.references:
+        try:
+            tips.append(pygit_repo.references[ref_name].peel(pygit2.Commit).id)
+        except (KeyError, ValueError, pygit2.GitError):
+            # references to non-commit objects, e.g., tagged trees
+            continue
+
+    return tips
+
+
 class CommitMap():
     """Provides a mapping from commit hash to additional information."""
 
@@ -37,60 +225,93 @@ class CommitMap():
         self.end = end
         self.start = start
         self.refspec = refspec
-        self._hash_to_id = None
-        self._hash_to_id_master = None
+        self._hash_to_id: tp.Optional[CommitMapIndex] = None
+        self._hash_to_id_master: tp.Optional[CommitMapIndex] = None
 
     @property
-    def __hash_to_id(self) -> CharTrie:
-        if not self._hash_to_id:
-            self._hash_to_id = self.generate_hash_to_id()
+    def __hash_to_id(self) -> CommitMapIndex:
+        if self._hash_to_id is None:
+            self._hash_to_id = self.__load_hash_to_id(master=False)
         return self._hash_to_id
 
     @property
-    def __hash_to_id_master(self) -> CharTrie:
-        if not self._hash_to_id_master:
-            self._hash_to_id_master = self.generate_hash_to_id(master=True)
+    def __hash_to_id_master(self) -> CommitMapIndex:
+        if self._hash_to_id_master is None:
+            self._hash_to_id_master = self.__load_hash_to_id(master=True)
         return self._hash_to_id_master
 
-    def generate_hash_to_id(self, master: bool = False) -> CharTrie:
-        search_range = ""
-        if self.start is not None:
-            search_range += self.start + ".."
-        search_range += self.end
+    def __index_path(self, master: bool) -> Path:
+        key = "\n".join([
+            str(_COMMIT_MAP_INDEX_VERSION),
+            str(self.repo.repo_path.absolute()),
+            get_refs_state(self.repo), self.end, self.start or "", self.refspec,
+            str(master)
+        ])
+        return Path(str(vara_cfg()["data_cache"])) / "commit_maps" / \
+            hashlib.sha256(key.encode()).hexdigest()
+
+    def __load_hash_to_id(self, master: bool) -> CommitMapIndex:
+        if not vara_cfg()["data_cache_settings"]["persist_commit_maps"]:
+            return self.generate_hash_to_id(master)
+
+        index_path = self.__index_path(master)
+        if index_path.exists():
+            try:
+                return CommitMapIndex.load(index_path)
+            except (OSError, ValueError):
+                LOG.warning(f"Could not load commit map index {index_path}.")
+
+        hash_to_id = self.generate_hash_to_id(master)
+        hash_to_id.store(index_path)
+        return hash_to_id
 
-        old_head = get_current_branch(self.repo)
-        self.repo("checkout", self.refspec)
-        full_out = self.repo(
-            "--no-pager", "log", "--all", "--pretty=format:'%H'"
-        )
-        if master:
-            wanted_out = self.repo(
-                "--no-pager", "log", "--pretty=format:'%H'", search_range
-            )
-        else:
-            wanted_out = self.repo(
-                "--no-pager", "log", "--all", "--pretty=format:'%H'",
-                search_range
-            )
+    def __resolve_rev(self, rev: str) -> pygit2.Oid:
+        # HEAD refers to the refspec, without checking the refspec out.
+        if rev == "HEAD":
+            rev = self.refspec
+        return self.repo.pygit_repo.revparse_single(rev).peel(pygit2.Commit).id
 
-        def format_stream() -> tp.Generator[str, None, None]:
-            wanted_cm = set()
-            for line in wanted_out.split('\n'):
-                wanted_cm.add(line[1:-1])
+    def generate_hash_to_id(self, master: bool = False) -> CommitMapIndex:
+        """
+        Create the mapping from commit hashes to time IDs.
+
+        Time IDs number all commits of the repository in topological and time
+        order, oldest first, but only the commits in the range of the commit
+        map are part of the mapping. The commits are read with pygit2
+        revwalks, so the worktree of the repository is never changed.
+
+        Args:
+            master: only include commits reachable from the end of the range,
+                    not from all references
 
-            for number, line in enumerate(reversed(full_out.split('\n'))):
-                line = line[1:-1]
-                if line in wanted_cm:
-                    yield f"{number}, {line}\n"
+        Returns:
+            the index of the commit map
+        """
+        pygit_repo = self.repo.pygit_repo
+        ref_tips = _get_ref_tips(pygit_repo)
 
-        hash_to_id: CharTrie = CharTrie()
-        for line in format_stream():
-            slices = line.strip().split(', ')
-            hash_to_id[slices[1]] = int(slices[0])
+        wanted_walker = pygit_repo.walk(
+            self.__resolve_rev(self.end), _COMMIT_MAP_SORT_MODE
+        )
+        if not master:
+            for tip in ref_tips:
+                wanted_walker.push(tip)
+        if self.start is not None:
+            wanted_walker.hide(self.__resolve_rev(self.start))
+        wanted_cm = {commit.id for commit in wanted_walker}
 
-        self.repo("checkout", old_head)
+        full_walker = pygit_repo.walk(
+            self.__resolve_rev(self.refspec),
+            _COMMIT_MAP_SORT_MODE | pygit2.GIT_SORT_REVERSE
+        )
+        for tip in ref_tips:
+            full_walker.push(tip)
 
-        return hash_to_id
+        return CommitMapIndex.from_items(
+            (str(commit.id), number)
+            for number, commit in enumerate(full_walker)
+            if commit.id in wanted_cm
+        )
 
     def convert_to_full_or_warn(
         self, short_commit: ShortCommitHash
@@ -138,7 +359,7 @@ class CommitMap():
         Returns:
             unique time-ordered id
         """
-        return tp.cast(int, self.__hash_to_id[c_hash.hash])
+        return self.__hash_to_id[c_hash.hash]
 
     def short_time_id(self, c_hash: ShortCommitHash) -> int:
         """
@@ -167,10 +388,7 @@ class CommitMap():
         Returns:
             commit hash
         """
-        for c_hash, t_id in self.__hash_to_id.items():
-            if t_id == time_id:
-                return FullCommitHash(tp.cast(str, c_hash))
-        raise KeyError
+        return FullCommitHash(self.__hash_to_id.c_hash(time_id))
 
     def complete_c_hash(
         self, short_commit: ShortCommitHash
@@ -185,18 +403,18 @@ class CommitMap():
             a set of full-length commit hashes that start with the short-form
             commit hash
         """
-        subtrie = self.__hash_to_id.items(prefix=short_commit.hash)
-        if subtrie:
-            return {FullCommitHash(c_hash) for c_hash, _ in subtrie}
+        completions = self.__hash_to_id.complete(short_commit.hash)
+        if completions:
+            return {FullCommitHash(c_hash) for c_hash in completions}
         raise KeyError
 
     def mapping_items(self) -> tp.ItemsView[str, int]:
         """Get an iterator over the mapping items."""
-        return ItemsView(self.__hash_to_id)
+        return self.__hash_to_id.items()
 
     def mapping_items_master(self) -> tp.ItemsView[str, int]:
         """Get an iterator over the mapping items."""
-        return ItemsView(self.__hash_to_id_master)
+        return self.__hash_to_id_master.items()
 
     def __str__(self) -> str:
         return str(self.__hash_to_id)
@@ -26,6 +26,9 @@ from varats.utils.git_util import (
     ShortCommitHash,
     CommitRepoPair,
     CommitLookupTy,
+    CommitMetadata,
+    CommitMetadataCache,
+    CommitMetadataLookupTy,
 )
 from varats.utils.settings import bb_cfg
 
@@ -172,6 +175,50 @@ def create_project_commit_lookup_helper(project_name: str) -> CommitLookupTy:
     return get_commit
 
 
+def create_project_commit_metadata_lookup_helper(
+    project_name: str
+) -> CommitMetadataLookupTy:
+    """
+    Creates a commit metadata lookup function for project repositories.
+
+    In contrast to :func:`create_project_commit_lookup_helper`, the metadata of
+    all commits is loaded in bulk and shared by all lookup functions of the
+    same repository.
+
+    Args:
+        project_name: name of the given benchbuild project
+
+    Returns:
+        a Callable that maps a commit hash and repository name to the
+        metadata of the corresponding commit.
+    """
+
+    metadata_caches = {
+        repo_name: CommitMetadataCache.get(repo)
+        for repo_name, repo in get_local_project_repos(project_name).items()
+    }
+
+    def get_commit_metadata(crp: CommitRepoPair) -> CommitMetadata:
+        """
+        Gets the commit metadata for a given ``CommitRepoPair``.
+
+        Args:
+            crp: the ``CommitRepoPair`` for the commit to get
+
+        Returns:
+            the metadata of the commit corresponding to the given
+            CommitRepoPair
+        """
+        try:
+            return metadata_caches[crp.repository_name][crp.commit_hash]
+        except LookupError as err:
+            raise LookupError(
+                f"Could not find commit {crp} for project {project_name}."
+            ) from err
+
+    return get_commit_metadata
+
+
 def get_tagged_commits(project_name: str) -> tp.List[tp.Tuple[str, str]]:
     """Get a list of all tagged commits along with their respective tags."""
     repo = get_local_project_repo(project_name)
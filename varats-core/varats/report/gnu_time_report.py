@@ -310,23 +310,21 @@ class TimeReportAggregate(
 
     def __init__(self, path: Path) -> None:
         super().__init__(path, TimeReport)
-        self._measurements_wall_clock_time = [
-            report.wall_clock_time.total_seconds() for report in self.reports()
-        ]
-        self._measurements_ctx_switches = [
-            report.voluntary_ctx_switches + report.involuntary_ctx_switches
-            for report in self.reports()
-        ]
 
     @property
     def measurements_wall_clock_time(self) -> tp.List[float]:
         """Wall clock time measurements of all aggregated reports."""
-        return self._measurements_wall_clock_time
+        return [
+            report.wall_clock_time.total_seconds() for report in self.reports()
+        ]
 
     @property
     def measurements_ctx_switches(self) -> tp.List[int]:
         """Context switches measurements of all aggregated reports."""
-        return self._measurements_ctx_switches
+        return [
+            report.voluntary_ctx_switches + report.involuntary_ctx_switches
+            for report in self.reports()
+        ]
 
     @property
     def max_resident_sizes(self) -> tp.List[int]:
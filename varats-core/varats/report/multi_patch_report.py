@@ -1,9 +1,10 @@
 """MultiPatchReport to group together similar reports that where produced for
 differently patched projects."""
-import shutil
-import tempfile
 import typing as tp
+import weakref
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
 from varats.provider.patch.patch_provider import Patch
 from varats.report.report import ReportTy, BaseReport
@@ -17,42 +18,60 @@ class MultiPatchReport(
 
     def __init__(self, path: Path, report_type: tp.Type[ReportTy]) -> None:
         super().__init__(path)
-        self.__patched_reports: tp.Dict[str, ReportTy] = {}
-        self.__base = None
-
-        with tempfile.TemporaryDirectory() as tmp_result_dir:
-            shutil.unpack_archive(path, extract_dir=tmp_result_dir)
-
-            for report in Path(tmp_result_dir).iterdir():
-                if self.is_baseline_report(report.name):
-                    self.__base = report_type(report)
-                elif self.is_patched_report(report.name):
-                    self.__patched_reports[
-                        self._parse_patch_shorthand_from_report_name(
-                            report.name
-                        )] = report_type(report)
-
-            if not self.__base or not self.__patched_reports:
-                raise AssertionError(
-                    f"Reports where missing in the file {path=}"
+
+        # Reports are extracted lazily to a temporary directory, which is
+        # cleaned up by the finalizer.
+        self.__tmpdir = TemporaryDirectory()  # pylint: disable=R1732
+        self.__finalizer = weakref.finalize(self, self.__tmpdir.cleanup)
+
+        self.__report_type = report_type
+        self.__parsed_reports: tp.Dict[str, ReportTy] = {}
+        self.__patched_members: tp.Dict[str, str] = {}
+        self.__base_member: tp.Optional[str] = None
+
+        with ZipFile(path) as archive:
+            for member in archive.namelist():
+                if "/" in member:
+                    continue
+                if self.is_baseline_report(member):
+                    self.__base_member = member
+                elif self.is_patched_report(member):
+                    self.__patched_members[
+                        self._parse_patch_shorthand_from_report_name(member)
+                    ] = member
+
+        if not self.__base_member or not self.__patched_members:
+            raise AssertionError(f"Reports where missing in the file {path=}")
+
+    def __get_report(self, member: str) -> ReportTy:
+        """Extract and parse a report on first access."""
+        if member not in self.__parsed_reports:
+            with ZipFile(self.path) as archive:
+                self.__parsed_reports[member] = self.__report_type(
+                    Path(archive.extract(member, self.__tmpdir.name))
                 )
 
+        return self.__parsed_reports[member]
+
     def get_baseline_report(self) -> ReportTy:
-        return self.__base
+        return self.__get_report(tp.cast(str, self.__base_member))
 
     def get_report_for_patch(self,
                              patch_shortname: str) -> tp.Optional[ReportTy]:
         """Get the report for a given patch shortname."""
-        if patch_shortname in self.__patched_reports:
-            return self.__patched_reports[patch_shortname]
+        if patch_shortname in self.__patched_members:
+            return self.__get_report(self.__patched_members[patch_shortname])
 
         return None
 
     def get_patch_names(self) -> tp.List[str]:
-        return list(self.__patched_reports.keys())
+        return list(self.__patched_members.keys())
 
     def get_patched_reports(self) -> tp.ValuesView[ReportTy]:
-        return self.__patched_reports.values()
+        return {
+            patch_shortname: self.__get_report(member)
+            for patch_shortname, member in self.__patched_members.items()
+        }.values()
 
     @staticmethod
     def create_baseline_report_name(base_file_name: str) -> str:
@@ -1,7 +1,6 @@
 """The Report module implements basic report functionalities and provides a
 minimal interface ``BaseReport`` to implement own reports."""
 import re
-import shutil
 import typing as tp
 import weakref
 from collections import defaultdict
@@ -9,6 +8,7 @@ from enum import Enum
 from os import stat_result
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from zipfile import ZipFile
 
 from plumbum import colors
 from plumbum.colorlib.styles import Color
@@ -732,14 +732,19 @@ class KeyedReportAggregate(
         self.__tmpdir = TemporaryDirectory()  # pylint: disable=R1732
         self.__finalizer = weakref.finalize(self, self.__tmpdir.cleanup)
 
-        # Extract archive and parse reports.
-        if self.path.exists():
-            shutil.unpack_archive(self.path, self.__tmpdir.name)
-
+        # Only categorize the members of the archive here; reports are
+        # extracted and parsed lazily when their category is first accessed.
+        self.__report_type = report_type
         self.__default_key = default_key
-        self.__reports: tp.Dict[KeyTy, tp.List[ReportTy]] = defaultdict(list)
-        for file in Path(self.__tmpdir.name).iterdir():
-            self.__reports[key_func(file)].append(report_type(file))
+        self.__members: tp.Dict[KeyTy, tp.List[str]] = defaultdict(list)
+        if self.path.exists():
+            with ZipFile(self.path) as archive:
+                for member in archive.namelist():
+                    if "/" in member:
+                        continue
+                    file = Path(self.__tmpdir.name) / member
+                    self.__members[key_func(file)].append(member)
+        self.__reports: tp.Dict[KeyTy, tp.List[ReportTy]] = {}
 
     def remove(self) -> None:
         self.__finalizer()
@@ -749,17 +754,33 @@ class KeyedReportAggregate(
         return not self.__finalizer.alive
 
     def keys(self) -> tp.Collection[KeyTy]:
-        return self.__reports.keys()
+        return self.__members.keys()
 
     def reports(self, key: tp.Optional[KeyTy] = None) -> tp.List[ReportTy]:
         """Returns the list of parsed reports."""
-        if key:
-            return self.__reports[key]
+        if not key:
+            if self.__default_key is None:
+                raise AssertionError("No key or default key was provided.")
+
+            key = self.__default_key
+
+        if key not in self.__reports:
+            self.__reports[key] = self.__parse_reports(key)
+
+        return self.__reports[key]
 
-        if self.__default_key is None:
-            raise AssertionError("No key or default key was provided.")
+    def __parse_reports(self, key: KeyTy) -> tp.List[ReportTy]:
+        """Extract and parse all reports of a category."""
+        members = self.__members.get(key, [])
+        if not members:
+            return []
 
-        return self.__reports[self.__default_key]
+        with ZipFile(self.path) as archive:
+            return [
+                self.__report_type(
+                    Path(archive.extract(member, self.__tmpdir.name))
+                ) for member in members
+            ]
 
 
 def _key_id(_: Path) -> int:
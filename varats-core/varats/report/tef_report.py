@@ -1,13 +1,17 @@
 """Report module to create and handle trace event format files, e.g., created
 with chrome tracing."""
 
+import json
 import logging
 import re
 import typing as tp
+from array import array
 from enum import Enum
 from pathlib import Path
 
 import ijson
+import numpy as np
+import numpy.typing as npt
 
 from varats.experiment.workload_util import WorkloadSpecificReportAggregate
 from varats.report.report import BaseReport, ReportAggregate
@@ -38,11 +42,12 @@ class TraceEventType(Enum):
     def parse_event_type(raw_event_type: str) -> 'TraceEventType':
         """Parses a raw string that represents a trace-format event type and
         converts it to the corresponding enum value."""
-        for trace_event_type in TraceEventType:
-            if trace_event_type.value == raw_event_type:
-                return trace_event_type
-
-        raise LookupError("Could not find correct trace event type")
+        try:
+            return TraceEventType(raw_event_type)
+        except ValueError as err:
+            raise LookupError(
+                "Could not find correct trace event type"
+            ) from err
 
     def __str__(self) -> str:
         return str(self.value)
@@ -52,6 +57,11 @@ class TraceEvent():
     """Represents a trace event that was captured during the analysis of a
     target program."""
 
+    __slots__ = (
+        "__name_id_mapper", "__name_id", "__category", "__event_type",
+        "__tracing_clock_timestamp", "__pid", "__tid", "__uuid"
+    )
+
     __uuid: int
 
     def __init__(
@@ -67,14 +77,38 @@ class TraceEvent():
         self.__tracing_clock_timestamp = int(json_trace_event["ts"])
         self.__pid = int(json_trace_event["pid"])
         self.__tid = int(json_trace_event["tid"])
-
-        if "UUID" in json_trace_event:
-            self.__uuid = int(json_trace_event["UUID"])
-        elif "ID" in json_trace_event:
-            self.__uuid = int(json_trace_event["ID"])
-        else:
-            LOG.critical("Could not parse UUID/ID from trace event")
-            self.__uuid: int = 0
+        self.__uuid = _parse_uuid(json_trace_event)
+
+    @classmethod
+    def from_columns(
+        cls, trace_event_row: np.void, name_id_mapper: 'TEFReport.NameIDMapper',
+        category_id_mapper: 'TEFReport.NameIDMapper'
+    ) -> 'TraceEvent':
+        """
+        Creates a trace event from a row of the columnar trace event storage.
+
+        Args:
+            trace_event_row: row of an array with dtype `TRACE_EVENT_DTYPE`
+            name_id_mapper: mapper to resolve the name ID of the row
+            category_id_mapper: mapper to resolve the category ID of the row
+
+        Returns:
+            the trace event stored in the row
+        """
+        trace_event = cls.__new__(cls)
+        trace_event.__name_id_mapper = name_id_mapper
+        trace_event.__name_id = int(trace_event_row["name_id"])
+        trace_event.__category = category_id_mapper.infer_name(
+            int(trace_event_row["category_id"])
+        )
+        trace_event.__event_type = TraceEventType.parse_event_type(
+            trace_event_row["phase"].decode()
+        )
+        trace_event.__tracing_clock_timestamp = int(trace_event_row["ts"])
+        trace_event.__pid = int(trace_event_row["pid"])
+        trace_event.__tid = int(trace_event_row["tid"])
+        trace_event.__uuid = int(trace_event_row["uuid"])
+        return trace_event
 
     @property
     def name(self) -> str:
@@ -120,18 +154,291 @@ class TraceEvent():
         return f"{{ name={self.name}, uuid={self.uuid} }}"
 
 
+def _parse_uuid(json_trace_event: tp.Dict[str, tp.Any]) -> int:
+    if "UUID" in json_trace_event:
+        return int(json_trace_event["UUID"])
+    if "ID" in json_trace_event:
+        return int(json_trace_event["ID"])
+
+    LOG.critical("Could not parse UUID/ID from trace event")
+    return 0
+
+
+TRACE_EVENT_DTYPE = np.dtype([
+    ("name_id", np.uint32),
+    ("category_id", np.uint32),
+    ("phase", "S1"),
+    ("ts", np.int64),
+    ("pid", np.int32),
+    ("tid", np.int32),
+    ("uuid", np.uint64),
+])
+
+
+class _TraceEventColumnBuilder():
+    """Collects trace events into compact per-field buffers and converts them
+    into a structured array with dtype `TRACE_EVENT_DTYPE`."""
+
+    def __init__(
+        self, name_id_mapper: 'TEFReport.NameIDMapper',
+        category_id_mapper: 'TEFReport.NameIDMapper'
+    ) -> None:
+        self.__name_id_mapper = name_id_mapper
+        self.__category_id_mapper = category_id_mapper
+        self.__name_ids = array("I")
+        self.__category_ids = array("I")
+        self.__phases = bytearray()
+        self.__timestamps = array("q")
+        self.__pids = array("i")
+        self.__tids = array("i")
+        self.__uuids = array("Q")
+
+    def add(self, json_trace_event: tp.Dict[str, tp.Any]) -> None:
+        """Append a trace event, parsed from json, to the columns."""
+        self.__name_ids.append(
+            self.__name_id_mapper.get_or_add_id(json_trace_event["name"])
+        )
+        self.__category_ids.append(
+            self.__category_id_mapper.get_or_add_id(
+                str(json_trace_event["cat"])
+            )
+        )
+        phase = str(json_trace_event["ph"])
+        TraceEventType.parse_event_type(phase)
+        self.__phases += phase.encode()
+        self.__timestamps.append(int(json_trace_event["ts"]))
+        self.__pids.append(int(json_trace_event["pid"]))
+        self.__tids.append(int(json_trace_event["tid"]))
+        self.__uuids.append(_parse_uuid(json_trace_event))
+
+    def build(self) -> npt.NDArray[tp.Any]:
+        """Create the structured array of all added trace events."""
+        trace_events = np.empty(len(self.__timestamps), dtype=TRACE_EVENT_DTYPE)
+        if not self.__timestamps:
+            return trace_events
+
+        trace_events["name_id"] = np.frombuffer(self.__name_ids, dtype="u4")
+        trace_events["category_id"] = np.frombuffer(
+            self.__category_ids, dtype="u4"
+        )
+        trace_events["phase"] = np.frombuffer(self.__phases, dtype="S1")
+        trace_events["ts"] = np.frombuffer(self.__timestamps, dtype="i8")
+        trace_events["pid"] = np.frombuffer(self.__pids, dtype="i4")
+        trace_events["tid"] = np.frombuffer(self.__tids, dtype="i4")
+        trace_events["uuid"] = np.frombuffer(self.__uuids, dtype="u8")
+        return trace_events
+
+
+class _LostEventFilter():
+    """
+    Read-only binary stream wrapper that removes ``Lost N events`` messages,
+    which the tracer injects into trace files when events were dropped.
+
+    The messages are removed while the file is read, so the report file itself
+    is never modified. A possibly incomplete message at the end of a chunk is
+    held back until the next chunk is available.
+    """
+
+    __LOST_EVENTS = re.compile(rb"Lost \d+ events")
+    __PARTIAL_LOST_EVENTS = re.compile(
+        rb"L(?:o(?:s(?:t(?: (?:\d+(?: (?:e(?:v(?:e(?:n(?:t)?)?)?)?)?)?)?)?)?)?)?\Z"
+    )
+
+    def __init__(
+        self,
+        stream: tp.IO[tp.Any],
+        path: Path,
+        report_lost_events: bool = True
+    ) -> None:
+        self.__stream = stream
+        self.__path = path
+        self.__pending = b""
+        self.__eof = False
+        self.__reported = not report_lost_events
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes with all lost-event messages removed."""
+        if size == 0:
+            return b""
+
+        if self.__eof:
+            data, self.__pending = self.__pending, b""
+            return data
+
+        while True:
+            chunk = self.__stream.read(size)
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+
+            if not chunk:
+                self.__eof = True
+                data, self.__pending = self.__pending, b""
+                return data
+
+            data = self.__remove_lost_events(self.__pending + chunk)
+            partial = self.__PARTIAL_LOST_EVENTS.search(data)
+            if partial:
+                self.__pending = data[partial.start():]
+                data = data[:partial.start()]
+            else:
+                self.__pending = b""
+
+            if data:
+                return data
+
+    def __remove_lost_events(self, data: bytes) -> bytes:
+        if b"Lost" not in data:
+            return data
+
+        data, num_subs = self.__LOST_EVENTS.subn(b"", data)
+        if num_subs and not self.__reported:
+            LOG.error(
+                f"Events where lost during tracing, skipping lost event "
+                f"markers in {self.__path}."
+            )
+            self.__reported = True
+        return data
+
+
+class _StringValueScanner():
+    """
+    Read-only binary stream wrapper that records the string values of a JSON
+    key in the data read through it.
+
+    This allows to pick up a top-level value while the stream is parsed for
+    something else, without a second parsing pass. As the scan does not know
+    the nesting of the key, all occurrences are recorded and callers need to
+    fall back to a proper parse if they are ambiguous.
+    """
+
+    __MAX_MATCH_LENGTH = 256
+
+    def __init__(self, stream: tp.Any, key: str) -> None:
+        self.__stream = stream
+        self.__key_pattern = re.compile(
+            rb'"' + re.escape(key.encode()) + rb'"\s*:\s*("(?:[^"\\]|\\.)*")'
+        )
+        self.__tail = b""
+        self.__tail_offset = 0
+        self.__matches: tp.Dict[int, str] = {}
+
+    @property
+    def values(self) -> tp.Set[str]:
+        """The distinct values of the key found so far."""
+        return set(self.__matches.values())
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes and record the values of the key."""
+        data = self.__stream.read(size)
+        # keep the end of the previous chunk, so that matches spanning two
+        # chunks are found
+        window = self.__tail + data
+        for match in self.__key_pattern.finditer(window):
+            self.__matches[self.__tail_offset +
+                           match.start()] = str(json.loads(match.group(1)))
+
+        self.__tail = window[-self.__MAX_MATCH_LENGTH:]
+        self.__tail_offset += len(window) - len(self.__tail)
+        return data
+
+
+def _get_ijson_backend() -> tp.Any:
+    """Returns the fastest available ijson backend, preferring the C
+    backend."""
+    try:
+        return ijson.get_backend("yajl2_c")
+    except ImportError:
+        LOG.debug(
+            f"ijson C backend not available, falling back to "
+            f"'{ijson.backend}'."
+        )
+        return ijson
+
+
+def _iter_json_items(
+    stream: tp.IO[tp.Any],
+    path: Path,
+    prefix: str,
+    report_lost_events: bool = True
+) -> tp.Iterator[tp.Any]:
+    yield from _get_ijson_backend().items(
+        _LostEventFilter(stream, path, report_lost_events), prefix
+    )
+
+
+def iter_trace_events(
+    path: Path,
+    name_id_mapper: tp.Optional['TEFReport.NameIDMapper'] = None
+) -> tp.Iterator[TraceEvent]:
+    """
+    Lazily iterates over the trace events of a trace event format file without
+    loading all events into memory.
+
+    Args:
+        path: path to the trace event format file
+        name_id_mapper: mapper used to intern event names; a new mapper is
+                        created if none is passed
+
+    Returns:
+        an iterator over the trace events in file order
+    """
+    if name_id_mapper is None:
+        name_id_mapper = TEFReport.NameIDMapper()
+
+    with open(path, "rb") as stream:
+        for json_trace_event in _iter_json_items(
+            stream, path, "traceEvents.item"
+        ):
+            yield TraceEvent(
+                json_trace_event,
+                name_id_mapper.get_or_add_id(json_trace_event["name"]),
+                name_id_mapper
+            )
+
+
 class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
     """Report class to access trace event format files."""
 
     class NameIDMapper(tp.List[str]):
         """Helper class to map name IDs to names."""
 
+        def __init__(self, names: tp.Iterable[str] = ()) -> None:
+            super().__init__()
+            self.__name_ids: tp.Dict[str, int] = {}
+            for name in names:
+                self.get_or_add_id(name)
+
         def infer_name(self, name_id: int) -> str:
             return self[name_id]
 
+        def find_id(self, name: str) -> tp.Optional[int]:
+            """Looks up the ID of a name without adding unknown names."""
+            return self.__name_ids.get(name)
+
+        def get_or_add_id(self, name: str) -> int:
+            """
+            Looks up the ID of a name, adding the name to the mapper if it is
+            not yet known.
+
+            Args:
+                name: the name to look up
+
+            Returns:
+                the ID of the name
+            """
+            name_id = self.__name_ids.get(name)
+            if name_id is None:
+                name_id = len(self)
+                self.__name_ids[name] = name_id
+                self.append(name)
+            return name_id
+
     def __init__(self, path: Path) -> None:
         super().__init__(path)
         self.__name_id_mapper: TEFReport.NameIDMapper = TEFReport.NameIDMapper()
+        self.__category_id_mapper: TEFReport.NameIDMapper = \
+            TEFReport.NameIDMapper()
+        self.__trace_events: tp.Optional[tp.List[TraceEvent]] = None
         try:
             self._parse_json()
         except Exception as e:
@@ -146,67 +453,77 @@ class TEFReport(BaseReport, shorthand="TEF", file_type="json"):
 
     @property
     def trace_events(self) -> tp.List[TraceEvent]:
+        """
+        Trace events of the report as objects.
+
+        The objects are created from `trace_event_columns` on first access.
+        Large analyses should prefer the columnar view.
+        """
+        if self.__trace_events is None:
+            self.__trace_events = [
+                TraceEvent.from_columns(
+                    trace_event_row, self.__name_id_mapper,
+                    self.__category_id_mapper
+                ) for trace_event_row in self.__trace_event_columns
+            ]
         return self.__trace_events
 
+    @property
+    def trace_event_columns(self) -> npt.NDArray[tp.Any]:
+        """
+        Trace events of the report as a structured array with dtype
+        `TRACE_EVENT_DTYPE`.
+
+        Names and categories are stored as IDs that can be resolved with
+        `name_id_mapper` and `category_id_mapper`; the phase is stored as the
+        raw event type character.
+        """
+        return self.__trace_event_columns
+
+    @property
+    def name_id_mapper(self) -> 'TEFReport.NameIDMapper':
+        return self.__name_id_mapper
+
+    @property
+    def category_id_mapper(self) -> 'TEFReport.NameIDMapper':
+        return self.__category_id_mapper
+
     @property
     def stack_frames(self) -> None:
         raise NotImplementedError(
             "Stack frame parsing is currently not implemented!"
         )
 
-    def _patch_errors_from_file(self) -> None:
-        with open(self.path, "r") as f:
-            data = f.read()
-
-        with open(self.path, "w") as f:
-            remove_lost_events = re.compile('Lost \d+ events')
-            for line in data.splitlines():
-                if "Lost" in line:
-                    LOG.error(
-                        "Events where lost during tracing, patching json file."
-                    )
-                    line = remove_lost_events.sub("", line)
-
-                f.write(line)
-
     def _parse_json(self) -> None:
-        trace_events: tp.List[TraceEvent] = []
-
-        self._patch_errors_from_file()
-
-        with open(self.path, "rb") as f:
-            parser = ijson.parse(f)
-            trace_event: tp.Dict[str, str] = {}
-            key = ""
-            for prefix, event, value in parser:
-                if event == "map_key":
-                    key = value
-                if prefix.startswith("traceEvents.item"):
-                    if prefix == "traceEvents.item" and event == "start_map":
-                        trace_event = {}
-                    if prefix == "traceEvents.item" and event == "end_map":
-                        if trace_event is not None:
-                            if trace_event["name"] in self.__name_id_mapper:
-                                name_id = self.__name_id_mapper.index(
-                                    trace_event["name"]
-                                )
-                            else:
-                                self.__name_id_mapper.append(
-                                    trace_event["name"]
-                                )
-                                name_id = len(self.__name_id_mapper) - 1
-                            trace_events.append(
-                                TraceEvent(
-                                    trace_event, name_id, self.__name_id_mapper
-                                )
-                            )
-
-                    elif event == "string" or event == "number":
-                        trace_event[key] = value
-                elif prefix.startswith("timestampUnit"):
-                    if event == "string":
-                        self.__timestamp_unit: str = str(value)
-        self.__trace_events: tp.List[TraceEvent] = trace_events
+        column_builder = _TraceEventColumnBuilder(
+            self.__name_id_mapper, self.__category_id_mapper
+        )
+        with open(self.path, "rb") as stream:
+            # The timestamp unit may follow the trace events, so it is picked
+            # up while the events are streamed on the fast C backend path.
+            timestamp_unit_scanner = _StringValueScanner(
+                _LostEventFilter(stream, self.path), "timestampUnit"
+            )
+            for json_trace_event in _get_ijson_backend().items(
+                timestamp_unit_scanner, "traceEvents.item"
+            ):
+                column_builder.add(json_trace_event)
+        self.__trace_event_columns = column_builder.build()
+
+        timestamp_units = timestamp_unit_scanner.values
+        if len(timestamp_units) == 1:
+            self.__timestamp_unit: str = timestamp_units.pop()
+        elif timestamp_units:
+            # Events also use the key, so only a full parse can tell which
+            # value belongs to the report.
+            with open(self.path, "rb") as stream:
+                for timestamp_unit in _iter_json_items(
+                    stream,
+                    self.path,
+                    "timestampUnit",
+                    report_lost_events=False
+                ):
+                    self.__timestamp_unit = str(timestamp_unit)
 
 
 class TEFReportAggregate(
@@ -0,0 +1,275 @@
+"""
+Module for indexing the result files of a project.
+
+Looking up result files requires to list the whole result directory of a
+project and to parse the names of all files in it. As this is done by many
+tools and databases over and over again, we keep an index of all result files
+of a project. The index is only updated for directories whose modification
+time changed since they were last indexed and is persisted in the data cache,
+so that it can be reused by other processes.
+"""
+
+import logging
+import os
+import pickle
+import typing as tp
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from varats.report.report import (
+    FileStatusExtension,
+    ReportFilename,
+    ReportFilepath,
+)
+from varats.utils.git_util import ShortCommitHash
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexedResultFile:
+    """A result file together with the information encoded in its name."""
+    file_path: ReportFilepath
+    experiment_shorthand: str
+    report_shorthand: str
+    commit_hash: ShortCommitHash
+    config_id: tp.Optional[int]
+    file_status: FileStatusExtension
+
+    @staticmethod
+    def create(full_path: Path,
+               result_dir: Path) -> tp.Optional['IndexedResultFile']:
+        """
+        Create an index entry for a file if it is a result file.
+
+        Args:
+            full_path: path to the file
+            result_dir: result directory of the project
+
+        Returns:
+            the index entry or ``None`` if the file is not a result file
+        """
+        report_filepath = ReportFilepath.construct(full_path, result_dir)
+        report_filename: ReportFilename = report_filepath.report_filename
+        if not report_filename.is_result_file():
+            return None
+
+        return IndexedResultFile(
+            report_filepath, report_filename.experiment_shorthand,
+            report_filename.report_shorthand, report_filename.commit_hash,
+            report_filename.config_id, report_filename.file_status
+        )
+
+
+@dataclass
+class _IndexedDirectory:
+    mtime_ns: int
+    files: tp.List[IndexedResultFile] = field(default_factory=list)
+    sub_directories: tp.List[str] = field(default_factory=list)
+
+
+class ResultFileIndex():
+    """
+    Index of all result files in the result directory of a project.
+
+    Args:
+        project_name: name of the project
+        result_dir: result directory of the project
+    """
+
+    def __init__(self, project_name: str, result_dir: Path) -> None:
+        self.__project_name = project_name
+        self.__result_dir = result_dir
+        self.__directories: tp.Dict[str, _IndexedDirectory] = {}
+        self.__by_report_type: tp.Dict[tp.Tuple[str, str],
+                                       tp.List[IndexedResultFile]] = {}
+
+    @property
+    def project_name(self) -> str:
+        """Name of the indexed project."""
+        return self.__project_name
+
+    @property
+    def result_dir(self) -> Path:
+        """Indexed result directory."""
+        return self.__result_dir
+
+    def refresh(self) -> bool:
+        """
+        Update the index for all directories that changed since the last
+        refresh.
+
+        Returns:
+            ``True`` if the index changed
+        """
+        visited_directories: tp.Set[str] = set()
+        changed = False
+        if self.__result_dir.exists():
+            changed = self.__refresh_directory(Path("."), visited_directories)
+
+        for removed_dir in set(self.__directories) - visited_directories:
+            del self.__directories[removed_dir]
+            changed = True
+
+        if changed:
+            self.__by_report_type = defaultdict(list)
+            for directory in self.__directories.values():
+                for entry in directory.files:
+                    self.__by_report_type[
+                        (entry.experiment_shorthand,
+                         entry.report_shorthand)].append(entry)
+
+        return changed
+
+    def __refresh_directory(
+        self, rel_dir: Path, visited_directories: tp.Set[str]
+    ) -> bool:
+        abs_dir = self.__result_dir / rel_dir
+        dir_key = str(rel_dir)
+        visited_directories.add(dir_key)
+        changed = False
+
+        mtime_ns = abs_dir.stat().st_mtime_ns
+        indexed_dir = self.__directories.get(dir_key)
+        if indexed_dir is None or indexed_dir.mtime_ns != mtime_ns:
+            indexed_dir = _IndexedDirectory(mtime_ns)
+            with os.scandir(abs_dir) as dir_entries:
+                for dir_entry in dir_entries:
+                    if dir_entry.is_dir():
+                        indexed_dir.sub_directories.append(dir_entry.name)
+                        continue
+
+                    result_file = IndexedResultFile.create(
+                        Path(dir_entry.path), self.__result_dir
+                    )
+                    if result_file is not None:
+                        indexed_dir.files.append(result_file)
+
+            self.__directories[dir_key] = indexed_dir
+            changed = True
+
+        for sub_directory in indexed_dir.sub_directories:
+            changed |= self.__refresh_directory(
+                rel_dir / sub_directory, visited_directories
+            )
+
+        return changed
+
+    def get_result_files(
+        self,
+        experiment_shorthand: tp.Optional[str] = None,
+        report_shorthand: tp.Optional[str] = None
+    ) -> tp.List[IndexedResultFile]:
+        """
+        Look up indexed result files.
+
+        Args:
+            experiment_shorthand: only return files of this experiment
+            report_shorthand: only return files of this report type
+
+        Returns:
+            all matching result files
+        """
+        if experiment_shorthand is not None and report_shorthand is not None:
+            return list(
+                self.__by_report_type.get(
+                    (experiment_shorthand, report_shorthand), []
+                )
+            )
+
+        return [
+            entry for (exp_shorthand,
+                       rep_shorthand), entries in self.__by_report_type.items()
+            if experiment_shorthand in (None, exp_shorthand) and
+            report_shorthand in (None, rep_shorthand) for entry in entries
+        ]
+
+    def get_result_files_dict(
+        self,
+        experiment_shorthand: tp.Optional[str] = None,
+        report_shorthand: tp.Optional[str] = None
+    ) -> tp.DefaultDict[ShortCommitHash, tp.List[IndexedResultFile]]:
+        """
+        Look up indexed result files grouped by their commit hash.
+
+        Args:
+            experiment_shorthand: only return files of this experiment
+            report_shorthand: only return files of this report type
+
+        Returns:
+            dict that maps commit hashes to the matching result files
+        """
+        result_files: tp.DefaultDict[
+            ShortCommitHash, tp.List[IndexedResultFile]] = defaultdict(list)
+        for entry in self.get_result_files(
+            experiment_shorthand, report_shorthand
+        ):
+            result_files[entry.commit_hash].append(entry)
+
+        return result_files
+
+
+__INDEX_REGISTRY: tp.Dict[tp.Tuple[str, str], ResultFileIndex] = {}
+
+
+def __get_index_cache_path(project_name: str) -> Path:
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / f"result_file_index-{project_name}.pickle"
+
+
+def __load_persisted_index(project_name: str,
+                           result_dir: Path) -> tp.Optional[ResultFileIndex]:
+    cache_path = __get_index_cache_path(project_name)
+    if not cache_path.exists():
+        return None
+
+    try:
+        with open(cache_path, "rb") as index_file:
+            index = pickle.load(index_file)
+    except (pickle.UnpicklingError, EOFError, AttributeError) as exc:
+        LOG.warning(f"Could not load result file index {cache_path}: {exc}")
+        return None
+
+    if not isinstance(index, ResultFileIndex) or index.result_dir != result_dir:
+        return None
+    return index
+
+
+def __persist_index(index: ResultFileIndex) -> None:
+    cache_path = __get_index_cache_path(index.project_name)
+    if not cache_path.parent.exists():
+        return
+
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as index_file:
+        pickle.dump(index, index_file, pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(cache_path)
+
+
+def get_result_file_index(project_name: str) -> ResultFileIndex:
+    """
+    Get an up-to-date index of the result files of a project.
+
+    Args:
+        project_name: name of the project
+
+    Returns:
+        the result file index of the project
+    """
+    result_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/").absolute()
+    registry_key = (project_name, str(result_dir))
+
+    index = __INDEX_REGISTRY.get(registry_key)
+    if index is None:
+        index = __load_persisted_index(
+            project_name, result_dir
+        ) or ResultFileIndex(project_name, result_dir)
+        __INDEX_REGISTRY[registry_key] = index
+
+    if index.refresh():
+        __persist_index(index)
+
+    return index
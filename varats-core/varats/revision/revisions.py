@@ -17,14 +17,12 @@ from varats.project.project_util import (
     get_project_cls_by_name,
     get_primary_project_source,
 )
-from varats.report.report import (
-    FileStatusExtension,
-    BaseReport,
-    ReportFilepath,
-    ReportFilename,
+from varats.report.report import FileStatusExtension, BaseReport, ReportFilepath
+from varats.revision.result_file_index import (
+    IndexedResultFile,
+    get_result_file_index,
 )
 from varats.utils.git_util import ShortCommitHash, CommitHashTy, CommitHash
-from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
     import varats.experiment.experiment_util as exp_u
@@ -67,14 +65,14 @@ def filter_blocked_revisions(
     ]
 
 
-def __get_result_files_dict(
+def __get_indexed_result_files_dict(
     project_name: str,
     opt_experiment_type: tp.Optional[tp.Type["exp_u.VersionExperiment"]] = None,
     opt_report_type: tp.Optional[tp.Type[BaseReport]] = None
-) -> tp.Dict[ShortCommitHash, tp.List[ReportFilepath]]:
+) -> tp.Dict[ShortCommitHash, tp.List[IndexedResultFile]]:
     """
-    Returns a dict that maps the commit_hash to a list of all result files of
-    the given type for that commit.
+    Returns a dict that maps the commit_hash to a list of all indexed result
+    files of the given type for that commit.
 
     Args:
         project_name: target project
@@ -82,39 +80,42 @@ def __get_result_files_dict(
         opt_report_type: the report type of the result files;
                      defaults to experiment's main report
     """
-    res_dir = Path(f"{vara_cfg()['result_dir']}/{project_name}/")
-
-    # maps commit hash -> list of res files (success or fail)
-    result_files: tp.DefaultDict[ShortCommitHash,
-                                 tp.List[ReportFilepath]] = defaultdict(list)
-    if not res_dir.exists():
-        return result_files
+    result_file_index = get_result_file_index(project_name)
     if opt_experiment_type is None:
-        condition: tp.Callable[[ReportFilename], bool] = lambda x: True
-    else:
-        experiment_type = opt_experiment_type
-        if opt_report_type:
-            report_type = opt_report_type
-        else:
-            report_type = experiment_type.report_spec().main_report
+        return result_file_index.get_result_files_dict()
 
-        def matches_report_type(file: ReportFilename) -> bool:
-            return file.report_shorthand == report_type.shorthand(
-            ) and file.experiment_shorthand == experiment_type.shorthand()
+    experiment_type = opt_experiment_type
+    if opt_report_type:
+        report_type = opt_report_type
+    else:
+        report_type = experiment_type.report_spec().main_report
 
-        condition = matches_report_type
+    return result_file_index.get_result_files_dict(
+        experiment_type.shorthand(), report_type.shorthand()
+    )
 
-    for res_file in res_dir.rglob("*"):
-        if res_file.is_dir():
-            continue
 
-        report_filepath = ReportFilepath.construct(res_file, res_dir)
-        report_file = report_filepath.report_filename
-        if report_file.is_result_file() and condition(report_file):
-            commit_hash = report_file.commit_hash
-            result_files[commit_hash].append(report_filepath)
+def __get_result_files_dict(
+    project_name: str,
+    opt_experiment_type: tp.Optional[tp.Type["exp_u.VersionExperiment"]] = None,
+    opt_report_type: tp.Optional[tp.Type[BaseReport]] = None
+) -> tp.Dict[ShortCommitHash, tp.List[ReportFilepath]]:
+    """
+    Returns a dict that maps the commit_hash to a list of all result files of
+    the given type for that commit.
 
-    return result_files
+    Args:
+        project_name: target project
+        opt_experiment_type: the experiment type that created the result files
+        opt_report_type: the report type of the result files;
+                     defaults to experiment's main report
+    """
+    return {
+        commit_hash: [entry.file_path for entry in entries]
+        for commit_hash, entries in __get_indexed_result_files_dict(
+            project_name, opt_experiment_type, opt_report_type
+        ).items()
+    }
 
 
 def __get_files_with_status(
@@ -146,28 +147,28 @@ def __get_files_with_status(
     """
     processed_revisions_paths = []
 
-    result_files = __get_result_files_dict(
+    result_files = __get_indexed_result_files_dict(
         project_name, experiment_type, report_type
     )
 
     for value in result_files.values():
         if config_id is not None:
-            value = [
-                x for x in value if x.report_filename.config_id == config_id
-            ]
+            value = [x for x in value if x.config_id == config_id]
             if not value:
                 continue
 
-        sorted_res_files = sorted(
-            value, key=lambda x: x.stat().st_mtime, reverse=True
-        )
+        sorted_res_files = value
+        if len(value) > 1:
+            sorted_res_files = sorted(
+                value, key=lambda x: x.file_path.stat().st_mtime, reverse=True
+            )
         if only_newest:
             sorted_res_files = [sorted_res_files[0]]
         for result_file in sorted_res_files:
-            if file_name_filter(result_file.report_filename.filename):
+            if file_name_filter(result_file.file_path.report_filename.filename):
                 continue
-            if result_file.report_filename.file_status in file_statuses:
-                processed_revisions_paths.append(result_file)
+            if result_file.file_status in file_statuses:
+                processed_revisions_paths.append(result_file.file_path)
 
     return processed_revisions_paths
 
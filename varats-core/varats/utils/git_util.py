@@ -1,8 +1,15 @@
 """Utility module for handling git repos."""
 import abc
+import hashlib
 import logging
+import os
+import pickle
 import re
+import subprocess
+import tempfile
+import threading
 import typing as tp
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from types import TracebackType
@@ -13,6 +20,7 @@ from plumbum import TF, RETCODE
 from plumbum.commands.base import BoundCommand
 
 from varats.utils.exceptions import unwrap
+from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
     from benchbuild.utils.revision_ranges import AbstractRevisionRange
@@ -225,6 +233,31 @@ def get_head_commit(repo: RepositoryHandle) -> FullCommitHash:
     return FullCommitHash(repo("rev-parse", "HEAD").strip())
 
 
+def get_refs_state(repo: RepositoryHandle) -> str:
+    """
+    Create a fingerprint of HEAD and all references of a repository.
+
+    Args:
+        repo: git repository handle
+
+    Returns:
+        a hash that changes whenever HEAD or a reference is moved
+    """
+    pygit_repo = repo.pygit_repo
+    refs_hash = hashlib.sha256()
+    if not pygit_repo.head_is_unborn:
+        refs_hash.update(f"HEAD {pygit_repo.head.target}\n".encode())
+
+    for ref_name in sorted(pygit_repo.references):
+        try:
+            target = pygit_repo.references[ref_name].resolve().target
+        except (KeyError, pygit2.GitError):
+            continue
+        refs_hash.update(f"{ref_name} {target}\n".encode())
+
+    return refs_hash.hexdigest()
+
+
 def get_initial_commit(repo: RepositoryHandle) -> FullCommitHash:
     """
     Get the initial commit of a repository, i.e., the first commit made.
@@ -663,6 +696,222 @@ def map_commits(
     ]
 
 
+def _stream_git_with_stdin(
+    repo: RepositoryHandle, args: tp.List[str], revs: tp.Iterable[str]
+) -> tp.Iterator[str]:
+    """
+    Run git with revisions passed on stdin and stream its output in chunks.
+
+    Git may produce output while it is still reading its input, so stdin is
+    written from a separate thread; otherwise, both processes block on each
+    other once the pipe buffers are full.
+    """
+    git_cmd = repo["--no-pager"][args]
+    with git_cmd.popen(
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding="utf-8",
+        errors="surrogateescape"
+    ) as proc:
+        writer = threading.Thread(
+            target=_write_revs, args=(proc.stdin, revs), daemon=True
+        )
+        writer.start()
+        while chunk := proc.stdout.read(1 << 20):
+            yield chunk
+        writer.join()
+
+        if proc.wait() != 0:
+            raise LookupError(f"Git command failed: git {args}")
+
+
+def _write_revs(stdin: tp.IO[str], revs: tp.Iterable[str]) -> None:
+    try:
+        for rev in revs:
+            stdin.write(f"{rev}\n")
+        stdin.close()
+    except BrokenPipeError:
+        # git exited early, which is reported by its return code
+        pass
+
+
+CommitDataTy = tp.TypeVar("CommitDataTy")
+
+
+class _IncrementalCommitStore(abc.ABC, tp.Generic[CommitDataTy]):
+    """
+    Base class for data about every commit of a repository.
+
+    The data of all commits reachable from the references of the repository is
+    read in bulk with a single streamed ``git log``, which is extended
+    incrementally with the commits that are not reachable from the references
+    that were already read. If a store path is given, the data is persisted so
+    that later processes only need to read new commits.
+    """
+
+    _RECORD_SEPARATOR = "\x01"
+
+    def __init__(
+        self,
+        repo: RepositoryHandle,
+        store_path: tp.Optional[Path] = None,
+        version: int = 1
+    ):
+        self._repo = repo
+        self.__store_path = store_path
+        self.__version = version
+        self.__known_tips: tp.Set[str] = set()
+        self._commits: tp.Dict[str, CommitDataTy] = {}
+        self.__load()
+
+    @abc.abstractmethod
+    def _get_log_args(self) -> tp.List[str]:
+        """Arguments for ``git log --stdin`` that print one record per commit,
+        separated by ``_RECORD_SEPARATOR``."""
+
+    @abc.abstractmethod
+    def _add_log_record(
+        self, record: str, commits: tp.Dict[str, CommitDataTy]
+    ) -> None:
+        """Parse a record of the ``git log`` output into ``commits``."""
+
+    def _get_default_commit_data(self) -> tp.Optional[CommitDataTy]:
+        """Data for commits without a log record; if ``None``, only commits
+        with a log record are added."""
+        return None
+
+    def _get_commit_data(self, commit_hash: str) -> CommitDataTy:
+        """Get the data of a commit, reading new commits if necessary."""
+        if commit_hash not in self._commits:
+            self._update([commit_hash])
+            if commit_hash not in self._commits:
+                raise LookupError(
+                    f"Could not find commit {commit_hash} in "
+                    f"{self._repo.repo_name}."
+                )
+        return self._commits[commit_hash]
+
+    def _update(self, extra_revs: tp.List[str]) -> None:
+        """Add all commits reachable from the references or ``extra_revs`` that
+        are not yet part of the store."""
+        tips = set(self._repo("rev-parse", "--all").split())
+        tips.update(extra_revs)
+        revs = [*tips, *(f"^{tip}" for tip in self.__known_tips)]
+
+        commits: tp.Dict[str, CommitDataTy] = {}
+        default_commit_data = self._get_default_commit_data()
+        if default_commit_data is not None:
+            rev_list = "".join(
+                _stream_git_with_stdin(
+                    self._repo, ["rev-list", "--stdin"], revs
+                )
+            )
+            commits = dict.fromkeys(rev_list.split(), default_commit_data)
+
+        pending = ""
+        for chunk in _stream_git_with_stdin(
+            self._repo, ["log", "--stdin", *self._get_log_args()], revs
+        ):
+            pending += chunk
+            *records, pending = pending.split(self._RECORD_SEPARATOR)
+            for record in records:
+                if record:
+                    self._add_log_record(record, commits)
+        if pending:
+            self._add_log_record(pending, commits)
+
+        self._commits.update(commits)
+        self.__known_tips.update(tips)
+        self.__store()
+
+    def __load(self) -> None:
+        if self.__store_path is None or not self.__store_path.exists():
+            return
+
+        try:
+            with open(self.__store_path, "rb") as store_file:
+                version, known_tips, commits = pickle.load(store_file)
+            if version == self.__version:
+                self.__known_tips = known_tips
+                self._commits = commits
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+            LOG.warning(f"Could not load commit store {self.__store_path}.")
+
+    def __store(self) -> None:
+        if self.__store_path is None:
+            return
+
+        self.__store_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.__store_path.parent, delete=False
+        ) as tmp_file:
+            pickle.dump((self.__version, self.__known_tips, self._commits),
+                        tmp_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file.name, self.__store_path)
+
+
+@dataclass(frozen=True)
+class CommitMetadata():
+    """Metadata of a commit that is needed by most commit analyses."""
+
+    author_name: str
+    author_email: str
+    commit_time: int
+    parents: tp.Tuple[FullCommitHash, ...]
+
+
+CommitMetadataLookupTy = tp.Callable[[CommitRepoPair], CommitMetadata]
+
+
+class CommitMetadataCache(_IncrementalCommitStore[CommitMetadata]):
+    """
+    Cache for the metadata of all commits of a repository.
+
+    The metadata of all commits reachable from the references of the
+    repository is read in bulk with a single ``git log``, which is extended
+    incrementally when unknown commits are requested.
+    """
+
+    _RECORD_SEPARATOR = "\0"
+
+    __caches: tp.Dict[Path, 'CommitMetadataCache'] = {}
+
+    @classmethod
+    def get(cls, repo: RepositoryHandle) -> 'CommitMetadataCache':
+        """
+        Get the metadata cache of a repository, which is shared by all users
+        within a process.
+
+        Args:
+            repo: git repository handle
+
+        Returns:
+            the commit metadata cache
+        """
+        key = repo.repo_path.absolute()
+        if key not in cls.__caches:
+            cls.__caches[key] = CommitMetadataCache(repo)
+        return cls.__caches[key]
+
+    def __getitem__(self, commit_hash: FullCommitHash) -> CommitMetadata:
+        return self._get_commit_data(commit_hash.hash)
+
+    def _get_log_args(self) -> tp.List[str]:
+        return ["-z", "--format=%H%x1f%an%x1f%ae%x1f%ct%x1f%P"]
+
+    def _add_log_record(
+        self, record: str, commits: tp.Dict[str, CommitMetadata]
+    ) -> None:
+        commit_hash, author_name, author_email, commit_time, parents = \
+            record.split("\x1f")
+        commits[commit_hash] = CommitMetadata(
+            author_name, author_email, int(commit_time),
+            tuple(FullCommitHash(parent) for parent in parents.split())
+        )
+
+
 GIT_LOG_MATCHER = re.compile(
     r"\'(?P<hash>.*)\'\n?" + r"( (?P<files>\d*) files? changed)?" +
     r"(, (?P<insertions>\d*) insertions?\(\+\))?" +
@@ -674,6 +923,356 @@ GIT_DIFF_MATCHER = re.compile(
     r"(, (?P<deletions>\d*) deletions?\(-\))?"
 )
 
+FileChurnTy = tp.Tuple[str, int, int]
+ChurnTy = tp.Tuple[int, int, int]
+
+_CODE_CHURN_STORE_VERSION = 1
+_SOURCE_CODE_COMMIT_STORE_VERSION = 1
+
+
+def _parse_numstat_records(
+    tokens: tp.Iterator[str]
+) -> tp.Iterator[tp.Union[str, FileChurnTy]]:
+    """
+    Parse the tokens of NUL-separated ``--numstat -z`` output.
+
+    Yields file churn triples for numstat records and the raw token for
+    everything else, e.g., commit hashes printed by ``git diff-tree``.
+    Binary files are counted as changed files without insertions or
+    deletions.
+    """
+    for token in tokens:
+        if not token:
+            continue
+        if "\t" not in token:
+            yield token
+            continue
+
+        insertions, deletions, path = token.split("\t", 2)
+        if not path:
+            # renames list the old and the new path as separate tokens
+            next(tokens)
+            path = next(tokens)
+        yield (
+            path, int(insertions) if insertions != "-" else 0,
+            int(deletions) if deletions != "-" else 0
+        )
+
+
+def _sum_file_churn(file_churn: tp.Iterable[FileChurnTy]) -> ChurnTy:
+    files_changed = insertions = deletions = 0
+    for _, file_insertions, file_deletions in file_churn:
+        files_changed += 1
+        insertions += file_insertions
+        deletions += file_deletions
+    return files_changed, insertions, deletions
+
+
+def _get_commit_store_path(
+    store_name: str, repo: RepositoryHandle, pathspec: tp.List[str]
+) -> Path:
+    store_key = hashlib.sha256(
+        "\n".join([str(repo.repo_path.absolute()), *pathspec]).encode()
+    ).hexdigest()
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / store_name / f"{store_key}.pickle"
+
+
+class CodeChurnStore(_IncrementalCommitStore[tp.Tuple[FileChurnTy, ...]]):
+    """
+    Persistent store of the code churn of a repository for one churn config.
+
+    The per-file churn of all commits is computed with a single streamed ``git
+    log --numstat`` over the whole history and extended incrementally when
+    new commits show up. Churn between pairs of commits is computed in batches
+    with a single ``git diff-tree --stdin`` invocation. Both are stored in the
+    data cache, so churn queries are answered without calling git again.
+    """
+
+    __stores: tp.Dict[tp.Tuple[Path, tp.Tuple[str, ...]], 'CodeChurnStore'] = {}
+
+    def __init__(self, repo: RepositoryHandle, churn_config: 'ChurnConfig'):
+        self.__pathspec = churn_config.get_extensions_repr('*.')
+        store_path = _get_commit_store_path("code_churn", repo, self.__pathspec)
+        super().__init__(repo, store_path, _CODE_CHURN_STORE_VERSION)
+
+        self.__pairs_path = store_path.with_suffix(".pairs")
+        self.__pairs: tp.Dict[tp.Tuple[str, str], ChurnTy] = {}
+        self.__load_pairs()
+
+    @classmethod
+    def get(
+        cls, repo: RepositoryHandle, churn_config: 'ChurnConfig'
+    ) -> 'CodeChurnStore':
+        """
+        Get the churn store of a repository and churn config, which is shared
+        by all users within a process.
+
+        Args:
+            repo: git repository handle
+            churn_config: churn config to customize churn generation
+
+        Returns:
+            the churn store
+        """
+        key = (
+            repo.repo_path.absolute(),
+            tuple(churn_config.get_extensions_repr())
+        )
+        if key not in cls.__stores:
+            cls.__stores[key] = CodeChurnStore(repo, churn_config)
+        return cls.__stores[key]
+
+    def commit_file_churn(
+        self, commit_hash: FullCommitHash
+    ) -> tp.Tuple[FileChurnTy, ...]:
+        """
+        Get the churn of every file changed by a commit.
+
+        Args:
+            commit_hash: commit hash to get churn for
+
+        Returns:
+            tuples of (path, insertions, deletions)
+        """
+        return self._get_commit_data(commit_hash.hash)
+
+    def commit_churn(self, commit_hash: FullCommitHash) -> ChurnTy:
+        """
+        Get the churn of a commit.
+
+        Args:
+            commit_hash: commit hash to get churn for
+
+        Returns:
+            churn triple (files changed, insertions, deletions)
+        """
+        return _sum_file_churn(self.commit_file_churn(commit_hash))
+
+    def range_churn(
+        self,
+        start_range: tp.Optional[FullCommitHash] = None,
+        end_range: tp.Optional[FullCommitHash] = None
+    ) -> tp.Dict[FullCommitHash, ChurnTy]:
+        """
+        Get the churn of all commits in the range [start..end].
+
+        Args:
+            start_range: first commit of the range; all ancestors of end are
+                         included if not given
+            end_range: last commit of the range, HEAD if not given
+
+        Returns:
+            dict of churn triples, where the commit hash points to
+            (files changed, insertions, deletions)
+        """
+        pygit_repo = self._repo.pygit_repo
+        end_oid = pygit_repo.revparse_single(
+            end_range.hash if end_range else "HEAD"
+        ).peel(pygit2.Commit).id
+        walker = pygit_repo.walk(end_oid)
+        if start_range is not None:
+            start_commit = pygit_repo.get(start_range.hash)
+            if start_commit.parent_ids:
+                walker.hide(start_commit.parent_ids[0])
+
+        revs = [str(commit.id) for commit in walker]
+        if any(rev not in self._commits for rev in revs):
+            self._update([str(end_oid)])
+
+        return {
+            FullCommitHash(rev): _sum_file_churn(self._commits[rev])
+            for rev in revs
+        }
+
+    def pair_churn(
+        self, commit_a: FullCommitHash, commit_b: FullCommitHash
+    ) -> ChurnTy:
+        """
+        Get the churn between two commits.
+
+        Args:
+            commit_a: base commit for diff calculation
+            commit_b: target commit for diff calculation
+
+        Returns:
+            churn triple (files changed, insertions, deletions)
+        """
+        return self.pair_churns([(commit_a, commit_b)])[(commit_a, commit_b)]
+
+    def pair_churns(
+        self, pairs: tp.Iterable[tp.Tuple[FullCommitHash, FullCommitHash]]
+    ) -> tp.Dict[tp.Tuple[FullCommitHash, FullCommitHash], ChurnTy]:
+        """
+        Get the churn between multiple pairs of commits, computing all missing
+        pairs with a single git invocation.
+
+        Args:
+            pairs: pairs of base and target commits
+
+        Returns:
+            dict of churn triples, where the pair points to
+            (files changed, insertions, deletions)
+        """
+        pairs = list(pairs)
+        missing = list(
+            dict.fromkeys((commit_a.hash, commit_b.hash)
+                          for commit_a, commit_b in pairs
+                          if (commit_a.hash, commit_b.hash) not in self.__pairs)
+        )
+        if missing:
+            self.__add_pairs(missing)
+
+        return {(commit_a, commit_b):
+                self.__pairs[(commit_a.hash, commit_b.hash)]
+                for commit_a, commit_b in pairs}
+
+    def _get_log_args(self) -> tp.List[str]:
+        return [
+            "--full-history", "--numstat", "-z", "-l0",
+            "--pretty=format:%x01%H", "--", *self.__pathspec
+        ]
+
+    def _get_default_commit_data(self) -> tp.Tuple[FileChurnTy, ...]:
+        return ()
+
+    def _add_log_record(
+        self, record: str, commits: tp.Dict[str, tp.Tuple[FileChurnTy, ...]]
+    ) -> None:
+        commit_hash, _, numstat = record.partition("\n")
+        commits[commit_hash[:_FULL_COMMIT_HASH_LENGTH]] = tuple(
+            tp.cast(FileChurnTy, numstat_record) for numstat_record in
+            _parse_numstat_records(iter(numstat.split("\0")))
+        )
+
+    def __add_pairs(self, pairs: tp.List[tp.Tuple[str, str]]) -> None:
+        """Compute the churn between pairs of commits."""
+        output = "".join(
+            _stream_git_with_stdin(
+                self._repo, [
+                    "diff-tree", "--stdin", "--always", "-r", "-M", "-l0",
+                    "--numstat", "-z", "--", *self.__pathspec
+                ], (f"{commit_b} {commit_a}" for commit_a, commit_b in pairs)
+            )
+        )
+
+        # diff-tree prints the target commit of each input line, followed by
+        # the numstat records of its diff
+        pair_iter = iter(pairs)
+        current_pair: tp.Optional[tp.Tuple[str, str]] = None
+        file_churn: tp.List[FileChurnTy] = []
+        new_pairs: tp.Dict[tp.Tuple[str, str], ChurnTy] = {}
+        for record in _parse_numstat_records(iter(output.split("\0"))):
+            if isinstance(record, str):
+                if current_pair is not None:
+                    new_pairs[current_pair] = _sum_file_churn(file_churn)
+                current_pair = next(pair_iter)
+                file_churn = []
+            else:
+                file_churn.append(record)
+        if current_pair is not None:
+            new_pairs[current_pair] = _sum_file_churn(file_churn)
+
+        self.__pairs.update(new_pairs)
+        self.__pairs_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.__pairs_path, "a") as pairs_file:
+            pairs_file.write(
+                "".join(
+                    f"{commit_a} {commit_b} {churn[0]} {churn[1]} "
+                    f"{churn[2]}\n"
+                    for (commit_a, commit_b), churn in new_pairs.items()
+                )
+            )
+
+    def __load_pairs(self) -> None:
+        if not self.__pairs_path.exists():
+            return
+
+        with open(self.__pairs_path, "r") as pairs_file:
+            for line in pairs_file:
+                fields = line.split()
+                if len(fields) == 5:
+                    commit_a, commit_b, *churn = fields
+                    self.__pairs[
+                        (commit_a, commit_b)
+                    ] = (int(churn[0]), int(churn[1]), int(churn[2]))
+
+
+class SourceCodeCommitStore(_IncrementalCommitStore[bool]):
+    """
+    Persistent store that classifies all commits of a repository by whether
+    they change files selected by a churn config.
+
+    All commits are classified with a single streamed ``git log --name-only``
+    over the whole history, which is extended incrementally when new commits
+    show up. Merge commits are compared against each of their parents.
+    """
+
+    __stores: tp.Dict[tp.Tuple[Path, tp.Tuple[str, ...]],
+                      'SourceCodeCommitStore'] = {}
+
+    def __init__(self, repo: RepositoryHandle, churn_config: 'ChurnConfig'):
+        self.__pathspec = churn_config.get_extensions_repr('*.')
+        super().__init__(
+            repo,
+            _get_commit_store_path(
+                "source_code_commits", repo, self.__pathspec
+            ), _SOURCE_CODE_COMMIT_STORE_VERSION
+        )
+
+    @classmethod
+    def get(
+        cls, repo: RepositoryHandle, churn_config: 'ChurnConfig'
+    ) -> 'SourceCodeCommitStore':
+        """
+        Get the source code commit store of a repository and churn config,
+        which is shared by all users within a process.
+
+        Args:
+            repo: git repository handle
+            churn_config: to specify the files that should be considered
+
+        Returns:
+            the source code commit store
+        """
+        key = (
+            repo.repo_path.absolute(),
+            tuple(churn_config.get_extensions_repr())
+        )
+        if key not in cls.__stores:
+            cls.__stores[key] = SourceCodeCommitStore(repo, churn_config)
+        return cls.__stores[key]
+
+    def contains_source_code(self, commit_hash: FullCommitHash) -> bool:
+        """
+        Check if a commit changes source code of any language specified with
+        the churn config.
+
+        Args:
+            commit_hash: commit to check
+
+        Returns: True, if source code of a language, specified in the churn
+            config, was changed by the commit
+        """
+        return self._get_commit_data(commit_hash.hash)
+
+    def _get_log_args(self) -> tp.List[str]:
+        # with -m, merges are listed once per parent, so a merge is a source
+        # code commit if it changes source files with respect to any parent
+        return [
+            "--full-history", "-m", "--name-only", "-z",
+            "--pretty=format:%x01%H", "--", *self.__pathspec
+        ]
+
+    def _get_default_commit_data(self) -> bool:
+        return False
+
+    def _add_log_record(self, record: str, commits: tp.Dict[str, bool]) -> None:
+        commit_hash, _, file_names = record.partition("\n")
+        if file_names.strip("\0\n"):
+            commits[commit_hash[:_FULL_COMMIT_HASH_LENGTH]] = True
+
 
 def __calc_code_churn_range_impl(
     repo: RepositoryHandle,
@@ -687,61 +1286,14 @@ def __calc_code_churn_range_impl(
     [start..end]. If no range is supplied, the churn values of all commits are
     calculated.
 
-    git log --pretty=format:'%H' --date=short --shortstat -- ':*.[enabled_exts]'
-
     Args:
         repo: git repository handle
         churn_config: churn config to customize churn generation
         start_range: begin churn calculation at start commit
         end_range: end churn calculation at end commit
     """
-
-    churn_values: tp.Dict[FullCommitHash, tp.Tuple[int, int, int]] = {}
-    if start_range and start_range == get_initial_commit(repo):
-        start_range = None
-
-    if start_range is None and end_range is None:
-        revision_range = None
-    elif start_range is None:
-        revision_range = f"{end_range.hash}"  # type: ignore
-    elif end_range is None:
-        revision_range = f"{start_range.hash}~.."
-    else:
-        revision_range = f"{start_range.hash}~..{end_range.hash}"
-
-    log_base_params = ["log", "--pretty=%H"]
-    diff_base_params = ["log", "--pretty=format:'%H'", "--shortstat", "-l0"]
-    if revision_range:
-        log_base_params.append(revision_range)
-        diff_base_params.append(revision_range)
-
-    if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regex to select files that git includes into churn calc
-        diff_base_params = diff_base_params + \
-                           churn_config.get_extensions_repr('*.')
-
-    stdout = repo(diff_base_params)
-    revs = repo(log_base_params).strip().split()
-
-    # initialize with 0 as otherwise commits without changes would be
-    # missing from the churn data
-    for rev in revs:
-        churn_values[FullCommitHash(rev)] = (0, 0, 0)
-    for match in GIT_LOG_MATCHER.finditer(stdout):
-        commit_hash = FullCommitHash(match.group('hash'))
-
-        def value_or_zero(match_result: tp.Any) -> int:
-            if match_result is not None:
-                return int(match_result)
-            return 0
-
-        files_changed = value_or_zero(match.group('files'))
-        insertions = value_or_zero(match.group('insertions'))
-        deletions = value_or_zero(match.group('deletions'))
-        churn_values[commit_hash] = (files_changed, insertions, deletions)
-
-    return churn_values
+    return CodeChurnStore.get(repo,
+                              churn_config).range_churn(start_range, end_range)
 
 
 def calc_code_churn_range(
@@ -788,8 +1340,7 @@ def calc_commit_code_churn(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
-    return calc_code_churn_range(repo, churn_config, commit_hash,
-                                 commit_hash)[commit_hash]
+    return CodeChurnStore.get(repo, churn_config).commit_churn(commit_hash)
 
 
 def calc_code_churn(
@@ -812,32 +1363,28 @@ def calc_code_churn(
         (files changed, insertions, deletions)
     """
     churn_config = ChurnConfig.init_as_default_if_none(churn_config)
-    diff_base_params = [
-        "diff", "--shortstat", "-l0", commit_a.hash, commit_b.hash
-    ]
+    return CodeChurnStore.get(repo, churn_config).pair_churn(commit_a, commit_b)
 
-    if not churn_config.include_everything:
-        diff_base_params.append("--")
-        # builds a regex to select files that git includes into churn calc
-        diff_base_params = diff_base_params + \
-                           churn_config.get_extensions_repr('*.')
 
-    stdout = repo(*diff_base_params)
-    # initialize with 0 as otherwise commits without changes would be
-    # missing from the churn data
-    if match := GIT_DIFF_MATCHER.match(stdout):
-
-        def value_or_zero(match_result: tp.Any) -> int:
-            if match_result is not None:
-                return int(match_result)
-            return 0
+def calc_code_churn_pairs(
+    repo: RepositoryHandle,
+    commit_pairs: tp.Iterable[tp.Tuple[FullCommitHash, FullCommitHash]],
+    churn_config: tp.Optional[ChurnConfig] = None
+) -> tp.Dict[tp.Tuple[FullCommitHash, FullCommitHash], tp.Tuple[int, int, int]]:
+    """
+    Calculates churn between multiple pairs of commits at once.
 
-        files_changed = value_or_zero(match.group('files'))
-        insertions = value_or_zero(match.group('insertions'))
-        deletions = value_or_zero(match.group('deletions'))
-        return files_changed, insertions, deletions
+    Args:
+        repo: git repository handle
+        commit_pairs: pairs of base and target commits for diff calculation
+        churn_config: churn config to customize churn generation
 
-    return 0, 0, 0
+    Returns:
+        dict of churn triples, where each commit pair points to
+        (files changed, insertions, deletions)
+    """
+    churn_config = ChurnConfig.init_as_default_if_none(churn_config)
+    return CodeChurnStore.get(repo, churn_config).pair_churns(commit_pairs)
 
 
 def calc_repo_code_churn(
@@ -907,36 +1454,81 @@ def __print_calc_repo_code_churn(
             print()
 
 
-def calc_repo_loc(repo: RepositoryHandle, rev_range: str) -> int:
+def _calc_blob_loc(
+    blob: pygit2.Blob, blob_locs: tp.Dict[pygit2.Oid, int]
+) -> int:
+    """Count the non-empty lines of a blob, like splitting the output of ``git
+    show`` into lines would."""
+    if blob.id not in blob_locs:
+        lines = blob.data.decode("utf-8", "ignore").splitlines()
+        blob_locs[blob.id] = len(lines) - lines.count("")
+    return blob_locs[blob.id]
+
+
+def _calc_tree_loc(
+    pygit_repo: pygit2.Repository, tree: pygit2.Tree,
+    file_pattern: tp.Pattern[str], tree_locs: tp.Dict[pygit2.Oid, int],
+    blob_locs: tp.Dict[pygit2.Oid, int]
+) -> int:
+    if tree.id not in tree_locs:
+        loc = 0
+        for entry in tree:
+            if entry.type_str == "tree":
+                loc += _calc_tree_loc(
+                    pygit_repo, pygit_repo[entry.id], file_pattern, tree_locs,
+                    blob_locs
+                )
+            elif entry.type_str == "blob" and file_pattern.match(entry.name):
+                loc += _calc_blob_loc(pygit_repo[entry.id], blob_locs)
+        tree_locs[tree.id] = loc
+    return tree_locs[tree.id]
+
+
+def calc_repo_locs(repo: RepositoryHandle,
+                   revisions: tp.Iterable[str]) -> tp.Dict[str, int]:
     """
-    Calculate the LOC for a repository.
+    Calculate the LOC for a repository at multiple revisions.
+
+    Blobs are read directly from the object database. During a call, line
+    counts are cached per blob and per tree, so files and folders that did not
+    change between the revisions are only counted once.
 
     Args:
         repo: handle for the repository to calculate the LOC for
-        rev_range: the revision range to use for LOC calculation
+        revisions: the revisions to calculate the LOC at
 
     Returns:
-        the number of lines in source-code files
+        the number of lines in source-code files for every revision
     """
     churn_config = ChurnConfig.create_c_style_languages_config()
     file_pattern = re.compile(
         "|".join(churn_config.get_extensions_repr(r"^.*\.", r"$"))
     )
+    pygit_repo = repo.pygit_repo
+    tree_locs: tp.Dict[pygit2.Oid, int] = {}
+    blob_locs: tp.Dict[pygit2.Oid, int] = {}
 
-    loc: int = 0
-    files = repo(
-        "ls-tree",
-        "-r",
-        "--name-only",
-        rev_range,
-    ).splitlines()
+    return {
+        revision: _calc_tree_loc(
+            pygit_repo,
+            pygit_repo.revparse_single(revision).peel(pygit2.Tree),
+            file_pattern, tree_locs, blob_locs
+        ) for revision in revisions
+    }
 
-    for file in files:
-        if file_pattern.match(file):
-            lines = repo("show", f"{rev_range}:{file}").splitlines()
-            loc += len([line for line in lines if line])
 
-    return loc
+def calc_repo_loc(repo: RepositoryHandle, rev_range: str) -> int:
+    """
+    Calculate the LOC for a repository.
+
+    Args:
+        repo: handle for the repository to calculate the LOC for
+        rev_range: the revision range to use for LOC calculation
+
+    Returns:
+        the number of lines in source-code files
+    """
+    return calc_repo_locs(repo, [rev_range])[rev_range]
 
 
 ################################################################################
@@ -0,0 +1,231 @@
+"""
+Module for manifests of registries that are filled by importing modules.
+
+Classes like plot generators, projects, or reports register themselves when the
+module defining them is imported. Looking up a single class by its name
+therefore requires to import all modules of a package, which drags in many heavy
+dependencies. A registry manifest maps the names of the classes registered by a
+package to the modules that define them, together with the information that
+command line tools show about them. It is created by statically analyzing
+the package's source files, so that only the module of the requested class
+needs to be imported. Manifests are persisted in the data cache and rebuilt
+automatically when a source file of the package changes.
+"""
+
+import ast
+import json
+import logging
+import os
+import types
+import typing as tp
+from dataclasses import dataclass
+from pathlib import Path
+
+from varats.utils.settings import vara_cfg
+
+LOG = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 2
+
+
+@dataclass(frozen=True)
+class RegistryEntry():
+    """Entry of a registry manifest for a registered class."""
+
+    module_name: str
+    class_name: str
+    help: str
+
+
+RegistryManifestTy = tp.Dict[str, RegistryEntry]
+
+__MANIFESTS: tp.Dict[tp.Tuple[str, str, bool], RegistryManifestTy] = {}
+
+
+def _get_source_files(
+    package: types.ModuleType
+) -> tp.List[tp.Tuple[str, Path]]:
+    """Collect all source files of a package together with their module
+    names."""
+    source_files: tp.List[tp.Tuple[str, Path]] = []
+    for package_path in map(Path, package.__path__):
+        for source_file in sorted(package_path.rglob("*.py")):
+            module_path = source_file.relative_to(package_path).with_suffix("")
+            if module_path.name == "__init__":
+                module_path = module_path.parent
+            module_name = ".".join((package.__name__,) + module_path.parts)
+            source_files.append((module_name, source_file))
+    return source_files
+
+
+def _get_sources_state(
+    source_files: tp.List[tp.Tuple[str, Path]]
+) -> tp.List[tp.List[tp.Union[str, int]]]:
+    """Names, sizes, and modification times of all source files, which
+    determine whether a manifest is still up to date."""
+    sources_state: tp.List[tp.List[tp.Union[str, int]]] = []
+    for _, source_file in source_files:
+        file_stat = source_file.stat()
+        sources_state.append([
+            str(source_file), file_stat.st_size, file_stat.st_mtime_ns
+        ])
+    return sources_state
+
+
+def _get_registered_value(node: ast.ClassDef,
+                          keyword: str) -> tp.Optional[ast.expr]:
+    """Get the value a class passes as class keyword or assigns to a class
+    attribute with the given name."""
+    for class_keyword in node.keywords:
+        if class_keyword.arg == keyword:
+            return class_keyword.value
+
+    for statement in node.body:
+        if isinstance(statement, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == keyword
+            for target in statement.targets
+        ):
+            return statement.value
+        if isinstance(statement, ast.AnnAssign) and isinstance(
+            statement.target, ast.Name
+        ) and statement.target.id == keyword:
+            return statement.value
+    return None
+
+
+def _get_registered_classes(
+    source_file: Path, keyword: str, key_by_class_name: bool
+) -> tp.List[tp.Tuple[str, str, str]]:
+    """
+    Find all classes in a source file that are registered via a class keyword,
+    e.g., ``class Foo(Base, generator_name="foo")``, or a class attribute, e.g.,
+    ``NAME = "foo"``.
+
+    Classes are registered under the value of the keyword, which can only be
+    found if it is a string literal, or under their class name.
+
+    Returns:
+        the registered name, the class name, and the summary line of the class
+        docstring of every registered class
+    """
+    try:
+        tree = ast.parse(source_file.read_text(), str(source_file))
+    except (SyntaxError, UnicodeDecodeError) as exc:
+        LOG.warning(f"Could not parse {source_file}: {exc}")
+        return []
+
+    registered_classes: tp.List[tp.Tuple[str, str, str]] = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        value = _get_registered_value(node, keyword)
+        if key_by_class_name and value is not None:
+            name = node.name
+        elif isinstance(value, ast.Constant) and isinstance(value.value, str):
+            name = value.value
+        else:
+            continue
+
+        docstring = ast.get_docstring(node) or ""
+        registered_classes.append(
+            (name, node.name, " ".join(docstring.split("\n\n")[0].split()))
+        )
+    return registered_classes
+
+
+def _get_manifest_path(
+    package: types.ModuleType, keyword: str, key_by_class_name: bool
+) -> Path:
+    key = "class_name" if key_by_class_name else keyword
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / f"registry_manifest-{package.__name__}-{keyword}-{key}.json"
+
+
+def _load_persisted_manifest(
+    manifest_path: Path, sources_state: tp.List[tp.List[tp.Union[str, int]]]
+) -> tp.Optional[RegistryManifestTy]:
+    if not manifest_path.exists():
+        return None
+
+    try:
+        with open(manifest_path, "r") as manifest_file:
+            persisted_manifest = json.load(manifest_file)
+    except (OSError, ValueError) as exc:
+        LOG.warning(f"Could not load registry manifest {manifest_path}: {exc}")
+        return None
+
+    if persisted_manifest.get("version") != _MANIFEST_VERSION or \
+            persisted_manifest.get("sources") != sources_state:
+        return None
+    return {
+        name: RegistryEntry(*entry)
+        for name, entry in persisted_manifest["manifest"].items()
+    }
+
+
+def _persist_manifest(
+    manifest_path: Path, sources_state: tp.List[tp.List[tp.Union[str, int]]],
+    manifest: RegistryManifestTy
+) -> None:
+    if not manifest_path.parent.exists():
+        return
+
+    tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w") as manifest_file:
+            json.dump({
+                "version": _MANIFEST_VERSION,
+                "sources": sources_state,
+                "manifest": {
+                    name: [entry.module_name, entry.class_name, entry.help]
+                    for name, entry in manifest.items()
+                }
+            }, manifest_file)
+        tmp_path.replace(manifest_path)
+    except OSError as exc:
+        LOG.debug(f"Could not store registry manifest {manifest_path}: {exc}")
+
+
+def get_registry_manifest(
+    package: types.ModuleType,
+    keyword: str,
+    key_by_class_name: bool = False
+) -> RegistryManifestTy:
+    """
+    Get the manifest that maps the names of all classes registered by the
+    modules of a package to the modules that define them.
+
+    Args:
+        package: the package whose modules register classes
+        keyword: class keyword or class attribute that holds the name a class
+                 is registered under, e.g., ``generator_name``
+        key_by_class_name: whether classes that set the keyword are registered
+                           under their class name instead of its value
+
+    Returns:
+        a dict mapping registered names to manifest entries
+    """
+    registry_key = (package.__name__, keyword, key_by_class_name)
+    if registry_key in __MANIFESTS:
+        return __MANIFESTS[registry_key]
+
+    source_files = _get_source_files(package)
+    sources_state = _get_sources_state(source_files)
+    manifest_path = _get_manifest_path(package, keyword, key_by_class_name)
+
+    manifest = _load_persisted_manifest(manifest_path, sources_state)
+    if manifest is None:
+        manifest = {}
+        for module_name, source_file in source_files:
+            for name, class_name, help_text in _get_registered_classes(
+                source_file, keyword, key_by_class_name
+            ):
+                manifest.setdefault(
+                    name, RegistryEntry(module_name, class_name, help_text)
+                )
+        _persist_manifest(manifest_path, sources_state, manifest)
+
+    __MANIFESTS[registry_key] = manifest
+    return manifest
@@ -191,6 +191,67 @@ def create_new_varats_config() -> s.Configuration:
         },
     }
 
+    cfg['data_cache_settings'] = {
+        "format": {
+            "desc":
+                "Storage format of cached dataframes in the data cache. "
+                "Supported formats: csv, parquet, feather.",
+            "default": "csv",
+        },
+        "max_segments": {
+            "desc":
+                "Maximum number of incremental update segments of a cache "
+                "file before they are compacted into a single file.",
+            "default": 16,
+        },
+        "jobs": {
+            "desc":
+                "Number of worker processes used to create the entries of "
+                "cached report tables. 0 uses all available cores.",
+            "default": 1,
+        },
+        "compile_blame_reports": {
+            "desc":
+                "Store parsed blame reports in a compact binary format in the "
+                "data cache to speed up loading them again.",
+            "default": False,
+        },
+        "persist_commit_maps": {
+            "desc":
+                "Store generated commit maps in the data cache and reuse them "
+                "as long as the references of the repository do not change.",
+            "default": True,
+        },
+        "persist_author_maps": {
+            "desc":
+                "Store generated author maps in the data cache and reuse them "
+                "as long as the references of the repository do not change.",
+            "default": True,
+        },
+    }
+
+    cfg['data_manager'] = {
+        "max_entries": {
+            "desc":
+                "Maximum number of loaded files kept in memory by the data "
+                "manager. 0 means unlimited.",
+            "default": 0,
+        },
+        "max_bytes": {
+            "desc":
+                "Maximum accumulated size of the loaded files kept in memory "
+                "by the data manager. 0 means unlimited.",
+            "default": 0,
+        },
+        "key_mode": {
+            "desc":
+                "How the data manager identifies loaded files: 'stat' (path, "
+                "size, mtime, and inode), 'sampled' (stat and a hash of a few "
+                "blocks of the file), or 'sha256' (hash of the whole file).",
+            "default": "stat",
+        },
+    }
+
     cfg['plots'] = {
         "plot_dir": {
             "desc": "Folder for generated plots",
@@ -30,6 +30,7 @@ setup(
         "pandas>=1.5.3",
         "plotly>=5.13.1",
         "plumbum>=1.6",
+        "pyarrow>=11.0.0",
         "pygit2>=1.10,<1.14.0",
         "PyGithub>=1.47",
         "pygraphviz>=1.7",
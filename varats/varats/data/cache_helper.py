@@ -1,7 +1,12 @@
 """Utility functions and class to allow easier caching of pandas dataframes and
 other data."""
+import abc
+import glob
 import logging
+import multiprocessing
+import os
 import pickle
+import traceback
 import typing as tp
 from pathlib import Path
 
@@ -16,6 +21,190 @@ CACHE_ID_COL = 'cache_revision'
 CACHE_TIMESTAMP_COL = 'cache_timestamp'
 
 
+class DataFrameCacheBackend(abc.ABC):
+    """
+    Storage backend for cached dataframes.
+
+    A backend defines the on-disk format of a cache file, i.e., how a dataframe
+    is persisted and read back in.
+    """
+
+    NAME: str
+    FILE_SUFFIX: str
+    COLUMNAR: bool
+
+    @classmethod
+    def __init_subclass__(
+        cls,
+        *args: tp.Any,
+        name: str,
+        file_suffix: str,
+        columnar: bool = False,
+        **kwargs: tp.Any
+    ) -> None:
+        super().__init_subclass__(*args, **kwargs)
+        cls.NAME = name
+        cls.FILE_SUFFIX = file_suffix
+        cls.COLUMNAR = columnar
+        _CACHE_BACKENDS[name] = cls
+
+    @staticmethod
+    @abc.abstractmethod
+    def read(
+        file_path: Path,
+        data_types: tp.Dict[str, str],
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read a cached dataframe from disk.
+
+        Args:
+            file_path: path to the cache file
+            data_types: dict of columns and types of the dataframe
+            columns: only load these columns if given
+
+        Returns:
+            the loaded dataframe
+        """
+
+    @staticmethod
+    @abc.abstractmethod
+    def write(file_path: Path, dataframe: pd.DataFrame) -> None:
+        """
+        Persist a dataframe to disk.
+
+        Args:
+            file_path: path to the cache file
+            dataframe: pandas dataframe to store
+        """
+
+
+_CACHE_BACKENDS: tp.Dict[str, tp.Type[DataFrameCacheBackend]] = {}
+
+
+def _apply_data_types(
+    dataframe: pd.DataFrame, data_types: tp.Dict[str, str]
+) -> pd.DataFrame:
+    return dataframe.astype({
+        col: col_type
+        for col, col_type in data_types.items()
+        if col in dataframe.columns
+    })
+
+
+class CSVCacheBackend(DataFrameCacheBackend, name="csv", file_suffix=".csv.gz"):
+    """Stores dataframes as gzip compressed csv files."""
+
+    @staticmethod
+    def read(
+        file_path: Path,
+        data_types: tp.Dict[str, str],
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        if columns is None:
+            return pd.read_csv(
+                str(file_path),
+                index_col=0,
+                compression='infer',
+                dtype=data_types
+            )
+
+        # only parse the index and the requested columns
+        header = pd.read_csv(str(file_path), nrows=0, compression='infer')
+        dataframe = pd.read_csv(
+            str(file_path),
+            index_col=0,
+            usecols=[0] + [header.columns.get_loc(col) for col in columns],
+            compression='infer',
+            dtype=data_types
+        )
+        return dataframe[columns]
+
+    @staticmethod
+    def write(file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.to_csv(str(file_path), compression='infer')
+
+
+class ParquetCacheBackend(
+    DataFrameCacheBackend,
+    name="parquet",
+    file_suffix=".parquet",
+    columnar=True
+):
+    """
+    Stores dataframes as parquet files.
+
+    Parquet is a columnar format, i.e., only the requested columns are read
+    from disk, and column types are preserved.
+    """
+
+    @staticmethod
+    def read(
+        file_path: Path,
+        data_types: tp.Dict[str, str],
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        return _apply_data_types(
+            pd.read_parquet(str(file_path), columns=columns), data_types
+        )
+
+    @staticmethod
+    def write(file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.reset_index(drop=True).to_parquet(str(file_path))
+
+
+class FeatherCacheBackend(
+    DataFrameCacheBackend,
+    name="feather",
+    file_suffix=".feather",
+    columnar=True
+):
+    """
+    Stores dataframes as feather (arrow IPC) files.
+
+    Like parquet, feather files support loading only a subset of columns but
+    trade a larger file size for faster loading.
+    """
+
+    @staticmethod
+    def read(
+        file_path: Path,
+        data_types: tp.Dict[str, str],
+        columns: tp.Optional[tp.List[str]] = None
+    ) -> pd.DataFrame:
+        return _apply_data_types(
+            pd.read_feather(str(file_path), columns=columns), data_types
+        )
+
+    @staticmethod
+    def write(file_path: Path, dataframe: pd.DataFrame) -> None:
+        dataframe.reset_index(drop=True).to_feather(str(file_path))
+
+
+def get_cache_backend() -> tp.Type[DataFrameCacheBackend]:
+    """
+    Get the cache backend selected in the varats config.
+
+    Returns:
+        the currently selected cache backend
+    """
+    backend_name = str(vara_cfg()["data_cache_settings"]["format"])
+    if backend_name not in _CACHE_BACKENDS:
+        raise ValueError(
+            f"Unknown data cache format '{backend_name}'. Supported formats: "
+            f"{', '.join(_CACHE_BACKENDS.keys())}"
+        )
+    return _CACHE_BACKENDS[backend_name]
+
+
+def __get_data_file_path_for_backend(
+    data_id: str, project_name: str, backend: tp.Type[DataFrameCacheBackend]
+) -> Path:
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / f"{data_id}-{project_name}{backend.FILE_SUFFIX}"
+
+
 def get_data_file_path(data_id: str, project_name: str) -> Path:
     """
     Compose the identifier and project into a file path that points to the
@@ -25,34 +214,179 @@ def get_data_file_path(data_id: str, project_name: str) -> Path:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
     """
-    return Path(
-        str(vara_cfg()["data_cache"])
-    ) / f"{data_id}-{project_name}.csv.gz"
+    return __get_data_file_path_for_backend(
+        data_id, project_name, get_cache_backend()
+    )
 
 
-def load_cached_df_or_none(
+def __write_cache_file(
+    backend: tp.Type[DataFrameCacheBackend], file_path: Path,
+    dataframe: pd.DataFrame
+) -> None:
+    """
+    Write a cache file atomically, so that processes that concurrently read or
+    write the same cache never see a partially written file.
+
+    The temporary file keeps the backend's suffix as some backends derive
+    their compression from it.
+    """
+    tmp_file_path = file_path.with_name(
+        f".{file_path.name}.{os.getpid()}{backend.FILE_SUFFIX}"
+    )
+    try:
+        backend.write(tmp_file_path, dataframe)
+        os.replace(tmp_file_path, file_path)
+    finally:
+        if tmp_file_path.exists():
+            tmp_file_path.unlink()
+
+
+def __get_segment_file_paths(
+    data_id: str, project_name: str, backend: tp.Type[DataFrameCacheBackend]
+) -> tp.List[Path]:
+    """
+    Get the paths of all update segments of a cache file sorted by their
+    creation order.
+
+    Segments are named ``{data_id}-{project_name}.{num}{suffix}`` and contain
+    entries that were added to a cache after the cache file was last written
+    as a whole.
+    """
+    prefix = f"{data_id}-{project_name}."
+    segments: tp.List[tp.Tuple[int, Path]] = []
+    for path in Path(str(vara_cfg()["data_cache"])
+                    ).glob(f"{glob.escape(prefix)}*{backend.FILE_SUFFIX}"):
+        segment_num = path.name[len(prefix):-len(backend.FILE_SUFFIX)]
+        if segment_num.isdigit():
+            segments.append((int(segment_num), path))
+
+    return [path for _, path in sorted(segments)]
+
+
+def __merge_segments(segments: tp.List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merge a cache file and its update segments.
+
+    Entries of later segments replace all rows with the same cache id of
+    earlier segments.
+    """
+    if len(segments) == 1:
+        return segments[0]
+
+    merged_df = pd.concat(
+        segments, keys=range(len(segments)), names=["__segment", None]
+    ).reset_index(level=0)
+    latest_segment = merged_df.groupby(CACHE_ID_COL
+                                      )["__segment"].transform("max")
+    merged_df = merged_df[merged_df["__segment"] == latest_segment]
+    return merged_df.drop(columns="__segment").reset_index(drop=True)
+
+
+def __read_cache_file(
+    data_id: str, project_name: str, backend: tp.Type[DataFrameCacheBackend],
+    file_path: Path, data_types: tp.Dict[str, str],
+    columns: tp.Optional[tp.List[str]]
+) -> pd.DataFrame:
+    """Read a cache file including all its update segments."""
+    segment_paths = __get_segment_file_paths(data_id, project_name, backend)
+    if not segment_paths:
+        return backend.read(file_path, data_types, columns)
+
+    load_columns = columns
+    if columns is not None and CACHE_ID_COL not in columns:
+        # the cache id is required to merge the segments
+        load_columns = columns + [CACHE_ID_COL]
+
+    merged_df = __merge_segments([
+        backend.read(path, data_types, load_columns)
+        for path in [file_path] + segment_paths
+    ])
+    if columns is not None:
+        return tp.cast(pd.DataFrame, merged_df[columns])
+    return merged_df
+
+
+def __remove_segment_files(
+    data_id: str, project_name: str, backend: tp.Type[DataFrameCacheBackend]
+) -> None:
+    for path in __get_segment_file_paths(data_id, project_name, backend):
+        path.unlink()
+
+
+def __migrate_cache_file(
     data_id: str, project_name: str, data_types: tp.Dict[str, str]
+) -> bool:
+    """
+    Convert a cache file stored in a format other than the currently selected
+    one to the current format.
+
+    Returns:
+        ``True`` if a cache file was migrated
+    """
+    backend = get_cache_backend()
+    for old_backend in _CACHE_BACKENDS.values():
+        if old_backend is backend:
+            continue
+
+        old_file_path = __get_data_file_path_for_backend(
+            data_id, project_name, old_backend
+        )
+        if not old_file_path.exists() and old_backend is CSVCacheBackend:
+            # fall back to uncompressed file if present for seamless migration
+            # to cache file compression
+            old_file_path = Path(str(old_file_path)[:-3])
+
+        if old_file_path.exists():
+            LOG.info(
+                f"Migrating cache file {old_file_path} to format "
+                f"'{backend.NAME}'."
+            )
+            __write_cache_file(
+                backend, get_data_file_path(data_id, project_name),
+                __read_cache_file(
+                    data_id, project_name, old_backend, old_file_path,
+                    data_types, None
+                )
+            )
+            old_file_path.unlink()
+            __remove_segment_files(data_id, project_name, old_backend)
+            return True
+
+    return False
+
+
+def load_cached_df_or_none(
+    data_id: str,
+    project_name: str,
+    data_types: tp.Dict[str, str],
+    columns: tp.Optional[tp.List[str]] = None
 ) -> tp.Optional[pd.DataFrame]:
     """
     Load cached dataframe from disk, otherwise return None.
 
+    Cache files stored in a different format than the one currently selected
+    are transparently converted to the current format.
+
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
         data_types: dict of columns and types to pass to the dataframe loading
+        columns: only load these columns if given
     """
 
     file_path = get_data_file_path(data_id, project_name)
     if not file_path.exists():
-        # fall back to uncompressed file if present for seamless migration
-        # to cache file compression
-        if Path(str(file_path)[:-3]).exists():
+        if get_cache_backend() is CSVCacheBackend and Path(str(file_path)[:-3]
+                                                          ).exists():
+            # fall back to uncompressed file if present for seamless migration
+            # to cache file compression
             file_path = Path(str(file_path)[:-3])
-        else:
+        elif not __migrate_cache_file(data_id, project_name, data_types):
             return None
 
-    return pd.read_csv(
-        str(file_path), index_col=0, compression='infer', dtype=data_types
+    return __read_cache_file(
+        data_id, project_name, get_cache_backend(), file_path, data_types,
+        columns
     )
 
 
@@ -62,13 +396,73 @@ def cache_dataframe(
     """
     Cache a dataframe by persisting it to disk.
 
+    This replaces the cache file as a whole, i.e., all update segments are
+    discarded.
+
     Args:
         data_id: identifier or identifier_name of the dataframe
         project_name: name of the project
         dataframe: pandas dataframe to store
     """
+    backend = get_cache_backend()
+    file_path = get_data_file_path(data_id, project_name)
+    __write_cache_file(backend, file_path, dataframe)
+    __remove_segment_files(data_id, project_name, backend)
+
+
+def append_to_cached_dataframe(
+    data_id: str, project_name: str, dataframe: pd.DataFrame
+) -> None:
+    """
+    Add new or updated entries to an existing cache file without rewriting it.
+
+    The entries are stored as a new update segment. Rows in the segment replace
+    all rows of the cache file and earlier segments with the same
+    ``CACHE_ID_COL``. If the number of segments exceeds the configured maximum,
+    the cache file and all segments are compacted into a single file.
+
+    Args:
+        data_id: identifier or identifier_name of the dataframe
+        project_name: name of the project
+        dataframe: pandas dataframe with the entries to add
+    """
+    backend = get_cache_backend()
     file_path = get_data_file_path(data_id, project_name)
-    dataframe.to_csv(str(file_path), compression='infer')
+    if not file_path.exists():
+        cache_dataframe(data_id, project_name, dataframe)
+        return
+
+    segment_paths = __get_segment_file_paths(data_id, project_name, backend)
+    if len(segment_paths) >= int(
+        vara_cfg()["data_cache_settings"]["max_segments"]
+    ):
+        LOG.info(f"Compacting cache file {file_path}.")
+        cache_dataframe(
+            data_id, project_name,
+            __merge_segments([
+                __read_cache_file(
+                    data_id, project_name, backend, file_path, {
+                        **dataframe.dtypes.to_dict(), CACHE_ID_COL: 'str',
+                        CACHE_TIMESTAMP_COL: 'str'
+                    }, None
+                ), dataframe
+            ])
+        )
+        return
+
+    next_segment_num = 1
+    if segment_paths:
+        next_segment_num = int(
+            segment_paths[-1].
+            name[len(f"{data_id}-{project_name}."):-len(backend.FILE_SUFFIX)]
+        ) + 1
+    __write_cache_file(
+        backend,
+        file_path.with_name(
+            f"{data_id}-{project_name}.{next_segment_num}"
+            f"{backend.FILE_SUFFIX}"
+        ), dataframe
+    )
 
 
 InDataTy = tp.TypeVar("InDataTy")
@@ -85,20 +479,163 @@ def __create_cache_entry(
     return new_df
 
 
+_CACHE_ENTRY_CREATOR: tp.Optional[tp.Callable[[tp.Any],
+                                              tp.Tuple[pd.DataFrame, str,
+                                                       str]]] = None
+
+
+def _create_cache_entry_in_worker(
+    data: tp.Any
+) -> tp.Tuple[tp.Optional[pd.DataFrame], tp.Optional[str]]:
+    """
+    Create a cache entry in a worker process.
+
+    The function that creates the cache entry is inherited from the parent
+    process via ``_CACHE_ENTRY_CREATOR`` because it is usually a closure that
+    cannot be pickled.
+
+    Returns:
+        the created entry or ``None`` and a description of the error that
+        occurred
+    """
+    assert _CACHE_ENTRY_CREATOR is not None
+    try:
+        return __create_cache_entry(_CACHE_ENTRY_CREATOR, data), None
+    except Exception:  # pylint: disable=broad-except
+        return None, traceback.format_exc()
+
+
+def get_num_cache_jobs() -> int:
+    """
+    Get the number of worker processes used to create cache entries.
+
+    Returns:
+        the configured number of jobs or the number of available cores if the
+        configured value is ``0``
+    """
+    jobs = int(vara_cfg()["data_cache_settings"]["jobs"])
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def __create_cache_entries(
+    create_cache_entry_data: tp.Callable[[InDataTy], tp.Tuple[pd.DataFrame, str,
+                                                              str]],
+    missing_entries: tp.List[InDataTy], updated_entries: tp.List[InDataTy]
+) -> tp.List[pd.DataFrame]:
+    """
+    Create the cache entries for all missing and updated data items.
+
+    If more than one job is configured, the entries are created by a pool of
+    worker processes. The order of the returned entries is always the order of
+    the data items. A data item that fails to be processed is logged and
+    skipped, so that it is retried the next time the cache is built.
+    """
+    global _CACHE_ENTRY_CREATOR  # pylint: disable=global-statement
+
+    jobs = min(
+        get_num_cache_jobs(),
+        len(missing_entries) + len(updated_entries)
+    )
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        LOG.warning(
+            "Parallel cache creation requires the 'fork' start method. "
+            "Falling back to sequential creation."
+        )
+        jobs = 1
+
+    if jobs <= 1:
+        new_data_frames = []
+        for num, data_entry in enumerate(missing_entries):
+            LOG.info(
+                f"Creating missing entry ({(num + 1)}/"
+                f"{len(missing_entries)}): {data_entry}"
+            )
+            try:
+                new_data_frames.append(
+                    __create_cache_entry(create_cache_entry_data, data_entry)
+                )
+            except Exception:  # pylint: disable=broad-except
+                LOG.error(
+                    f"Failed to create missing entry ({(num + 1)}/"
+                    f"{len(missing_entries)}): {data_entry}\n"
+                    f"{traceback.format_exc()}"
+                )
+
+        for num, data_entry in enumerate(updated_entries):
+            LOG.info(
+                f"Updating outdated entry "
+                f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
+            )
+            try:
+                new_data_frames.append(
+                    __create_cache_entry(create_cache_entry_data, data_entry)
+                )
+            except Exception:  # pylint: disable=broad-except
+                LOG.error(
+                    f"Failed to update outdated entry "
+                    f"({(num + 1)}/{len(updated_entries)}): {data_entry}\n"
+                    f"{traceback.format_exc()}"
+                )
+
+        return new_data_frames
+
+    entries = missing_entries + updated_entries
+    LOG.info(
+        f"Creating {len(missing_entries)} missing and updating "
+        f"{len(updated_entries)} outdated entries using {jobs} processes"
+    )
+
+    _CACHE_ENTRY_CREATOR = create_cache_entry_data
+    try:
+        with multiprocessing.get_context("fork").Pool(jobs) as process_pool:
+            new_data_frames = []
+            for num, (data_entry, (new_df, error)) in enumerate(
+                zip(
+                    entries,
+                    process_pool.imap(_create_cache_entry_in_worker, entries)
+                )
+            ):
+                if new_df is None:
+                    LOG.error(
+                        f"Failed to create entry ({(num + 1)}/{len(entries)}):"
+                        f" {data_entry}\n{error}"
+                    )
+                    continue
+
+                LOG.info(
+                    f"Created entry ({(num + 1)}/{len(entries)}): {data_entry}"
+                )
+                new_data_frames.append(new_df)
+    finally:
+        _CACHE_ENTRY_CREATOR = None
+
+    return new_data_frames
+
+
 def build_cached_report_table(
-    data_id: str, project_name: str, data_to_load: tp.List[InDataTy],
-    data_to_drop: tp.List[InDataTy], create_empty_df: tp.Callable[[],
-                                                                  pd.DataFrame],
+    data_id: str,
+    project_name: str,
+    data_to_load: tp.List[InDataTy],
+    data_to_drop: tp.List[InDataTy],
+    create_empty_df: tp.Callable[[], pd.DataFrame],
     create_cache_entry_data: tp.Callable[[InDataTy], tp.Tuple[pd.DataFrame, str,
                                                               str]],
-    get_entry_id: tp.Callable[[InDataTy],
-                              str], get_entry_timestamp: tp.Callable[[InDataTy],
-                                                                     str],
-    is_newer_timestamp: tp.Callable[[str, str], bool]
+    get_entry_id: tp.Callable[[InDataTy], str],
+    get_entry_timestamp: tp.Callable[[InDataTy], str],
+    is_newer_timestamp: tp.Callable[[str, str], bool],
+    columns: tp.Optional[tp.List[str]] = None
 ) -> pd.DataFrame:
     """
     Build up an automatically cached dataframe.
 
+    New and updated entries are appended to the cache file as update segments,
+    so the cache file is only rewritten as a whole if entries need to be dropped
+    or too many segments accumulated. If the cache is up-to-date, nothing is
+    written at all. Entries are created by a pool of worker processes if
+    ``data_cache_settings.jobs`` is not ``1``.
+
     Args:
         data_id: graph cache identifier
         project_name: name of the project to work with
@@ -111,12 +648,28 @@ def build_cached_report_table(
                              to determine which of two data items is newer
         is_newer_timestamp: checks whether one data item is newer than another
                             based on their timestamps
+        columns: only return these columns; with a columnar cache format,
+                 only these columns are loaded from disk
+
+    Returns:
+        the cached dataframe with all or the selected columns
     """
 
     # mypy needs this
     empty_df = create_empty_df()
-    df_types = empty_df.dtypes.to_dict()
-    optional_cached_df = load_cached_df_or_none(data_id, project_name, df_types)
+    df_types = {
+        **empty_df.dtypes.to_dict(), CACHE_ID_COL: 'str',
+        CACHE_TIMESTAMP_COL: 'str'
+    }
+    # With a columnar backend, only the cache metadata is loaded up front and
+    # the requested columns are loaded later. Other backends have to parse the
+    # whole file anyway, so it is loaded once and the columns are selected in
+    # memory.
+    load_columns_later = columns is not None and get_cache_backend().COLUMNAR
+    optional_cached_df = load_cached_df_or_none(
+        data_id, project_name, df_types,
+        [CACHE_ID_COL, CACHE_TIMESTAMP_COL] if load_columns_later else None
+    )
     if optional_cached_df is None:
         cached_df = empty_df
         cached_df[CACHE_ID_COL] = ""
@@ -124,23 +677,27 @@ def build_cached_report_table(
     else:
         cached_df = optional_cached_df
 
-    def is_missing_file(report_file: InDataTy) -> bool:
-        return not (cached_df[CACHE_ID_COL] == get_entry_id(report_file)).any()
+    # index cache entries once to avoid scanning the cache for every entry
+    cache_index: tp.Dict[str, str] = dict(
+        zip(
+            cached_df[CACHE_ID_COL].astype(str),
+            cached_df[CACHE_TIMESTAMP_COL].astype(str)
+        )
+    )
 
     def is_newer_file(report_file: InDataTy) -> bool:
-        cached_entry = cached_df[cached_df[CACHE_ID_COL] ==
-                                 get_entry_id(report_file)][CACHE_TIMESTAMP_COL]
-
-        if len(cached_entry) > 0:
+        entry_id = get_entry_id(report_file)
+        if entry_id in cache_index:
             return is_newer_timestamp(
-                get_entry_timestamp(report_file), cached_entry.iloc[0]
+                get_entry_timestamp(report_file), cache_index[entry_id]
             )
         # We found no existing entry, so it will never be considered for
         # updating and does not need to be deleted.
         return False
 
     missing_entries = [
-        entry for entry in data_to_load if is_missing_file(entry)
+        entry for entry in data_to_load
+        if get_entry_id(entry) not in cache_index
     ]
 
     updated_entries = [entry for entry in data_to_load if is_newer_file(entry)]
@@ -149,48 +706,62 @@ def build_cached_report_table(
         get_entry_id(entry) for entry in data_to_drop if is_newer_file(entry)
     ]
 
-    new_data_frames = []
-    for num, data_entry in enumerate(missing_entries):
-        LOG.info(
-            f"Creating missing entry ({(num + 1)}/"
-            f"{len(missing_entries)}): {data_entry}"
+    def select_columns(data_frame: pd.DataFrame) -> pd.DataFrame:
+        if columns is not None:
+            return tp.cast(pd.DataFrame, data_frame.loc[:, columns])
+
+        return tp.cast(
+            pd.DataFrame, data_frame.loc[:, [
+                col for col in data_frame.columns
+                if col not in [CACHE_ID_COL, CACHE_TIMESTAMP_COL]
+            ]]
         )
-        new_data_frames.append(
-            __create_cache_entry(create_cache_entry_data, data_entry)
+
+    def load_unchanged_cache() -> pd.DataFrame:
+        if not load_columns_later or optional_cached_df is None:
+            return select_columns(cached_df)
+        return tp.cast(
+            pd.DataFrame,
+            load_cached_df_or_none(data_id, project_name, df_types, columns)
         )
 
-    new_df = pd.concat([cached_df] + new_data_frames,
-                       ignore_index=True,
-                       sort=False)
+    if not (missing_entries or updated_entries or failed_entries):
+        # the cache is up-to-date, so there is nothing to write
+        return load_unchanged_cache()
 
-    new_df.set_index(CACHE_ID_COL, inplace=True)
-    for num, data_entry in enumerate(updated_entries):
-        LOG.info(
-            f"Updating outdated entry "
-            f"({(num + 1)}/{len(updated_entries)}): {data_entry}"
-        )
-        updated_entry = __create_cache_entry(
-            create_cache_entry_data, data_entry
-        )
-        updated_entry.set_index(CACHE_ID_COL, inplace=True)
-        new_df.update(updated_entry)
-    new_df.reset_index(inplace=True)
+    new_data_frames = __create_cache_entries(
+        create_cache_entry_data, missing_entries, updated_entries
+    )
+
+    if not (new_data_frames or failed_entries):
+        # all entries failed to be created, so the cache stays unchanged
+        return load_unchanged_cache()
 
     if len(failed_entries) > 0:
+        if load_columns_later and optional_cached_df is not None:
+            cached_df = tp.cast(
+                pd.DataFrame,
+                load_cached_df_or_none(data_id, project_name, df_types)
+            )
+
+        new_df = __merge_segments([cached_df] + new_data_frames)
         LOG.info(f"Dropping {len(failed_entries)} entries")
         new_df.drop(
             new_df[new_df[CACHE_ID_COL].isin(failed_entries)].index,
             inplace=True
         )
+        cache_dataframe(data_id, project_name, new_df)
+        return select_columns(new_df)
 
-    cache_dataframe(data_id, project_name, new_df)
+    appended_df = pd.concat(new_data_frames, ignore_index=True, sort=False)
+    append_to_cached_dataframe(data_id, project_name, appended_df)
 
-    return tp.cast(
-        pd.DataFrame, new_df.loc[:, [
-            col for col in new_df.columns
-            if col not in [CACHE_ID_COL, CACHE_TIMESTAMP_COL]
-        ]]
-    )
+    if load_columns_later and optional_cached_df is not None:
+        return tp.cast(
+            pd.DataFrame,
+            load_cached_df_or_none(data_id, project_name, df_types, columns)
+        )
+    return select_columns(__merge_segments([cached_df, appended_df]))
 
 
 GraphTy = tp.TypeVar("GraphTy", bound=nx.Graph)
@@ -11,6 +11,7 @@ like in jupyter notebooks, where we sometimes re-execute triggers a file load.
 import hashlib
 import os
 import typing as tp
+from collections import OrderedDict
 from functools import partial
 from multiprocessing import Pool
 from pathlib import Path
@@ -19,6 +20,7 @@ from threading import Lock
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
 from varats.report.report import BaseReport, ReportFilepath
+from varats.utils.settings import vara_cfg
 
 LoadableTy = tp.TypeVar('LoadableTy', bound=BaseReport)
 PathLikeTy = tp.TypeVar('PathLikeTy', Path, ReportFilepath)
@@ -43,6 +45,65 @@ def sha256_checksum(file_path: Path, block_size: int = 65536) -> str:
     return sha256.hexdigest()
 
 
+def stat_file_key(file_path: Path) -> str:
+    """
+    Compute a cheap key for a file that changes whenever the file is modified.
+
+    The key combines the absolute path with size, modification time, and inode
+    of the file, so it can be computed with a single ``stat`` call.
+
+    Args:
+        file_path: path to the file
+
+    Returns:
+        key for the current version of the file
+    """
+    file_stat = file_path.stat()
+    return (
+        f"{file_path.absolute()}:{file_stat.st_size}:{file_stat.st_mtime_ns}:"
+        f"{file_stat.st_ino}"
+    )
+
+
+def sampled_file_key(
+    file_path: Path, block_size: int = 65536, num_blocks: int = 4
+) -> str:
+    """
+    Compute a key for a file from its stat information and a hash over a few
+    sampled blocks of the file.
+
+    In contrast to :func:`stat_file_key`, the key also changes if a file is
+    modified in a way that preserves size and modification time, but only a
+    constant amount of data is read.
+
+    Args:
+        file_path: path to the file
+        block_size: amount of bytes read per sampled block
+        num_blocks: number of blocks sampled evenly across the file
+
+    Returns:
+        key for the current version of the file
+    """
+    file_size = file_path.stat().st_size
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as file_h:
+        if file_size <= block_size * num_blocks:
+            sha256.update(file_h.read())
+        else:
+            stride = (file_size - block_size) // (num_blocks - 1)
+            for block_num in range(num_blocks):
+                file_h.seek(block_num * stride)
+                sha256.update(file_h.read(block_size))
+    return f"{stat_file_key(file_path)}:{sha256.hexdigest()}"
+
+
+FILE_KEY_FUNCTIONS: tp.Dict[str, tp.Callable[[Path], str]] = {
+    "stat": stat_file_key,
+    "sampled": sampled_file_key,
+    "sha256": sha256_checksum,
+}
+
+
 class FileBlob(tp.Generic[LoadableTy]):
     """
     A FileBlob is a keyed data blob for everything that is loadable from a file
@@ -58,6 +119,7 @@ class FileBlob(tp.Generic[LoadableTy]):
         self.__key = key
         self.__file_path = file_path
         self.__class_object = data
+        self.__size = file_path.stat().st_size
 
     @property
     def key(self) -> str:
@@ -74,6 +136,12 @@ class FileBlob(tp.Generic[LoadableTy]):
         """The loaded DataClass from the file."""
         return self.__class_object
 
+    @property
+    def size(self) -> int:
+        """Size of the loaded file, used to estimate the memory size of the
+        blob."""
+        return self.__size
+
 
 class FileSignal(QObject):
     """Emit signals after the file was loaded."""
@@ -102,30 +170,124 @@ class FileLoader(QRunnable):
         self.signal.clean.emit()
 
 
+class DataManagerStatistics():
+    """Statistics about the usage of the :class:`DataManager` cache."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __str__(self) -> str:
+        return (
+            f"hits: {self.hits}, misses: {self.misses}, "
+            f"evictions: {self.evictions}"
+        )
+
+
 class DataManager():
     """
     Manages data over the lifetime of the tool suite.
 
     The DataManager handles the concurrent file loading, creation of DataClasses
     and caching of loaded files.
+
+    The cache can be bounded by the number of entries and by the estimated
+    memory size of the entries, which is approximated by the size of the loaded
+    files. If a limit is exceeded, the least recently used entries are evicted.
+    Limits that are not passed explicitly are taken from the ``data_manager``
+    section of the varats config, where ``0`` means unlimited.
+
+    Loaded files are identified by a key computed by one of the
+    ``FILE_KEY_FUNCTIONS``. The default ``stat`` key only requires a single
+    ``stat`` call, ``sampled`` additionally hashes a few blocks of the file, and
+    ``sha256`` hashes the whole file.
+
+    Args:
+        max_entries: maximum number of cached data classes
+        max_bytes: maximum accumulated file size of cached data classes
+        key_mode: how files are identified; one of ``FILE_KEY_FUNCTIONS``
     """
 
-    def __init__(self) -> None:
-        self.file_map: tp.Dict[str, FileBlob[tp.Any]] = {}
+    def __init__(
+        self,
+        max_entries: tp.Optional[int] = None,
+        max_bytes: tp.Optional[int] = None,
+        key_mode: tp.Optional[str] = None
+    ) -> None:
+        self.file_map: tp.OrderedDict[str, FileBlob[tp.Any]] = OrderedDict()
         self.thread_pool = QThreadPool()
         self.loader_lock = Lock()
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__key_mode = key_mode
+        self.__cached_bytes = 0
+        self.__statistics = DataManagerStatistics()
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached data classes; ``0`` means unlimited."""
+        if self.__max_entries is None:
+            return int(vara_cfg()["data_manager"]["max_entries"])
+        return self.__max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum accumulated file size of cached data classes; ``0`` means
+        unlimited."""
+        if self.__max_bytes is None:
+            return int(vara_cfg()["data_manager"]["max_bytes"])
+        return self.__max_bytes
+
+    @property
+    def key_mode(self) -> str:
+        """How loaded files are identified in the cache."""
+        if self.__key_mode is None:
+            return str(vara_cfg()["data_manager"]["key_mode"])
+        return self.__key_mode
+
+    def compute_key(self, file_path: Path) -> str:
+        """
+        Compute the cache key of a file according to the key mode.
+
+        Args:
+            file_path: path to the file
+
+        Returns:
+            the cache key of the file
+        """
+        key_mode = self.key_mode
+        if key_mode not in FILE_KEY_FUNCTIONS:
+            raise ValueError(
+                f"Unknown key mode '{key_mode}'. Supported modes: "
+                f"{', '.join(FILE_KEY_FUNCTIONS.keys())}"
+            )
+        return FILE_KEY_FUNCTIONS[key_mode](file_path)
+
+    @property
+    def cached_bytes(self) -> int:
+        """Accumulated file size of all cached data classes."""
+        return self.__cached_bytes
+
+    @property
+    def statistics(self) -> DataManagerStatistics:
+        """Hit, miss, and eviction statistics of the cache."""
+        return self.__statistics
 
     def __load_data_class(
         self, file_path: Path, DataClassTy: tp.Type[LoadableTy]
     ) -> LoadableTy:
         # pylint: disable=invalid-name
         """Load a DataClass of type <DataClassTy> from a file."""
-        key = sha256_checksum(file_path)
+        key = self.compute_key(file_path)
 
         self.loader_lock.acquire()  # pylint: disable=consider-using-with
         if key in self.file_map:
+            self.__statistics.hits += 1
+            self.file_map.move_to_end(key)
             return tp.cast(LoadableTy, self.file_map[key].data)
 
+        self.__statistics.misses += 1
         self.loader_lock.release()
 
         try:
@@ -135,10 +297,34 @@ class DataManager():
 
         self.loader_lock.acquire()  # pylint: disable=consider-using-with
         # unlocking in the happy path is performed by the loading function
+        if key not in self.file_map:
+            # drop outdated versions of the same file
+            for outdated_key in [
+                blob.key
+                for blob in self.file_map.values()
+                if blob.file_path == file_path
+            ]:
+                self.__cached_bytes -= self.file_map.pop(outdated_key).size
+            self.__cached_bytes += new_blob.size
         self.file_map[key] = new_blob
+        self.file_map.move_to_end(key)
+        self.__evict_least_recently_used()
 
         return new_blob.data
 
+    def __evict_least_recently_used(self) -> None:
+        """Evict entries until the cache limits are met again; the most
+        recently used entry is never evicted."""
+        max_entries = self.max_entries
+        max_bytes = self.max_bytes
+        while len(
+            self.file_map
+        ) > 1 and ((max_entries > 0 and len(self.file_map) > max_entries) or
+                   (max_bytes > 0 and self.__cached_bytes > max_bytes)):
+            _, evicted_blob = self.file_map.popitem(last=False)
+            self.__cached_bytes -= evicted_blob.size
+            self.__statistics.evictions += 1
+
     def load_data_class(
         self, file_path: PathLikeTy, DataClassTy: tp.Type[LoadableTy],
         loaded_callback: tp.Callable[[LoadableTy], None]
@@ -191,9 +377,40 @@ class DataManager():
         self._release_lock()
         return loaded_file
 
-    def clean_cache(self) -> None:
+    def evict(self, file_path: PathLikeTy) -> bool:
+        """
+        Remove all data classes loaded from a file from the cache.
+
+        Args:
+            file_path: to the file
+
+        Returns:
+            ``True`` if an entry was evicted
+        """
+        if isinstance(file_path, ReportFilepath):
+            py_file_path: Path = file_path.full_path()
+        else:
+            py_file_path = file_path
+
+        with self.loader_lock:
+            evicted_keys = [
+                key for key, blob in self.file_map.items()
+                if blob.file_path == py_file_path
+            ]
+            for key in evicted_keys:
+                self.__cached_bytes -= self.file_map.pop(key).size
+                self.__statistics.evictions += 1
+
+        return bool(evicted_keys)
+
+    def clear(self) -> None:
+        """Remove all data classes from the cache."""
         with self.loader_lock:
             self.file_map.clear()
+            self.__cached_bytes = 0
+
+    def clean_cache(self) -> None:
+        self.clear()
 
     def _release_lock(self) -> None:
         self.loader_lock.release()
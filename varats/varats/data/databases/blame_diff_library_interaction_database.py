@@ -112,9 +112,16 @@ class BlameDiffLibraryInteractionDatabase(
         # cls.CACHE_ID is set by superclass
         # pylint: disable=E1101
         data_frame = build_cached_report_table(
-            cls.CACHE_ID, project_name, report_pairs, failed_report_pairs,
-            create_dataframe_layout, create_data_frame_for_report,
-            id_from_paths, timestamp_from_paths, compare_timestamps
+            cls.CACHE_ID,
+            project_name,
+            report_pairs,
+            failed_report_pairs,
+            create_dataframe_layout,
+            create_data_frame_for_report,
+            id_from_paths,
+            timestamp_from_paths,
+            compare_timestamps,
+            columns=kwargs.get("columns")
         )
 
         return data_frame
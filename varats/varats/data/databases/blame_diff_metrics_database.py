@@ -1,8 +1,8 @@
 """Module for diff based commit-data metrics."""
 import typing as tp
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from enum import Enum
-from itertools import chain
 from pathlib import Path
 
 import pandas as pd
@@ -11,13 +11,7 @@ from varats.data.cache_helper import build_cached_report_table
 from varats.data.databases.evaluationdatabase import EvaluationDatabase
 from varats.data.reports.blame_report import (
     BlameReportDiff,
-    generate_degree_tuples,
-    generate_author_degree_tuples,
-    generate_avg_time_distribution_tuples,
-    generate_max_time_distribution_tuples,
-    count_interactions,
-    count_interacting_commits,
-    count_interacting_authors,
+    generate_blame_metrics,
 )
 from varats.experiments.vara.blame_report_experiment import (
     BlameReportExperiment,
@@ -28,7 +22,7 @@ from varats.paper.case_study import CaseStudy
 from varats.paper_mgmt.case_study import get_case_study_file_name_filter
 from varats.project.project_util import (
     get_local_project_repo,
-    create_project_commit_lookup_helper,
+    create_project_commit_metadata_lookup_helper,
 )
 from varats.report.report import ReportFilepath
 from varats.revision.revisions import (
@@ -136,6 +130,121 @@ def build_report_files_tuple(
 ReportPairTupleList = tp.List[tp.Tuple[ReportFilepath, ReportFilepath]]
 
 
+class SampledRevisionIndex():
+    """
+    Time-ordered index over the sampled revisions of a case study.
+
+    Preceding and succeeding sampled revisions are found with a binary search
+    over the sorted time IDs of the sampled revisions.
+    """
+
+    def __init__(
+        self, commit_map: CommitMap, sampled_revs: tp.Iterable[ShortCommitHash]
+    ) -> None:
+        self.__commit_map = commit_map
+        self.__time_id_cache: tp.Dict[ShortCommitHash, int] = {
+            rev: commit_map.short_time_id(rev)
+            for rev in dict.fromkeys(sampled_revs)
+        }
+        sorted_revs = sorted(
+            self.__time_id_cache.items(), key=lambda item: item[1]
+        )
+        self.__revs = [rev for rev, _ in sorted_revs]
+        self.__time_ids = [time_id for _, time_id in sorted_revs]
+
+    def time_id(self, c_hash: ShortCommitHash) -> int:
+        """
+        Look up the time ID of a commit.
+
+        Args:
+            c_hash: the selected commit hash
+
+        Returns:
+            the time ID of the commit
+        """
+        if c_hash in self.__time_id_cache:
+            return self.__time_id_cache[c_hash]
+        return self.__commit_map.short_time_id(c_hash)
+
+    def predecessor(self,
+                    c_hash: ShortCommitHash) -> tp.Optional[ShortCommitHash]:
+        """
+        Find the latest sampled revision before the passed commit.
+
+        Args:
+            c_hash: the selected commit hash
+
+        Returns:
+            the preceding sampled revision if it exists
+        """
+        idx = bisect_left(self.__time_ids, self.time_id(c_hash))
+        return self.__revs[idx - 1] if idx > 0 else None
+
+    def successor(self,
+                  c_hash: ShortCommitHash) -> tp.Optional[ShortCommitHash]:
+        """
+        Find the earliest sampled revision after the passed commit.
+
+        Args:
+            c_hash: the selected commit hash
+
+        Returns:
+            the succeeding sampled revision if it exists
+        """
+        idx = bisect_right(self.__time_ids, self.time_id(c_hash))
+        return self.__revs[idx] if idx < len(self.__revs) else None
+
+
+_SampledRevisionIndexKey = tp.Tuple[str, str, tp.Optional[str], str,
+                                    tp.Tuple[ShortCommitHash, ...]]
+__SAMPLED_REVISION_INDICES: tp.Dict[_SampledRevisionIndexKey,
+                                    SampledRevisionIndex] = {}
+__MAX_SAMPLED_REVISION_INDICES = 8
+
+
+def get_sampled_revision_index(
+    project_name: str, commit_map: CommitMap, case_study: tp.Optional[CaseStudy]
+) -> SampledRevisionIndex:
+    """
+    Get the time-ordered index of the sampled revisions of a case study or, if
+    no case study is given, of all processed revisions of a project.
+
+    Indices are shared between all databases within a process as long as the
+    sampled revisions and the commit map range do not change.
+
+    Args:
+        project_name: the name of the project
+        commit_map: the selected CommitMap
+        case_study: the selected CaseStudy
+
+    Returns:
+        the index of the sampled revisions
+    """
+    sampled_revs: tp.List[ShortCommitHash]
+    if case_study:
+        sampled_revs = [
+            rev.to_short_commit_hash() for rev in case_study.revisions
+        ]
+    else:
+        sampled_revs = get_processed_revisions(
+            project_name, BlameReportExperiment
+        )
+
+    key: _SampledRevisionIndexKey = (
+        str(commit_map.repo.repo_path), commit_map.end, commit_map.start,
+        commit_map.refspec, tuple(sampled_revs)
+    )
+    if key not in __SAMPLED_REVISION_INDICES:
+        if len(__SAMPLED_REVISION_INDICES) >= __MAX_SAMPLED_REVISION_INDICES:
+            del __SAMPLED_REVISION_INDICES[next(
+                iter(__SAMPLED_REVISION_INDICES)
+            )]
+        __SAMPLED_REVISION_INDICES[key] = SampledRevisionIndex(
+            commit_map, sampled_revs
+        )
+    return __SAMPLED_REVISION_INDICES[key]
+
+
 def build_report_pairs_tuple(
     project_name: str, commit_map: CommitMap, case_study: tp.Optional[CaseStudy]
 ) -> tp.Tuple[ReportPairTupleList, ReportPairTupleList]:
@@ -157,47 +266,40 @@ def build_report_pairs_tuple(
     report_files, failed_report_files = build_report_files_tuple(
         project_name, case_study
     )
+    revision_index = get_sampled_revision_index(
+        project_name, commit_map, case_study
+    )
 
-    sampled_revs: tp.List[ShortCommitHash]
-    if case_study:
-        sampled_revs = [
-            rev.to_short_commit_hash() for rev in case_study.revisions
-        ]
-    else:
-        sampled_revs = get_processed_revisions(
-            project_name, BlameReportExperiment
-        )
-    short_time_id_cache: tp.Dict[ShortCommitHash, int] = {
-        rev: commit_map.short_time_id(rev) for rev in sampled_revs
-    }
-
-    report_pairs: tp.List[tp.Tuple[ReportFilepath, ReportFilepath]] = [
-        (report, pred) for report, pred in [(
-            report_file,
-            get_predecessor_report_file(
-                c_hash, commit_map, short_time_id_cache, report_files,
-                sampled_revs
-            )
-        ) for c_hash, report_file in report_files.items()] if pred is not None
-    ]
-
-    failed_report_pairs: tp.List[tp.Tuple[ReportFilepath, ReportFilepath]] = [
-        (report, pred) for report, pred in chain.from_iterable(
-            [[(
-                report_file,
-                get_predecessor_report_file(
-                    c_hash, commit_map, short_time_id_cache, report_files,
-                    sampled_revs
-                )
-            ),
-              (
-                  get_successor_report_file(
-                      c_hash, commit_map, short_time_id_cache, report_files,
-                      sampled_revs
-                  ), report_file
-              )] for c_hash, report_file in failed_report_files.items()]
-        ) if report is not None and pred is not None
-    ]
+    def predecessor_report(
+        c_hash: ShortCommitHash
+    ) -> tp.Optional[ReportFilepath]:
+        pred_rev = revision_index.predecessor(c_hash)
+        if pred_rev is None:
+            return None
+        return report_files.get(pred_rev, None)
+
+    def successor_report(
+        c_hash: ShortCommitHash
+    ) -> tp.Optional[ReportFilepath]:
+        succ_rev = revision_index.successor(c_hash)
+        if succ_rev is None:
+            return None
+        return report_files.get(succ_rev, None)
+
+    report_pairs: tp.List[tp.Tuple[ReportFilepath, ReportFilepath]] = []
+    for c_hash, report_file in report_files.items():
+        pred = predecessor_report(c_hash)
+        if pred is not None:
+            report_pairs.append((report_file, pred))
+
+    failed_report_pairs: tp.List[tp.Tuple[ReportFilepath, ReportFilepath]] = []
+    for c_hash, report_file in failed_report_files.items():
+        pred = predecessor_report(c_hash)
+        if pred is not None:
+            failed_report_pairs.append((report_file, pred))
+        succ = successor_report(c_hash)
+        if succ is not None:
+            failed_report_pairs.append((succ, report_file))
     return report_pairs, failed_report_pairs
 
 
@@ -304,7 +406,9 @@ class BlameDiffMetricsDatabase(
     ) -> pd.DataFrame:
         repo = get_local_project_repo(project_name)
         pygit_repo = repo.pygit_repo
-        commit_lookup = create_project_commit_lookup_helper(project_name)
+        commit_lookup = create_project_commit_metadata_lookup_helper(
+            project_name
+        )
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -345,6 +449,10 @@ class BlameDiffMetricsDatabase(
                     return max(x for x, y in tuples)
                 return 0
 
+            metrics = generate_blame_metrics(
+                diff_between_head_pred, commit_lookup, 1, 1
+            )
+
             return (
                 pd.DataFrame({
                     'revision':
@@ -354,45 +462,23 @@ class BlameDiffMetricsDatabase(
                     'churn':
                         total_churn,
                     'num_interactions':
-                        count_interactions(diff_between_head_pred),
+                        metrics.num_interactions,
                     'num_interacting_commits':
-                        count_interacting_commits(diff_between_head_pred),
+                        metrics.num_interacting_commits,
                     'num_interacting_authors':
-                        count_interacting_authors(
-                            diff_between_head_pred, commit_lookup
-                        ),
+                        metrics.num_interacting_authors,
                     "ci_degree_mean":
-                        weighted_avg(
-                            generate_degree_tuples(diff_between_head_pred)
-                        ),
+                        weighted_avg(metrics.degree_tuples),
                     "author_mean":
-                        weighted_avg(
-                            generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
-                            )
-                        ),
+                        weighted_avg(metrics.author_degree_tuples),
                     "avg_time_mean":
-                        weighted_avg(
-                            generate_avg_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
-                            )
-                        ),
+                        weighted_avg(metrics.avg_time_distribution_tuples),
                     "ci_degree_max":
-                        combine_max(
-                            generate_degree_tuples(diff_between_head_pred)
-                        ),
+                        combine_max(metrics.degree_tuples),
                     "author_max":
-                        combine_max(
-                            generate_author_degree_tuples(
-                                diff_between_head_pred, commit_lookup
-                            )
-                        ),
+                        combine_max(metrics.author_degree_tuples),
                     "avg_time_max":
-                        combine_max(
-                            generate_max_time_distribution_tuples(
-                                diff_between_head_pred, commit_lookup, 1
-                            )
-                        ),
+                        combine_max(metrics.max_time_distribution_tuples),
                     'year':
                         commit_date.year,
                 },
@@ -407,9 +493,16 @@ class BlameDiffMetricsDatabase(
         # cls.CACHE_ID is set by superclass
         # pylint: disable=E1101
         data_frame = build_cached_report_table(
-            cls.CACHE_ID, project_name, report_pairs, failed_report_pairs,
-            create_dataframe_layout, create_data_frame_for_report,
-            id_from_paths, timestamp_from_paths, compare_timestamps
+            cls.CACHE_ID,
+            project_name,
+            report_pairs,
+            failed_report_pairs,
+            create_dataframe_layout,
+            create_data_frame_for_report,
+            id_from_paths,
+            timestamp_from_paths,
+            compare_timestamps,
+            columns=kwargs.get("columns")
         )
 
         return data_frame
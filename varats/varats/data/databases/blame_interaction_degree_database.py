@@ -8,9 +8,7 @@ import pandas as pd
 from varats.data.cache_helper import build_cached_report_table
 from varats.data.databases.evaluationdatabase import EvaluationDatabase
 from varats.data.reports.blame_report import (
-    generate_author_degree_tuples,
-    generate_avg_time_distribution_tuples,
-    generate_max_time_distribution_tuples,
+    generate_blame_metrics,
     generate_lib_dependent_degrees,
 )
 from varats.experiments.vara.blame_report_experiment import (
@@ -20,7 +18,9 @@ from varats.jupyterhelper.file import load_blame_report
 from varats.mapping.commit_map import CommitMap
 from varats.paper.case_study import CaseStudy
 from varats.paper_mgmt.case_study import get_case_study_file_name_filter
-from varats.project.project_util import create_project_commit_lookup_helper
+from varats.project.project_util import (
+    create_project_commit_metadata_lookup_helper,
+)
 from varats.report.report import ReportFilepath
 from varats.revision.revisions import (
     get_failed_revisions_files,
@@ -88,7 +88,9 @@ class BlameInteractionDegreeDatabase(
         cls, project_name: str, commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
-        commit_lookup = create_project_commit_lookup_helper(project_name)
+        commit_lookup = create_project_commit_metadata_lookup_helper(
+            project_name
+        )
 
         def create_dataframe_layout() -> pd.DataFrame:
             df_layout = pd.DataFrame(columns=cls.COLUMNS)
@@ -115,24 +117,23 @@ class BlameInteractionDegreeDatabase(
 
             total_amounts_of_all_libs = calc_total_amounts()
 
-            list_of_author_degree_occurrences = generate_author_degree_tuples(
-                report, commit_lookup
+            metrics = generate_blame_metrics(
+                report, commit_lookup, AVG_TIME_BUCKET_SIZE,
+                MAX_TIME_BUCKET_SIZE
             )
+
+            list_of_author_degree_occurrences = metrics.author_degree_tuples
             author_degrees, author_amounts = _split_tuple_values_in_lists_tuple(
                 list_of_author_degree_occurrences
             )
             author_total = sum(author_amounts)
 
-            list_of_max_time_deltas = generate_max_time_distribution_tuples(
-                report, commit_lookup, MAX_TIME_BUCKET_SIZE
-            )
+            list_of_max_time_deltas = metrics.max_time_distribution_tuples
             (max_time_buckets, max_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_max_time_deltas)
             total_max_time_amounts = sum(max_time_amounts)
 
-            list_of_avg_time_deltas = generate_avg_time_distribution_tuples(
-                report, commit_lookup, AVG_TIME_BUCKET_SIZE
-            )
+            list_of_avg_time_deltas = metrics.avg_time_distribution_tuples
             (avg_time_buckets, avg_time_amounts
             ) = _split_tuple_values_in_lists_tuple(list_of_avg_time_deltas)
             total_avg_time_amounts = sum(avg_time_amounts)
@@ -244,11 +245,16 @@ class BlameInteractionDegreeDatabase(
         # cls.CACHE_ID is set by superclass
         # pylint: disable=E1101
         data_frame = build_cached_report_table(
-            cls.CACHE_ID, project_name, report_files, failed_report_files,
-            create_dataframe_layout, create_data_frame_for_report,
+            cls.CACHE_ID,
+            project_name,
+            report_files,
+            failed_report_files,
+            create_dataframe_layout,
+            create_data_frame_for_report,
             lambda path: path.report_filename.commit_hash.hash,
             lambda path: str(path.stat().st_mtime_ns),
-            lambda a, b: int(a) > int(b)
+            lambda a, b: int(a) > int(b),
+            columns=kwargs.get("columns")
         )
 
         return data_frame
@@ -82,11 +82,16 @@ class CommitInteractionDatabase(
         # cls.CACHE_ID is set by superclass
         # pylint: disable=E1101
         data_frame = build_cached_report_table(
-            cls.CACHE_ID, project_name, report_files, failed_report_files,
-            create_dataframe_layout, create_data_frame_for_report,
+            cls.CACHE_ID,
+            project_name,
+            report_files,
+            failed_report_files,
+            create_dataframe_layout,
+            create_data_frame_for_report,
             lambda path: path.report_filename.commit_hash.hash,
             lambda path: str(path.stat().st_mtime_ns),
-            lambda a, b: int(a) > int(b)
+            lambda a, b: int(a) > int(b),
+            columns=kwargs.get("columns")
         )
 
         return data_frame
@@ -55,7 +55,9 @@ class EvaluationDatabase(abc.ABC):
             project_name: the project to load data for
             commit_map: the commit map to use
             case_study: the case_study to load data for
-            kwargs: additional arguments used to load data
+            kwargs: additional arguments used to load data; ``columns``
+                    contains the columns that are actually required, so
+                    implementations may choose to only load these
 
         Return:
             a pandas dataframe with all the cached data
@@ -66,22 +68,31 @@ class EvaluationDatabase(abc.ABC):
         cls, project_name: str, columns: tp.List[str], commit_map: CommitMap,
         case_study: tp.Optional[CaseStudy], **kwargs: tp.Any
     ) -> pd.DataFrame:
+        if not all(column in cls.COLUMNS for column in columns):
+            raise ValueError(
+                f"All values in 'columns' must be in {cls.__name__}.COLUMNS"
+            )
+
+        # the revision is always required for filtering
+        load_columns = [
+            column for column in cls.COLUMNS
+            if column in columns or column == "revision"
+        ]
         data: pd.DataFrame = cls._load_dataframe(
-            project_name, commit_map, case_study, **kwargs
+            project_name,
+            commit_map,
+            case_study,
+            columns=load_columns,
+            **kwargs
         )
 
-        if not [*data] == cls.COLUMNS:
+        if [*data] not in (cls.COLUMNS, load_columns):
             raise AssertionError(
                 "Loaded dataframe does not match expected layout."
                 "Consider removing the cache file "
                 f"{get_data_file_path(cls.CACHE_ID, project_name)}."
             )
 
-        if not all(column in cls.COLUMNS for column in columns):
-            raise ValueError(
-                f"All values in 'columns' must be in {cls.__name__}.COLUMNS"
-            )
-
         def cs_filter(data_frame: pd.DataFrame) -> pd.DataFrame:
             """Filter out all commits that are not in the case study if one was
             selected."""
@@ -1,10 +1,68 @@
 """This modules handles auto discovering of reports from the tool suite."""
+import importlib
+import typing as tp
 
 from varats import report as __CORE_REPORTS__
 from varats.data import reports as __REPORTS__
+from varats.report.report import BaseReport
+from varats.utils.registry_manifest import (
+    RegistryManifestTy,
+    get_registry_manifest,
+)
 
 
 def initialize_reports() -> None:
     # Discover and initialize all Reports
     __REPORTS__.discover()
     __CORE_REPORTS__.discover()
+
+
+def get_report_manifest() -> RegistryManifestTy:
+    """
+    Get a mapping from the names of all report types in the tool suite to the
+    modules that define them without importing these modules.
+
+    Returns:
+        a dict mapping report type names to manifest entries
+    """
+    manifest = dict(get_registry_manifest(__REPORTS__, "shorthand", True))
+    for name, entry in get_registry_manifest(
+        __CORE_REPORTS__, "shorthand", True
+    ).items():
+        manifest.setdefault(name, entry)
+    return manifest
+
+
+def get_report_type_names() -> tp.List[str]:
+    """
+    Get the names of all available report types, including those whose modules
+    were not imported yet.
+
+    Returns:
+        a sorted list of report type names
+    """
+    return sorted(set(BaseReport.REPORT_TYPES) | set(get_report_manifest()))
+
+
+def get_report_type(report_type_name: str) -> tp.Type[BaseReport]:
+    """
+    Look up a report type by its name, importing only the module that defines
+    it.
+
+    If the report type is not known from the manifest, all reports are
+    discovered.
+
+    Args:
+        report_type_name: class name of the report type
+
+    Returns:
+        the report type
+    """
+    if report_type_name not in BaseReport.REPORT_TYPES:
+        entry = get_report_manifest().get(report_type_name, None)
+        if entry:
+            importlib.import_module(entry.module_name)
+        else:
+            initialize_reports()
+
+    return BaseReport.REPORT_TYPES[report_type_name]
@@ -1,15 +1,22 @@
 """Module for representing blame interaction data in a graph/network."""
 import abc
+import hashlib
 import itertools
+import logging
+import os
+import pickle
 import re
+import tempfile
 import typing as tp
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from typing import TypedDict
 
 import networkx as nx
 
-from varats.data.cache_helper import build_cached_graph
+from varats.data.cache_helper import build_cached_graph, get_num_cache_jobs
 from varats.data.reports.blame_report import (
     gen_base_to_inter_commit_repo_pair_mapping,
     BlameTaintData,
@@ -28,8 +35,10 @@ from varats.utils.git_util import (
     ChurnConfig,
     UNCOMMITTED_COMMIT_HASH,
     FullCommitHash,
+    RepositoryHandle,
     get_submodule_head,
 )
+from varats.utils.settings import vara_cfg
 
 if tp.TYPE_CHECKING:
     # pylint: disable=W0611
@@ -37,6 +46,8 @@ if tp.TYPE_CHECKING:
         BlameReportExperiment,
     )
 
+LOG = logging.getLogger(__name__)
+
 BIGNodeTy = BlameTaintData
 
 
@@ -403,6 +414,154 @@ def _nodes_for_func_entry(
     }
 
 
+_FILE_BLAME_REGEX = re.compile(r"^([0-9a-f]+)\s+(?:.+\s+)?[\d]+\) ?(.*)$")
+
+_FILE_BLAME_STORE_VERSION = 1
+
+# (path, last commit changing the file, blob id)
+_FileBlameKeyTy = tp.Tuple[str, str, str]
+
+
+def _blame_file_commits(repo: RepositoryHandle, head_commit: str,
+                        path: str) -> tp.FrozenSet[str]:
+    """Commits that last changed a non-empty line of a file."""
+    blame_lines: str = repo(
+        "blame", "-w", "-s", "-l", "--root", head_commit, "--", path
+    )
+
+    commits: tp.Set[str] = set()
+    for line in blame_lines.strip().split("\n"):
+        match = _FILE_BLAME_REGEX.match(line)
+        if not match:
+            raise AssertionError
+
+        if match.group(2):
+            commits.add(match.group(1))
+    return frozenset(commits)
+
+
+def _get_last_changing_commits(
+    repo: RepositoryHandle, head_commit: str, pathspec: tp.List[str]
+) -> tp.Dict[str, str]:
+    """Map all files matching the pathspec to the last commit that changed
+    them, which determines the blame of the file at the head commit."""
+    last_changing_commits: tp.Dict[str, str] = {}
+    log_output = repo(
+        "log", "--format=%x01%H", "--name-only", "-z", head_commit, "--",
+        *pathspec
+    )
+    for entry in log_output.split("\x01"):
+        commit_hash, *paths = entry.split("\0")
+        for path in paths:
+            path = path.lstrip("\n")
+            if path and path not in last_changing_commits:
+                last_changing_commits[path] = commit_hash
+    return last_changing_commits
+
+
+class _FileBlameStore():
+    """Persistent store of the blamed commits of files, which are shared by all
+    revisions in which a file did not change."""
+
+    def __init__(self, repo: RepositoryHandle) -> None:
+        repo_path = str(repo.repo_path.absolute())
+        store_key = hashlib.sha256(repo_path.encode()).hexdigest()
+        self.__path = Path(
+            str(vara_cfg()["data_cache"])
+        ) / "file_blame" / f"{store_key}.pickle"
+        self.__blamed_files: tp.Dict[_FileBlameKeyTy, tp.FrozenSet[str]] = {}
+        self.__modified = False
+
+        if self.__path.exists():
+            try:
+                with open(self.__path, "rb") as store_file:
+                    version, blamed_files = pickle.load(store_file)
+                if version == _FILE_BLAME_STORE_VERSION:
+                    self.__blamed_files = blamed_files
+            except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+                LOG.warning(f"Could not load file blame store {self.__path}.")
+
+    def get(self, key: _FileBlameKeyTy) -> tp.Optional[tp.FrozenSet[str]]:
+        return self.__blamed_files.get(key, None)
+
+    def add(self, key: _FileBlameKeyTy, commits: tp.FrozenSet[str]) -> None:
+        self.__blamed_files[key] = commits
+        self.__modified = True
+
+    def store(self) -> None:
+        """Persist the store if new files were added."""
+        if not self.__modified:
+            return
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.__path.parent, delete=False
+        ) as tmp_file:
+            pickle.dump((_FILE_BLAME_STORE_VERSION, self.__blamed_files),
+                        tmp_file,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file.name, self.__path)
+        self.__modified = False
+
+
+def _blame_repo_files(
+    repo: RepositoryHandle, head_commit: str, churn_config: ChurnConfig
+) -> tp.List[tp.FrozenSet[str]]:
+    """
+    Blame all files of a repository revision that match the churn config.
+
+    Files that did not change since they were last blamed are looked up from
+    the file blame store; all other files are blamed in parallel using
+    ``data_cache_settings.jobs`` workers.
+    """
+    file_pattern = re.compile(
+        r"|".join(churn_config.get_extensions_repr(prefix=r"\.", suffix=r"$"))
+    )
+    files: tp.List[tp.Tuple[str, str]] = []
+    for tree_entry in repo("ls-tree", "--full-tree", "-r", "-z",
+                           head_commit).split("\0"):
+        if not tree_entry:
+            continue
+        object_info, path = tree_entry.split("\t", maxsplit=1)
+        _, object_type, object_id = object_info.split()
+        if object_type == "blob" and file_pattern.search(path):
+            files.append((path, object_id))
+
+    last_changing_commits = _get_last_changing_commits(
+        repo, head_commit, churn_config.get_extensions_repr('*.')
+    )
+    blame_store = _FileBlameStore(repo)
+    keys: tp.List[tp.Optional[_FileBlameKeyTy]] = []
+    blamed_files: tp.List[tp.Optional[tp.FrozenSet[str]]] = []
+    for path, object_id in files:
+        if path in last_changing_commits:
+            key = (path, last_changing_commits[path], object_id)
+            keys.append(key)
+            blamed_files.append(blame_store.get(key))
+        else:
+            keys.append(None)
+            blamed_files.append(None)
+
+    def blame_file(idx: int) -> tp.FrozenSet[str]:
+        return _blame_file_commits(repo, head_commit, files[idx][0])
+
+    missing_indices = [
+        idx for idx, commits in enumerate(blamed_files) if commits is None
+    ]
+    num_workers = max(1, min(get_num_cache_jobs(), len(missing_indices)))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for idx, commits in zip(
+            missing_indices, executor.map(blame_file, missing_indices)
+        ):
+            blamed_files[idx] = commits
+            key = keys[idx]
+            if key:
+                blame_store.add(key, commits)
+
+    blame_store.store()
+    return tp.cast(tp.List[tp.FrozenSet[str]], blamed_files)
+
+
 class FileBasedInteractionGraph(InteractionGraph):
     """Graph/Network built from file-based interaction data."""
 
@@ -416,69 +575,45 @@ class FileBasedInteractionGraph(InteractionGraph):
         def create_graph() -> nx.DiGraph:
             main_repo = get_local_project_repo(self.project_name)
             repos = get_local_project_repos(self.project_name)
-            interaction_graph = nx.DiGraph()
             churn_config = ChurnConfig.create_c_style_languages_config()
-            file_pattern = re.compile(
-                r"|".join(
-                    churn_config.get_extensions_repr(prefix=r"\.", suffix=r"$")
-                )
-            )
-
-            blame_regex = re.compile(r"^([0-9a-f]+)\s+(?:.+\s+)?[\d]+\) ?(.*)$")
 
+            nodes: tp.Dict[BIGNodeTy, None] = {}
+            edge_amounts: tp.Counter[tp.Tuple[BIGNodeTy, BIGNodeTy]] = Counter()
             for repo_name, repo in repos.items():
                 head_commit = get_submodule_head(
                     main_repo, repo, self.__head_commit
                 )
+                repo_nodes: tp.Dict[str, BIGNodeTy] = {}
 
-                file_names = repo(
-                    "ls-tree", "--full-tree", "--name-only", "-r", head_commit
-                ).split("\n")
-                files: tp.List[Path] = [
-                    repo.worktree_path / path
-                    for path in file_names
-                    if file_pattern.search(path)
-                ]
-                for file in files:
-                    nodes: tp.Set[BIGNodeTy] = set()
-                    blame_lines: str = repo(
-                        "blame", "-w", "-s", "-l", "--root", head_commit, "--",
-                        str(file.relative_to(repo.worktree_path))
-                    )
-
-                    for line in blame_lines.strip().split("\n"):
-                        match = blame_regex.match(line)
-                        if not match:
-                            raise AssertionError
-
-                        if match.group(2):
-                            nodes.add(
-                                BlameTaintData(
-                                    CommitRepoPair(
-                                        FullCommitHash(match.group(1)),
-                                        repo_name
-                                    )
+                for file_commits in _blame_repo_files(
+                    repo, head_commit.hash, churn_config
+                ):
+                    file_nodes = []
+                    for commit in file_commits:
+                        if commit not in repo_nodes:
+                            repo_nodes[commit] = BlameTaintData(
+                                CommitRepoPair(
+                                    FullCommitHash(commit), repo_name
                                 )
                             )
+                        file_nodes.append(repo_nodes[commit])
 
-                    for node in nodes:
-                        interaction_graph.add_node(node, blame_taint_data=node)
-                    for commit_a, commit_b in itertools.product(
-                        nodes, repeat=2
-                    ):
-                        if commit_a != commit_b:
-                            if not interaction_graph.has_edge(
-                                commit_a, commit_b
-                            ):
-                                interaction_graph.add_edge(
-                                    commit_a, commit_b, amount=0
-                                )
-                            interaction_graph[commit_a][commit_b]["amount"] += 1
+                    nodes.update(dict.fromkeys(file_nodes))
+                    edge_amounts.update(itertools.permutations(file_nodes, 2))
+
+            interaction_graph = nx.DiGraph()
+            interaction_graph.add_nodes_from((node, {
+                "blame_taint_data": node
+            }) for node in nodes)
+            interaction_graph.add_edges_from((source, sink, {
+                "amount": amount
+            }) for (source, sink), amount in edge_amounts.items())
             return interaction_graph
 
         if not self.__cached_interaction_graph:
             self.__cached_interaction_graph = build_cached_graph(
-                f"ig-file-{self.project_name}", create_graph
+                f"ig-file-{self.project_name}-{self.__head_commit.hash}",
+                create_graph
             )
         return self.__cached_interaction_graph
 
@@ -1,26 +1,27 @@
 """Module for BlameReport, a collection of blame interactions."""
+import hashlib
 import logging
+import os
+import pickle
 import typing as tp
 from collections import defaultdict
-from copy import deepcopy
-from datetime import datetime
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
-import pygit2
 import yaml
 
 from varats.base.version_header import VersionHeader
 from varats.report.report import BaseReport
 from varats.utils.git_util import (
-    map_commits,
     CommitRepoPair,
-    CommitLookupTy,
+    CommitMetadataLookupTy,
     FullCommitHash,
     ShortCommitHash,
     UNCOMMITTED_COMMIT_HASH,
 )
+from varats.utils.settings import vara_cfg
 
 LOG = logging.getLogger(__name__)
 
@@ -203,6 +204,9 @@ class BlameInstInteractions():
 
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.base_taint, tuple(self.interacting_taints)))
+
 
 class BlameResultFunctionEntry():
     """Collection of all interactions for a specific function."""
@@ -299,37 +303,51 @@ def _calc_diff_between_func_entries(
     base_func_entry: BlameResultFunctionEntry,
     prev_func_entry: BlameResultFunctionEntry
 ) -> BlameResultFunctionEntry:
+    """Interactions that are unchanged between both entries are shared with the
+    entries and not copied."""
     diff_interactions: tp.List[BlameInstInteractions] = []
-
-    # copy lists to avoid side effects
-    base_interactions = list(base_func_entry.interactions)
-    prev_interactions = list(prev_func_entry.interactions)
+    prev_interactions = prev_func_entry.interactions
 
     # num instructions diff
     diff_num_instructions = abs(
         base_func_entry.num_instructions - prev_func_entry.num_instructions
     )
 
-    for base_inter in base_interactions:
-        if base_inter in prev_interactions:
-            prev_inter_idx = prev_interactions.index(base_inter)
-            prev_inter = prev_interactions.pop(prev_inter_idx)
+    # indices of equal interactions in the previous entry, in reverse order to
+    # match them in order of their occurrence
+    prev_inter_indices: tp.Dict[BlameInstInteractions,
+                                tp.List[int]] = defaultdict(list)
+    for prev_inter_idx in reversed(range(len(prev_interactions))):
+        prev_inter_indices[prev_interactions[prev_inter_idx]
+                          ].append(prev_inter_idx)
+    matched_prev_inters = [False] * len(prev_interactions)
+
+    for base_inter in base_func_entry.interactions:
+        matching_prev_indices = prev_inter_indices.get(base_inter, None)
+        if matching_prev_indices:
+            prev_inter_idx = matching_prev_indices.pop()
+            matched_prev_inters[prev_inter_idx] = True
             # create new blame inst interaction with the absolute difference
             # between base and prev
-            difference = base_inter.amount - prev_inter.amount
+            difference = base_inter.amount - prev_interactions[prev_inter_idx
+                                                              ].amount
             if difference != 0:
                 diff_interactions.append(
                     BlameInstInteractions(
-                        base_inter.base_taint,
-                        deepcopy(base_inter.interacting_taints), difference
+                        base_inter.base_taint, base_inter.interacting_taints,
+                        difference
                     )
                 )
         else:
             # append new interaction from base report
-            diff_interactions.append(deepcopy(base_inter))
+            diff_interactions.append(base_inter)
 
     # append left over interactions from previous blame report
-    diff_interactions += prev_interactions
+    diff_interactions += [
+        prev_inter
+        for prev_inter, matched in zip(prev_interactions, matched_prev_inters)
+        if not matched
+    ]
 
     # TODO (se-sic/VaRA#959): consider callgraph info in blame report diff
     return BlameResultFunctionEntry(
@@ -421,12 +439,187 @@ class BlameTaintScope(Enum):
         }[value]
 
 
+_COMPILED_BLAME_REPORT_VERSION = 1
+
+_CompiledReportTy = tp.Tuple[BlameReportMetaData, BlameTaintScope,
+                             tp.Dict[str, BlameResultFunctionEntry]]
+
+
+def _get_compiled_blame_report_path(report_path: Path) -> Path:
+    """Path of the compiled version of a blame report in the data cache."""
+    path_hash = hashlib.sha256(str(report_path.absolute()).encode()).hexdigest()
+    return Path(
+        str(vara_cfg()["data_cache"])
+    ) / "compiled_blame_reports" / f"{path_hash}.pickle"
+
+
+def _compile_blame_report(
+    report_path: Path, meta_data: BlameReportMetaData,
+    blame_taint_scope: BlameTaintScope,
+    function_entries: tp.Dict[str, BlameResultFunctionEntry]
+) -> None:
+    """
+    Store a parsed blame report in a compact form that is much faster to load
+    than the yaml report.
+
+    All strings and taints are interned, i.e., stored only once and referenced
+    by their index, and function entries are stored as flat lists of integers.
+    The compiled report is only valid as long as size and modification time of
+    the report file do not change.
+    """
+    strings: tp.Dict[tp.Optional[str], int] = {None: -1}
+    taints: tp.Dict[BlameTaintData, int] = {}
+
+    def intern_str(value: tp.Optional[str]) -> int:
+        return strings.setdefault(value, len(strings) - 1)
+
+    def intern_taint(taint: BlameTaintData) -> int:
+        if taint not in taints:
+            taints[taint] = len(taints)
+        return taints[taint]
+
+    compiled_functions = []
+    for func_entry in function_entries.values():
+        compiled_insts: tp.List[int] = []
+        for inst in func_entry.interactions:
+            compiled_insts.append(intern_taint(inst.base_taint))
+            compiled_insts.append(inst.amount)
+            compiled_insts.append(len(inst.interacting_taints))
+            compiled_insts.extend(
+                intern_taint(taint) for taint in inst.interacting_taints
+            )
+        compiled_functions.append((
+            intern_str(func_entry.name), intern_str(func_entry.demangled_name),
+            intern_str(func_entry.file_name), func_entry.num_instructions,
+            [intern_str(callee) for callee in func_entry.callees], [
+                intern_str(commit.commit_hash.hash)
+                for commit in func_entry.commits
+            ], [
+                intern_str(commit.repository_name)
+                for commit in func_entry.commits
+            ], compiled_insts
+        ))
+
+    compiled_taints = [(
+        intern_str(taint.commit.commit_hash.hash),
+        intern_str(taint.commit.repository_name), taint.region_id,
+        intern_str(taint.function_name)
+    ) for taint in taints]
+
+    report_stat = report_path.stat()
+    compiled_path = _get_compiled_blame_report_path(report_path)
+    compiled_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = compiled_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as compiled_file:
+        pickle.dump((
+            _COMPILED_BLAME_REPORT_VERSION, report_stat.st_size,
+            report_stat.st_mtime_ns, list(strings)[1:], (
+                meta_data.num_functions, meta_data.num_instructions,
+                meta_data.num_empty_tracked_vars,
+                meta_data.num_total_tracked_vars, meta_data.bta_wall_time
+            ), blame_taint_scope.name, compiled_taints, compiled_functions
+        ), compiled_file, pickle.HIGHEST_PROTOCOL)
+    tmp_path.replace(compiled_path)
+
+
+def _load_compiled_blame_report(
+    report_path: Path
+) -> tp.Optional[_CompiledReportTy]:
+    """
+    Load the compiled version of a blame report if it exists and is still up to
+    date.
+
+    Returns:
+        meta data, taint scope, and function entries of the report or ``None``
+    """
+    try:
+        report_stat = report_path.stat()
+        compiled_path = _get_compiled_blame_report_path(report_path)
+        with open(compiled_path, "rb") as compiled_file:
+            (
+                version, size, mtime_ns, strings, raw_meta_data, scope,
+                compiled_taints, compiled_functions
+            ) = pickle.load(compiled_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+
+    if version != _COMPILED_BLAME_REPORT_VERSION or (size, mtime_ns) != (
+        report_stat.st_size, report_stat.st_mtime_ns
+    ):
+        return None
+
+    strings.append(None)  # index -1 refers to None
+    commit_repo_pairs: tp.Dict[tp.Tuple[int, int], CommitRepoPair] = {}
+
+    def get_commit_repo_pair(commit_idx: int, repo_idx: int) -> CommitRepoPair:
+        if (commit_idx, repo_idx) not in commit_repo_pairs:
+            commit_repo_pairs[(commit_idx, repo_idx)] = CommitRepoPair(
+                FullCommitHash(strings[commit_idx]), strings[repo_idx]
+            )
+        return commit_repo_pairs[(commit_idx, repo_idx)]
+
+    # taints are immutable, so equal taints can share the same object
+    taints = [
+        BlameTaintData(
+            get_commit_repo_pair(commit_idx, repo_idx), region_id,
+            strings[function_idx]
+        ) for commit_idx, repo_idx, region_id, function_idx in compiled_taints
+    ]
+
+    function_entries: tp.Dict[str, BlameResultFunctionEntry] = {}
+    for (
+        name_idx, demangled_name_idx, file_name_idx, num_instructions,
+        callee_idxs, commit_idxs, repo_idxs, compiled_insts
+    ) in compiled_functions:
+        inst_list: tp.List[BlameInstInteractions] = []
+        pos = 0
+        while pos < len(compiled_insts):
+            base_taint_idx, amount, num_taints = compiled_insts[pos:pos + 3]
+            pos += 3
+            inst_list.append(
+                BlameInstInteractions(
+                    taints[base_taint_idx], [
+                        taints[taint_idx]
+                        for taint_idx in compiled_insts[pos:pos + num_taints]
+                    ], amount
+                )
+            )
+            pos += num_taints
+
+        function_entries[strings[name_idx]] = BlameResultFunctionEntry(
+            strings[name_idx], strings[demangled_name_idx],
+            strings[file_name_idx], inst_list, num_instructions,
+            [strings[callee_idx] for callee_idx in callee_idxs], [
+                get_commit_repo_pair(commit_idx, repo_idx)
+                for commit_idx, repo_idx in zip(commit_idxs, repo_idxs)
+            ]
+        )
+
+    return BlameReportMetaData(
+        *raw_meta_data
+    ), BlameTaintScope.from_string(scope), function_entries
+
+
 class BlameReport(BaseReport, shorthand="BR", file_type="yaml"):
-    """Full blame report containing all blame interactions."""
+    """
+    Full blame report containing all blame interactions.
+
+    If ``data_cache_settings.compile_blame_reports`` is enabled, parsed reports
+    are additionally stored in a compact binary form in the data cache, which is
+    used instead of the yaml file as long as the report file is not modified.
+    """
 
     def __init__(self, path: Path) -> None:
         super().__init__(path)
 
+        compiled_report = _load_compiled_blame_report(path)
+        if compiled_report is not None:
+            (
+                self.__meta_data, self.__blame_taint_scope,
+                self.__function_entries
+            ) = compiled_report
+            return
+
         with open(path, 'r') as stream:
             documents = yaml.load_all(stream, Loader=yaml.CLoader)
             version_header = VersionHeader(next(documents))
@@ -457,6 +650,12 @@ class BlameReport(BaseReport, shorthand="BR", file_type="yaml"):
                 self.__function_entries[new_function_entry.name
                                        ] = new_function_entry
 
+        if vara_cfg()["data_cache_settings"]["compile_blame_reports"]:
+            _compile_blame_report(
+                path, self.__meta_data, self.__blame_taint_scope,
+                self.__function_entries
+            )
+
     def get_blame_result_function_entry(
         self, mangled_function_name: str
     ) -> tp.Optional[BlameResultFunctionEntry]:
@@ -495,21 +694,48 @@ class BlameReport(BaseReport, shorthand="BR", file_type="yaml"):
 
 
 class BlameReportDiff():
-    """Diff class that contains all interactions that changed between two report
-    revisions."""
+    """
+    Diff class that contains all interactions that changed between two report
+    revisions.
+
+    Functions are diffed lazily when they are accessed. Function entries that
+    only exist in one of the reports and interactions that did not change are
+    not copied but shared with the diffed reports. Therefore:
+
+    - The entries of the diff and the reports must be treated as read-only,
+      e.g., the lists returned by ``interactions`` or ``interacting_taints``
+      must not be modified, as this changes the diffed reports as well. The
+      blame metrics and databases only read the entries.
+    - A diff keeps both reports alive for as long as it is used, so diffs
+      should not be stored longer than the reports would be.
+    """
 
     def __init__(
         self, base_report: BlameReport, prev_report: BlameReport
     ) -> None:
-        self.__function_entries: tp.Dict[str, BlameResultFunctionEntry] = {}
-        self.__base_head = base_report.head_commit
-        self.__prev_head = prev_report.head_commit
-        self.__calc_diff_br(base_report, prev_report)
         if base_report.blame_taint_scope != prev_report.blame_taint_scope:
             raise AssertionError(
                 "Cannot diff blame reports with different scopes."
             )
         self.__blame_taint_scope = base_report.blame_taint_scope
+        self.__base_report = base_report
+        self.__prev_report = prev_report
+        self.__base_head = base_report.head_commit
+        self.__prev_head = prev_report.head_commit
+
+        self.__function_names: tp.Dict[str, None] = dict.fromkeys(
+            func_entry.name for func_entry in base_report.function_entries
+        )
+        self.__function_names.update(
+            dict.fromkeys(
+                func_entry.name for func_entry in prev_report.function_entries
+            )
+        )
+        self.__diffed_functions: tp.Dict[
+            str, tp.Optional[BlameResultFunctionEntry]] = {}
+        self.__function_entries: tp.Optional[tp.Dict[str,
+                                                     BlameResultFunctionEntry]
+                                            ] = None
 
     @property
     def blame_taint_scope(self) -> BlameTaintScope:
@@ -526,6 +752,13 @@ class BlameReportDiff():
     @property
     def function_entries(self) -> tp.ValuesView[BlameResultFunctionEntry]:
         """Iterate over all function entries in the diff."""
+        if self.__function_entries is None:
+            self.__function_entries = {}
+            for func_name in self.__function_names:
+                diff_entry = self.__diff_function(func_name)
+                if diff_entry is not None:
+                    self.__function_entries[func_name] = diff_entry
+
         return self.__function_entries.values()
 
     def get_blame_result_function_entry(
@@ -537,69 +770,64 @@ class BlameReportDiff():
         Args:
             mangled_function_name: mangled name of the function to look up
         """
-        return self.__function_entries[mangled_function_name]
+        diff_entry = None
+        if mangled_function_name in self.__function_names:
+            diff_entry = self.__diff_function(mangled_function_name)
 
-    def has_function(self, mangled_function_name: str) -> bool:
-        return mangled_function_name in self.__function_entries
+        if diff_entry is None:
+            raise KeyError(mangled_function_name)
 
-    def __calc_diff_br(
-        self, base_report: BlameReport, prev_report: BlameReport
-    ) -> None:
-        function_names = {
-            base_func_entry.name
-            for base_func_entry in base_report.function_entries
-        } | {
-            prev_func_entry.name
-            for prev_func_entry in prev_report.function_entries
-        }
-        for func_name in function_names:
-            base_func_entry = None
-            prev_func_entry = None
-            try:
-                base_func_entry = base_report.get_blame_result_function_entry(
-                    func_name
-                )
-            except LookupError:
-                pass
+        return diff_entry
 
-            try:
-                prev_func_entry = prev_report.get_blame_result_function_entry(
-                    func_name
-                )
-            except LookupError:
-                pass
-
-            # Only base report has the function
-            if prev_func_entry is None and base_func_entry is not None:
-                if base_func_entry.interactions:
-                    self.__function_entries[func_name] = deepcopy(
-                        base_func_entry
-                    )
+    def has_function(self, mangled_function_name: str) -> bool:
+        return mangled_function_name in self.__function_names and \
+            self.__diff_function(mangled_function_name) is not None
 
-            # Only prev report has the function
-            elif base_func_entry is None and prev_func_entry is not None:
-                if prev_func_entry.interactions:
-                    self.__function_entries[func_name] = deepcopy(
-                        prev_func_entry
-                    )
+    def __diff_function(
+        self, func_name: str
+    ) -> tp.Optional[BlameResultFunctionEntry]:
+        """Diff a function of both reports, which results in None if no
+        interaction changed."""
+        if func_name in self.__diffed_functions:
+            return self.__diffed_functions[func_name]
 
-            # Both reports have the same function
-            elif base_func_entry is not None and prev_func_entry is not None:
-                diff_entry = _calc_diff_between_func_entries(
-                    base_func_entry, prev_func_entry
-                )
+        base_func_entry = self.__base_report.get_blame_result_function_entry(
+            func_name
+        )
+        prev_func_entry = self.__prev_report.get_blame_result_function_entry(
+            func_name
+        )
 
-                if diff_entry.interactions:
-                    self.__function_entries[func_name] = diff_entry
+        diff_entry: tp.Optional[BlameResultFunctionEntry] = None
+        # Only base report has the function
+        if prev_func_entry is None and base_func_entry is not None:
+            if base_func_entry.interactions:
+                diff_entry = base_func_entry
+
+        # Only prev report has the function
+        elif base_func_entry is None and prev_func_entry is not None:
+            if prev_func_entry.interactions:
+                diff_entry = prev_func_entry
+
+        # Both reports have the same function
+        elif base_func_entry is not None and prev_func_entry is not None:
+            diff_entry = _calc_diff_between_func_entries(
+                base_func_entry, prev_func_entry
+            )
+            if not diff_entry.interactions:
+                diff_entry = None
 
-            else:
-                raise AssertionError(
-                    "The function name should be at least in one of the reports"
-                )
+        else:
+            raise AssertionError(
+                "The function name should be at least in one of the reports"
+            )
+
+        self.__diffed_functions[func_name] = diff_entry
+        return diff_entry
 
     def __str__(self) -> str:
         str_representation = ""
-        for function in self.__function_entries.values():
+        for function in self.function_entries:
             str_representation += str(function) + "\n"
         return str_representation
 
@@ -657,32 +885,53 @@ def count_interacting_commits(
     )
 
 
+def _interacting_authors(
+    interaction: BlameInstInteractions, commit_lookup: CommitMetadataLookupTy
+) -> tp.List[str]:
+    # Skip 0000 hashes that we added to mark uncommitted files
+    # Issue (se-sic/VaRA#647): improve author uniquifying
+    return [
+        commit_lookup(btd.commit).author_name
+        for btd in interaction.interacting_taints
+        if btd.commit.commit_hash != UNCOMMITTED_COMMIT_HASH
+    ]
+
+
+def _interacting_time_deltas(
+    interaction: BlameInstInteractions, commit_lookup: CommitMetadataLookupTy
+) -> tp.Optional[tp.List[int]]:
+    """Time deltas in days between the base commit and all interacting commits
+    of an interaction or None, if the base commit is not committed yet."""
+    base_crp: CommitRepoPair = interaction.base_taint.commit
+    if base_crp.commit_hash == UNCOMMITTED_COMMIT_HASH:
+        return None
+
+    base_time = commit_lookup(base_crp).commit_time
+    return [
+        abs((base_time - commit_lookup(btd.commit).commit_time) // 86400)
+        for btd in interaction.interacting_taints
+        if btd.commit.commit_hash != UNCOMMITTED_COMMIT_HASH
+    ]
+
+
 def count_interacting_authors(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_lookup: CommitMetadataLookupTy
 ) -> int:
     """
     Counts the number of unique interacting authors.
 
     Args:
         report: the blame report or diff
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
 
     Returns:
         the number unique interacting authors in this report or diff
     """
-
-    def extract_interacting_authors(
-        interaction: BlameInstInteractions
-    ) -> tp.Iterable[str]:
-        return map_commits(
-            # Issue (se-sic/VaRA#647): improve author uniquifying
-            lambda c: tp.cast(str, c.author.name),
-            [btd.commit for btd in interaction.interacting_taints],
-            commit_lookup
-        )
-
-    return __count_elements(report, extract_interacting_authors)
+    return __count_elements(
+        report,
+        lambda interaction: _interacting_authors(interaction, commit_lookup)
+    )
 
 
 def generate_degree_tuples(
@@ -807,7 +1056,7 @@ def generate_lib_dependent_degrees(
 
 def generate_author_degree_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy
+    commit_lookup: CommitMetadataLookupTy
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples (author_degree, amount) where author_degree is
@@ -817,7 +1066,7 @@ def generate_author_degree_tuples(
 
     Args:
         report: the blame report
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
 
     Returns:
         list of tuples (author_degree, amount)
@@ -827,14 +1076,7 @@ def generate_author_degree_tuples(
 
     for func_entry in report.function_entries:
         for interaction in func_entry.interactions:
-            author_list = map_commits(
-                # Issue (se-sic/VaRA#647): improve author uniquifying
-                lambda c: tp.cast(str, c.author.name),
-                [btd.commit for btd in interaction.interacting_taints],
-                commit_lookup
-            )
-
-            degree = len(set(author_list))
+            degree = len(set(_interacting_authors(interaction, commit_lookup)))
             degree_dict[degree] += interaction.amount
 
     return list(degree_dict.items())
@@ -842,7 +1084,7 @@ def generate_author_degree_tuples(
 
 def generate_time_delta_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int,
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int,
     aggregate_function: tp.Callable[[tp.Sequence[tp.Union[int, float]]],
                                     tp.Union[int, float]]
 ) -> tp.List[tp.Tuple[int, int]]:
@@ -855,7 +1097,7 @@ def generate_time_delta_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
         aggregate_function: to aggregate the delta values of all
                             interacting commits
@@ -867,27 +1109,11 @@ def generate_time_delta_distribution_tuples(
 
     for func_entry in report.function_entries:
         for interaction in func_entry.interactions:
-            base_crp: CommitRepoPair = interaction.base_taint.commit
-            if base_crp.commit_hash == UNCOMMITTED_COMMIT_HASH:
+            time_deltas = _interacting_time_deltas(interaction, commit_lookup)
+            if time_deltas is None:
                 continue
 
-            base_commit = commit_lookup(interaction.base_taint.commit)
-            base_c_time = datetime.utcfromtimestamp(base_commit.commit_time)
-
-            def translate_to_time_deltas2(
-                commit: pygit2.Commit,
-                base_time: datetime = base_c_time
-            ) -> int:
-                other_c_time = datetime.utcfromtimestamp(commit.commit_time)
-                return abs((base_time - other_c_time).days)
-
-            author_list = map_commits(
-                translate_to_time_deltas2,
-                [btd.commit for btd in interaction.interacting_taints],
-                commit_lookup
-            )
-
-            degree = aggregate_function(author_list) if author_list else 0
+            degree = aggregate_function(time_deltas) if time_deltas else 0
             bucket = round(degree / bucket_size)
             degree_dict[bucket] += interaction.amount
 
@@ -896,7 +1122,7 @@ def generate_time_delta_distribution_tuples(
 
 def generate_avg_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of average time
@@ -906,7 +1132,7 @@ def generate_avg_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
 
     Returns:
@@ -919,7 +1145,7 @@ def generate_avg_time_distribution_tuples(
 
 def generate_max_time_distribution_tuples(
     report: tp.Union[BlameReport, BlameReportDiff],
-    commit_lookup: CommitLookupTy, bucket_size: int
+    commit_lookup: CommitMetadataLookupTy, bucket_size: int
 ) -> tp.List[tp.Tuple[int, int]]:
     """
     Generates a list of tuples that represent the distribution of maximal time
@@ -930,7 +1156,7 @@ def generate_max_time_distribution_tuples(
 
     Args:
         report: to analyze
-        commit_lookup: function to look up commits
+        commit_lookup: function to look up commit metadata
         bucket_size: size of a time bucket in days
 
     Returns:
@@ -941,6 +1167,79 @@ def generate_max_time_distribution_tuples(
     )
 
 
+@dataclass
+class BlameMetrics():
+    """Interaction metrics of a blame report or diff."""
+
+    num_interactions: int
+    num_interacting_commits: int
+    num_interacting_authors: int
+    degree_tuples: tp.List[tp.Tuple[int, int]]
+    author_degree_tuples: tp.List[tp.Tuple[int, int]]
+    avg_time_distribution_tuples: tp.List[tp.Tuple[int, int]]
+    max_time_distribution_tuples: tp.List[tp.Tuple[int, int]]
+
+
+def generate_blame_metrics(
+    report: tp.Union[BlameReport,
+                     BlameReportDiff], commit_lookup: CommitMetadataLookupTy,
+    avg_time_bucket_size: int, max_time_bucket_size: int
+) -> BlameMetrics:
+    """
+    Computes the results of :func:`count_interactions`,
+    :func:`count_interacting_commits`, :func:`count_interacting_authors`,
+    :func:`generate_degree_tuples`, :func:`generate_author_degree_tuples`,
+    :func:`generate_avg_time_distribution_tuples`, and
+    :func:`generate_max_time_distribution_tuples` in a single pass over the
+    report.
+
+    Args:
+        report: to analyze
+        commit_lookup: function to look up commit metadata
+        avg_time_bucket_size: size of an average time bucket in days
+        max_time_bucket_size: size of a maximal time bucket in days
+
+    Returns:
+        the metrics of the report
+    """
+    num_interactions = 0
+    interacting_taints: tp.Set[BlameTaintData] = set()
+    interacting_authors: tp.Set[str] = set()
+    degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
+    author_degree_dict: tp.DefaultDict[int, int] = defaultdict(int)
+    avg_time_dict: tp.DefaultDict[int, int] = defaultdict(int)
+    max_time_dict: tp.DefaultDict[int, int] = defaultdict(int)
+
+    for func_entry in report.function_entries:
+        for interaction in func_entry.interactions:
+            num_interactions += abs(interaction.amount)
+            interacting_taints.update(interaction.interacting_taints)
+
+            authors = _interacting_authors(interaction, commit_lookup)
+            interacting_authors.update(authors)
+
+            degree_dict[len(interaction.interacting_taints)
+                       ] += interaction.amount
+            author_degree_dict[len(set(authors))] += interaction.amount
+
+            time_deltas = _interacting_time_deltas(interaction, commit_lookup)
+            if time_deltas is None:
+                continue
+
+            avg_time = np.average(time_deltas) if time_deltas else 0
+            avg_time_dict[round(avg_time / avg_time_bucket_size)
+                         ] += interaction.amount
+            max_time = max(time_deltas) if time_deltas else 0
+            max_time_dict[round(max_time / max_time_bucket_size)
+                         ] += interaction.amount
+
+    return BlameMetrics(
+        num_interactions, len(interacting_taints), len(interacting_authors),
+        list(degree_dict.items()), list(author_degree_dict.items()),
+        list(avg_time_dict.items()), list(max_time_dict.items())
+    )
+
+
 def generate_in_head_interactions(
     report: BlameReport
 ) -> tp.List[BlameInstInteractions]:
@@ -9,7 +9,14 @@ Typically, a paper config has a file ``artefacts.yaml`` that manages artefact
 definitions.
 """
 import abc
+import glob
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
+import time
+import traceback
 import typing as tp
 from abc import ABC
 from functools import lru_cache
@@ -140,6 +147,32 @@ class Artefact(ABC):
     ) -> None:
         """Generate the specified artefact."""
 
+    def get_num_artefact_parts(self) -> int:
+        """
+        Retrieve the number of parts of this artefact that can be generated
+        independently of each other, e.g., in parallel.
+
+        This is called once before the parts are generated by worker
+        processes, which inherit all state the artefact prepared here.
+
+        Returns:
+            the number of parts of this artefact
+        """
+        return 1
+
+    def generate_artefact_part(self, part: int) -> None:
+        """
+        Generate a single part of this artefact.
+
+        By default, an artefact consists of a single part, i.e., the whole
+        artefact is generated.
+
+        Args:
+            part: index of the part to generate
+        """
+        assert part == 0
+        self.generate_artefact()
+
     @abc.abstractmethod
     def get_artefact_file_infos(self) -> tp.List[ArtefactFileInfo]:
         """
@@ -277,6 +310,394 @@ def load_artefacts_from_file(file_path: Path) -> Artefacts:
     return Artefacts(file_path, artefacts)
 
 
+_FINGERPRINTS_FILE_NAME = '.artefact_fingerprints.yaml'
+_FINGERPRINTS_FILE_VERSION = 1
+
+
+def _get_input_files_digest(input_files: tp.Iterable[Path]) -> str:
+    """
+    Compute a digest of the names, sizes, and modification times of files.
+
+    Args:
+        input_files: the files to compute the digest for
+
+    Returns:
+        the digest of the files
+    """
+    hasher = hashlib.sha256()
+    for input_file in sorted(input_files):
+        if input_file.is_file():
+            file_stat = input_file.stat()
+            hasher.update(
+                f"{input_file}\0{file_stat.st_size}\0"
+                f"{file_stat.st_mtime_ns}\0".encode()
+            )
+    return hasher.hexdigest()
+
+
+def get_project_result_digest(project_name: str) -> str:
+    """
+    Compute a digest of the names, sizes, and modification times of all result
+    files of a project.
+
+    Args:
+        project_name: name of the project
+
+    Returns:
+        the digest of the project's result files
+    """
+    result_dir = Path(str(vara_cfg()["result_dir"])) / project_name
+    if not result_dir.exists():
+        return _get_input_files_digest([])
+    return _get_input_files_digest(result_dir.rglob("*"))
+
+
+def get_project_cache_digest(project_name: str) -> str:
+    """
+    Compute a digest of the names, sizes, and modification times of all data
+    cache files of a project.
+
+    Args:
+        project_name: name of the project
+
+    Returns:
+        the digest of the project's data cache files
+    """
+    cache_dir = Path(str(vara_cfg()["data_cache"]))
+    if not cache_dir.exists():
+        return _get_input_files_digest([])
+    return _get_input_files_digest(
+        cache_dir.glob(f"*-{glob.escape(project_name)}[.-]*")
+    )
+
+
+def get_artefact_fingerprint(
+    artefact: Artefact,
+    file_infos: tp.Optional[tp.List[ArtefactFileInfo]] = None,
+    project_result_digests: tp.Optional[tp.Dict[str, str]] = None,
+    project_cache_digests: tp.Optional[tp.Dict[str, str]] = None
+) -> str:
+    """
+    Compute a fingerprint of all inputs of an artefact.
+
+    The fingerprint covers the artefact definition, the case studies the
+    artefact is generated for, and the sizes and modification times of the
+    result files and data cache files of the involved projects. If it is not
+    known for which case studies an artefact is generated, all case studies of
+    the current paper config are considered.
+
+    The digests of the result files and data cache files can be computed at
+    different times, e.g., the result files before an artefact is generated
+    and the data cache files, which generating an artefact can update,
+    afterwards.
+
+    Args:
+        artefact: the artefact to compute the fingerprint for
+        file_infos: the file infos of the artefact if already known
+        project_result_digests: digests of the result files of projects that
+                                can be shared between multiple calls; missing
+                                digests are added
+        project_cache_digests: digests of the data cache files of projects
+                               that can be shared between multiple calls;
+                               missing digests are added
+
+    Returns:
+        the fingerprint of the artefact's inputs
+    """
+    # pylint: disable=import-outside-toplevel
+    from varats.paper.paper_config import get_paper_config
+
+    if file_infos is None:
+        file_infos = artefact.get_artefact_file_infos()
+    if project_result_digests is None:
+        project_result_digests = {}
+    if project_cache_digests is None:
+        project_cache_digests = {}
+
+    case_studies = [
+        file_info.case_study
+        for file_info in file_infos
+        if file_info.case_study is not None
+    ]
+    if not file_infos or len(case_studies) < len(file_infos):
+        case_studies = get_paper_config().get_all_case_studies()
+
+    case_study_dicts = {
+        json.dumps(case_study.get_dict(), sort_keys=True)
+        for case_study in case_studies
+    }
+    project_names = sorted({
+        case_study.project_name for case_study in case_studies
+    })
+    for project_name in project_names:
+        if project_name not in project_result_digests:
+            project_result_digests[project_name] = get_project_result_digest(
+                project_name
+            )
+        if project_name not in project_cache_digests:
+            project_cache_digests[project_name] = get_project_cache_digest(
+                project_name
+            )
+
+    input_digests = [(
+        project_result_digests[project_name],
+        project_cache_digests[project_name]
+    ) for project_name in project_names]
+    fingerprint_inputs = {
+        "artefact": artefact.get_dict(),
+        "case_studies": sorted(case_study_dicts),
+        "inputs": input_digests
+    }
+    return hashlib.sha256(
+        json.dumps(fingerprint_inputs, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class ArtefactFingerprints:
+    """
+    The input fingerprints of the artefacts that were generated last.
+
+    Artefacts whose fingerprint did not change since and whose files still
+    exist do not need to be generated again.
+    """
+
+    def __init__(
+        self, file_path: Path, fingerprints: tp.Dict[str, str]
+    ) -> None:
+        self.__file_path = file_path
+        self.__fingerprints = fingerprints
+
+    def is_up_to_date(
+        self,
+        artefact: Artefact,
+        fingerprint: str,
+        file_infos: tp.Optional[tp.List[ArtefactFileInfo]] = None
+    ) -> bool:
+        """
+        Check whether an artefact was already generated from the same inputs.
+
+        Args:
+            artefact: the artefact to check
+            fingerprint: the current fingerprint of the artefact's inputs
+            file_infos: the file infos of the artefact if already known
+
+        Returns:
+            ``True`` if the artefact does not need to be generated again
+        """
+        if self.__fingerprints.get(artefact.name, None) != fingerprint:
+            return False
+
+        if file_infos is None:
+            file_infos = artefact.get_artefact_file_infos()
+        return all((artefact.output_dir / file_info.file_name).exists()
+                   for file_info in file_infos)
+
+    def update(self, artefact: Artefact, fingerprint: str) -> None:
+        """
+        Record the fingerprint of a generated artefact.
+
+        Args:
+            artefact: the generated artefact
+            fingerprint: the fingerprint of the artefact's inputs
+        """
+        self.__fingerprints[artefact.name] = fingerprint
+
+    def store(self) -> None:
+        """Store the fingerprints in their file."""
+        self.__file_path.parent.mkdir(parents=True, exist_ok=True)
+        store_as_yaml(
+            self.__file_path, [
+                VersionHeader.from_version_number(
+                    'ArtefactFingerprints', _FINGERPRINTS_FILE_VERSION
+                ), self
+            ]
+        )
+
+    def get_dict(self) -> tp.Dict[str, tp.Dict[str, str]]:
+        """Construct a dict from these fingerprints for easy export to
+        yaml."""
+        return {'fingerprints': dict(self.__fingerprints)}
+
+
+def load_artefact_fingerprints() -> ArtefactFingerprints:
+    """
+    Load the artefact fingerprints of the current paper config.
+
+    Returns:
+        the recorded fingerprints or an empty collection if no fingerprints
+        were recorded yet
+    """
+    file_path = Artefact.base_output_dir() / _FINGERPRINTS_FILE_NAME
+    if not file_path.exists():
+        return ArtefactFingerprints(file_path, {})
+
+    documents = load_yaml(file_path)
+    version_header = VersionHeader(next(documents))
+    version_header.raise_if_not_type("ArtefactFingerprints")
+    if version_header.version < _FINGERPRINTS_FILE_VERSION:
+        return ArtefactFingerprints(file_path, {})
+
+    return ArtefactFingerprints(file_path, next(documents)['fingerprints'])
+
+
+_ARTEFACT_PARTS: tp.List[tp.Tuple[Artefact, int]] = []
+
+
+def _init_artefact_worker() -> None:
+    """Prepare a worker process for generating artefacts."""
+    # pylint: disable=import-outside-toplevel
+    import matplotlib
+
+    # workers never show plots and must not open windows
+    matplotlib.use("Agg")
+    # worker processes cannot create process pools themselves
+    vara_cfg()["data_cache_settings"]["jobs"] = 1
+
+
+def _generate_artefact_part_in_worker(
+    part_idx: int
+) -> tp.Tuple[int, float, tp.Optional[str]]:
+    """
+    Generate an artefact part in a worker process.
+
+    The artefacts are inherited from the parent process via
+    ``_ARTEFACT_PARTS``, so that workers start with all data the parent
+    process has already loaded.
+
+    Returns:
+        the index of the part, the time it took to generate it, and a
+        description of the error that occurred if generation failed
+    """
+    artefact, part = _ARTEFACT_PARTS[part_idx]
+    start_time = time.perf_counter()
+    try:
+        artefact.generate_artefact_part(part)
+    except Exception:  # pylint: disable=broad-except
+        return part_idx, time.perf_counter() - start_time, \
+            traceback.format_exc()
+    return part_idx, time.perf_counter() - start_time, None
+
+
+def generate_artefacts(
+    artefacts: tp.List[Artefact],
+    progress: "Progress",
+    jobs: int = 1
+) -> tp.List[str]:
+    """
+    Generate artefacts and report their progress and generation times.
+
+    With more than one job, the parts of all artefacts are generated by a pool
+    of worker processes. An artefact that fails to generate is logged and
+    reported as failed instead of aborting the other artefacts.
+
+    Args:
+        artefacts: the artefacts to generate
+        progress: progress display to report to
+        jobs: number of worker processes; ``0`` uses all available cores
+
+    Returns:
+        the names of all artefacts that failed to generate
+    """
+    global _ARTEFACT_PARTS  # pylint: disable=global-statement
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        LOG.warning(
+            "Parallel artefact generation requires the 'fork' start method. "
+            "Falling back to sequential generation."
+        )
+        jobs = 1
+
+    if jobs <= 1:
+        failed_sequential_artefacts: tp.List[str] = []
+        for artefact in progress.track(
+            artefacts, description="Generating artefacts"
+        ):
+            LOG.info(
+                f"Generating artefact {artefact.name} in location "
+                f"{artefact.output_dir}"
+            )
+            start_time = time.perf_counter()
+            try:
+                artefact.generate_artefact(progress)
+            except Exception:  # pylint: disable=broad-except
+                LOG.error(
+                    f"Failed to generate artefact {artefact.name}\n"
+                    f"{traceback.format_exc()}"
+                )
+                failed_sequential_artefacts.append(artefact.name)
+                progress.console.print(
+                    f"Failed to generate {artefact.name} in "
+                    f"{time.perf_counter() - start_time:.1f}s"
+                )
+                continue
+
+            progress.console.print(
+                f"Generated {artefact.name} in "
+                f"{time.perf_counter() - start_time:.1f}s"
+            )
+        return failed_sequential_artefacts
+
+    remaining_parts = {
+        artefact.name: artefact.get_num_artefact_parts()
+        for artefact in artefacts
+    }
+    parts = [(artefact, part)
+             for artefact in artefacts
+             for part in range(remaining_parts[artefact.name])]
+    overall_task = progress.add_task(
+        total=len(parts), description="Generating artefacts"
+    )
+    artefact_tasks = {
+        artefact.name: progress.add_task(
+            total=remaining_parts[artefact.name],
+            description=f"Building {artefact.name}"
+        ) for artefact in artefacts
+    }
+    generation_times: tp.Dict[str, float] = {
+        artefact.name: 0 for artefact in artefacts
+    }
+    failed_artefacts: tp.Dict[str, None] = {}
+
+    LOG.info(
+        f"Generating {len(artefacts)} artefacts in {len(parts)} parts using "
+        f"{jobs} processes"
+    )
+    _ARTEFACT_PARTS = parts
+    try:
+        with multiprocessing.get_context("fork").Pool(
+            jobs, initializer=_init_artefact_worker
+        ) as process_pool:
+            for part_idx, generation_time, error in \
+                    process_pool.imap_unordered(
+                        _generate_artefact_part_in_worker, range(len(parts))
+                    ):
+                artefact, part = parts[part_idx]
+                generation_times[artefact.name] += generation_time
+                remaining_parts[artefact.name] -= 1
+                if error:
+                    LOG.error(
+                        f"Failed to generate part {part} of artefact "
+                        f"{artefact.name}\n{error}"
+                    )
+                    failed_artefacts[artefact.name] = None
+
+                progress.advance(artefact_tasks[artefact.name])
+                progress.advance(overall_task)
+                if remaining_parts[artefact.name] == 0:
+                    status = "Failed to generate" \
+                        if artefact.name in failed_artefacts else "Generated"
+                    progress.console.print(
+                        f"{status} {artefact.name} in "
+                        f"{generation_times[artefact.name]:.1f}s"
+                    )
+    finally:
+        _ARTEFACT_PARTS = []
+
+    return list(failed_artefacts)
+
+
 def initialize_artefact_types() -> None:
     """Import plots and tables module to register artefact types."""
     import varats.plot.plots  # pylint: disable=C0415,unused-import
@@ -56,7 +56,7 @@ from varats.utils.exceptions import UnsupportedOperation
 from varats.utils.git_util import (
     ShortCommitHash,
     FullCommitHash,
-    contains_source_code,
+    SourceCodeCommitStore,
     ChurnConfig,
     RepositoryHandle,
 )
@@ -571,15 +571,14 @@ def extend_with_distrib_sampling(
     if ignore_blocked:
         is_blocked = is_revision_blocked
 
-    is_code_commit: tp.Callable[[ShortCommitHash], bool] = lambda rev: True
+    is_code_commit: tp.Callable[[FullCommitHash], bool] = lambda rev: True
     if only_code_commits:
-        churn_conf = ChurnConfig.create_c_style_languages_config()
-        repo = get_local_project_repo(case_study.project_name)
-
-        def is_c_cpp_code_commit(commit: ShortCommitHash) -> bool:
-            return contains_source_code(repo, commit, churn_conf)
-
-        is_code_commit = is_c_cpp_code_commit
+        # classifies all commits in one pass and reuses persisted results
+        source_code_commits = SourceCodeCommitStore.get(
+            get_local_project_repo(case_study.project_name),
+            ChurnConfig.create_c_style_languages_config()
+        )
+        is_code_commit = source_code_commits.contains_source_code
 
     # Needs to be sorted so the propability distribution over the length
     # of the list is the same as the distribution over the commits age history
@@ -589,7 +588,7 @@ def extend_with_distrib_sampling(
         sorted(list(cmap.mapping_items_master()), key=lambda x: x[1]) if
         not case_study.has_revision_in_stage(ShortCommitHash(rev), merge_stage)
         and not is_blocked(ShortCommitHash(rev), project_cls) and
-        is_code_commit(ShortCommitHash(rev))
+        is_code_commit(FullCommitHash(rev))
     ]
 
     case_study.include_revisions(
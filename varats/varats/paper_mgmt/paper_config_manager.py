@@ -11,6 +11,7 @@ from zipfile import ZIP_DEFLATED, ZipFile
 from plumbum import colors
 
 import varats.paper.paper_config as PC
+from varats.data.discover_reports import initialize_reports
 from varats.experiment.experiment_util import VersionExperiment
 from varats.mapping.commit_map import get_commit_map
 from varats.paper.case_study import CaseStudy
@@ -381,6 +382,7 @@ def package_paper_config(
         for experiment_type in experiment_types:
             report_types.extend(experiment_type.report_spec().report_types)
     else:
+        initialize_reports()
         report_types = list(BaseReport.REPORT_TYPES.values())
 
     files_to_store: tp.Set[Path] = set()
@@ -9,6 +9,10 @@ from typing import final
 import click
 
 from varats.paper_mgmt.artefacts import Artefact, ArtefactFileInfo
+from varats.plots.discover_plots import (
+    get_plot_generator_manifest,
+    initialize_plot_generator,
+)
 from varats.ts_utils.artefact_util import convert_kwargs
 from varats.ts_utils.cli_util import (
     make_cli_option,
@@ -386,6 +390,35 @@ class PlotGenerator(abc.ABC):
         cls.OPTIONS = options
         cls.GENERATORS[generator_name] = cls
 
+    @staticmethod
+    def get_plot_generator_names() -> tp.List[str]:
+        """
+        Get the names of all available plot generators, including those whose
+        modules were not imported yet.
+
+        Returns:
+            a sorted list of plot generator names
+        """
+        return sorted(
+            set(PlotGenerator.GENERATORS) | set(get_plot_generator_manifest())
+        )
+
+    @staticmethod
+    def get_plot_generator_help(plot_generator_name: str) -> str:
+        """
+        Get the summary of a plot generator's docstring without importing its
+        module.
+
+        Args:
+            plot_generator_name: name of the plot generator
+
+        Returns:
+            the summary of the docstring, or an empty string for generators
+            that are not part of the tool suite
+        """
+        entry = get_plot_generator_manifest().get(plot_generator_name, None)
+        return entry.help if entry else ""
+
     @staticmethod
     def get_plot_generator_types_help_string() -> str:
         """
@@ -395,7 +428,7 @@ class PlotGenerator(abc.ABC):
             a help string that contains all available plot names.
         """
         return "The following plot generators are available:\n  " + "\n  ".join(
-            list(PlotGenerator.GENERATORS)
+            PlotGenerator.get_plot_generator_names()
         )
 
     @staticmethod
@@ -411,6 +444,9 @@ class PlotGenerator(abc.ABC):
         Returns:
             the class for the plot generator
         """
+        if plot_generator_type_name not in PlotGenerator.GENERATORS:
+            initialize_plot_generator(plot_generator_type_name)
+
         if plot_generator_type_name not in PlotGenerator.GENERATORS:
             raise LookupError(
                 f"Unknown plot generator '{plot_generator_type_name}'.\n" +
@@ -511,6 +547,7 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         self.__common_options.plot_dir = output_dir
         self.__plot_config = plot_config
         self.__plot_kwargs = kwargs
+        self.__plots: tp.Optional[tp.List['varats.plot.plot.Plot']] = None
 
     @property
     def plot_generator_type(self) -> str:
@@ -617,10 +654,64 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         if progress:
             task_id = progress.add_task(description=f"Building {self.name}")
 
-        generator_instance = self.plot_generator_class(
-            self.plot_config, **self.__plot_kwargs
+        if self.common_options.view or self.common_options.dry_run:
+            generator_instance = self.plot_generator_class(
+                self.plot_config, **self.__plot_kwargs
+            )
+            generator_instance(self.common_options, progress, task_id)
+            return
+
+        # reuse the plots that were already generated, e.g., for file infos
+        num_plots = len(self.__get_plots())
+        if progress and task_id is not None:
+            progress.update(task_id, total=num_plots)
+        for part in range(num_plots):
+            self.generate_artefact_part(part)
+            if progress and task_id is not None:
+                progress.advance(task_id)
+
+    def get_num_artefact_parts(self) -> int:
+        """
+        Retrieve the number of parts of this artefact that can be generated
+        independently of each other.
+
+        Each plot of the generator is a separate part unless plots are only
+        shown or logged.
+
+        Returns:
+            the number of parts of this artefact
+        """
+        if self.common_options.view or self.common_options.dry_run:
+            return 1
+
+        return len(self.__get_plots())
+
+    def generate_artefact_part(self, part: int) -> None:
+        """
+        Generate a single plot of this artefact.
+
+        Args:
+            part: index of the plot to generate
+        """
+        if self.common_options.view or self.common_options.dry_run:
+            self.generate_artefact()
+            return
+
+        plot_dir = self.common_options.plot_base_dir / \
+            self.common_options.plot_dir
+        plot_dir.mkdir(parents=True, exist_ok=True)
+        self.__get_plots()[part].save(
+            plot_dir, filetype=self.common_options.file_type
         )
-        generator_instance(self.common_options, progress, task_id)
+
+    def __get_plots(self) -> tp.List['varats.plot.plot.Plot']:
+        """Generate the plot instances once, so that all parts share them."""
+        if self.__plots is None:
+            generator_instance = self.plot_generator_class(
+                self.plot_config, **self.__plot_kwargs
+            )
+            self.__plots = generator_instance.generate()
+        return self.__plots
 
     def get_artefact_file_infos(self) -> tp.List[ArtefactFileInfo]:
         """
@@ -629,12 +720,9 @@ class PlotArtefact(Artefact, artefact_type="plot", artefact_type_version=2):
         Returns:
             a list of file info objects
         """
-        generator_instance = self.plot_generator_class(
-            self.plot_config, **self.__plot_kwargs
-        )
         return [
             ArtefactFileInfo(
                 plot.plot_file_name(self.common_options.file_type),
                 plot.plot_kwargs.get("case_study", None)
-            ) for plot in generator_instance.generate()
+            ) for plot in self.__get_plots()
         ]
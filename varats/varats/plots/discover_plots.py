@@ -1,8 +1,40 @@
 """This modules handles auto discovering of plots from the tool suite."""
+import importlib
 
 from varats import plots as __PLOTS__
+from varats.utils.registry_manifest import (
+    RegistryManifestTy,
+    get_registry_manifest,
+)
 
 
 def initialize_plots() -> None:
     # Discover and initialize all plots
     __PLOTS__.discover()
+
+
+def get_plot_generator_manifest() -> RegistryManifestTy:
+    """
+    Get a mapping from the names of all plot generators in the tool suite to
+    the modules that define them without importing these modules.
+
+    Returns:
+        a dict mapping plot generator names to manifest entries
+    """
+    return get_registry_manifest(__PLOTS__, "generator_name")
+
+
+def initialize_plot_generator(generator_name: str) -> None:
+    """
+    Import only the module that defines the given plot generator.
+
+    If the generator is not known from the manifest, all plots are discovered.
+
+    Args:
+        generator_name: name of the plot generator
+    """
+    entry = get_plot_generator_manifest().get(generator_name, None)
+    if entry:
+        importlib.import_module(entry.module_name)
+    else:
+        initialize_plots()
@@ -20,7 +20,7 @@ from varats.utils.exceptions import UnsupportedOperation
 from varats.utils.git_util import (
     ChurnConfig,
     calc_repo_code_churn,
-    calc_code_churn,
+    calc_code_churn_pairs,
     ShortCommitHash,
     FullCommitHash,
 )
@@ -107,13 +107,12 @@ def build_revisions_churn_table(
 
     repo = get_local_project_repo(project_name)
 
-    revision_pairs = zip(*(islice(revisions, i, None) for i in range(2)))
+    revision_pairs = list(zip(*(islice(revisions, i, None) for i in range(2))))
+    pair_churn = calc_code_churn_pairs(
+        repo, revision_pairs, ChurnConfig.create_c_style_languages_config()
+    )
     code_churn = [(0, 0, 0)]
-    code_churn.extend([
-        calc_code_churn(
-            repo, a, b, ChurnConfig.create_c_style_languages_config()
-        ) for a, b in revision_pairs
-    ])
+    code_churn.extend([pair_churn[pair] for pair in revision_pairs])
     churn_data = pd.DataFrame({
         "revision": revisions,
         "time_id": [commit_map.time_id(x) for x in revisions],
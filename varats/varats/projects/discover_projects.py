@@ -1,6 +1,13 @@
 """This modules handles auto discovering of projects from the tool suite."""
+import importlib
 
 from varats import projects as __PROJECTS__
+from varats.paper.paper_config import get_paper_config
+from varats.utils.exceptions import ConfigurationLookupError
+from varats.utils.registry_manifest import (
+    RegistryManifestTy,
+    get_registry_manifest,
+)
 
 PROJECTS_DISCOVERED = False
 
@@ -13,3 +20,48 @@ def initialize_projects() -> None:
         # Discover and initialize all projects
         __PROJECTS__.discover()
         PROJECTS_DISCOVERED = True
+
+
+def get_project_manifest() -> RegistryManifestTy:
+    """
+    Get a mapping from the names of all projects in the tool suite to the
+    modules that define them without importing these modules.
+
+    Returns:
+        a dict mapping project names to manifest entries
+    """
+    return get_registry_manifest(__PROJECTS__, "NAME")
+
+
+def initialize_project(project_name: str) -> None:
+    """
+    Import only the modules that define the projects matching the given name.
+
+    Like BenchBuild's project lookup, all projects whose names start with the
+    given name match. If no project matches, all projects are discovered.
+
+    Args:
+        project_name: name or name prefix of the project
+    """
+    module_names = {
+        entry.module_name
+        for name, entry in get_project_manifest().items()
+        if name.startswith(project_name)
+    }
+    if not module_names:
+        initialize_projects()
+
+    for module_name in sorted(module_names):
+        importlib.import_module(module_name)
+
+
+def initialize_paper_config_projects() -> None:
+    """Import only the modules that define the projects of the case studies in
+    the current paper config."""
+    try:
+        case_studies = get_paper_config().get_all_case_studies()
+    except ConfigurationLookupError:
+        return
+
+    for project_name in sorted({cs.project_name for cs in case_studies}):
+        initialize_project(project_name)
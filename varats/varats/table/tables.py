@@ -10,6 +10,10 @@ from typing import final
 import click
 
 from varats.paper_mgmt.artefacts import Artefact, ArtefactFileInfo
+from varats.tables.discover_tables import (
+    get_table_generator_manifest,
+    initialize_table_generator,
+)
 from varats.ts_utils.artefact_util import convert_kwargs
 from varats.ts_utils.cli_util import (
     make_cli_option,
@@ -361,6 +365,36 @@ class TableGenerator(abc.ABC):
         cls.OPTIONS = options
         cls.GENERATORS[generator_name] = cls
 
+    @staticmethod
+    def get_table_generator_names() -> tp.List[str]:
+        """
+        Get the names of all available table generators, including those whose
+        modules were not imported yet.
+
+        Returns:
+            a sorted list of table generator names
+        """
+        return sorted(
+            set(TableGenerator.GENERATORS) |
+            set(get_table_generator_manifest())
+        )
+
+    @staticmethod
+    def get_table_generator_help(table_generator_name: str) -> str:
+        """
+        Get the summary of a table generator's docstring without importing its
+        module.
+
+        Args:
+            table_generator_name: name of the table generator
+
+        Returns:
+            the summary of the docstring, or an empty string for generators
+            that are not part of the tool suite
+        """
+        entry = get_table_generator_manifest().get(table_generator_name, None)
+        return entry.help if entry else ""
+
     @staticmethod
     def get_table_generator_types_help_string() -> str:
         """
@@ -370,7 +404,7 @@ class TableGenerator(abc.ABC):
             a help string that contains all available table names.
         """
         return "The following table generators are available:\n  " + \
-               "\n  ".join(list(TableGenerator.GENERATORS))
+               "\n  ".join(TableGenerator.get_table_generator_names())
 
     @staticmethod
     def get_class_for_table_generator_type(
@@ -385,6 +419,9 @@ class TableGenerator(abc.ABC):
         Returns:
             the class for the table generator
         """
+        if table_generator_type_name not in TableGenerator.GENERATORS:
+            initialize_table_generator(table_generator_type_name)
+
         if table_generator_type_name not in TableGenerator.GENERATORS:
             raise LookupError(
                 f"Unknown table generator '{table_generator_type_name}'.\n" +
@@ -16,7 +16,7 @@ from varats.project.project_util import (
 from varats.table.table import Table
 from varats.table.table_utils import dataframe_to_table
 from varats.table.tables import TableFormat, TableGenerator
-from varats.utils.git_util import calc_repo_loc
+from varats.utils.git_util import calc_repo_locs
 
 LOG = logging.Logger(__name__)
 
@@ -28,19 +28,31 @@ class CaseStudyMetricsTable(Table, table_name="cs_metrics_table"):
     def tabulate(self, table_format: TableFormat, wrap_table: bool) -> str:
         case_studies = get_loaded_paper_config().get_all_case_studies()
 
+        latest_revisions = [
+            max(
+                case_study.revisions,
+                key=get_commit_map(case_study.project_name).time_id
+            ) for case_study in case_studies
+        ]
+
+        # count the lines of all revisions of a project at once, so that files
+        # shared between the revisions are only counted once
+        project_revisions: tp.Dict[str, tp.Set[str]] = {}
+        for case_study, revision in zip(case_studies, latest_revisions):
+            project_revisions.setdefault(case_study.project_name,
+                                         set()).add(revision.hash)
+        repo_locs = {
+            project_name:
+            calc_repo_locs(get_local_project_repo(project_name), revisions)
+            for project_name, revisions in project_revisions.items()
+        }
+
         cs_data: tp.List[pd.DataFrame] = []
-        for case_study in case_studies:
+        for case_study, revision in zip(case_studies, latest_revisions):
             project_name = case_study.project_name
-            commit_map = get_commit_map(project_name)
             project_cls = get_project_cls_by_name(project_name)
-            project_repo = get_local_project_repo(project_name)
-
-            revisions = sorted(
-                case_study.revisions, key=commit_map.time_id, reverse=True
-            )
-            revision = revisions[0]
 
-            repo_loc = calc_repo_loc(project_repo, revision.hash)
+            repo_loc = repo_locs[project_name][revision.hash]
             project_loc = calc_project_loc(project_name, revision)
             commits = num_project_commits(project_name, revision)
             authors = num_project_authors(project_name, revision)
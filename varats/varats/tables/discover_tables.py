@@ -1,8 +1,40 @@
 """This modules handles auto discovering of tables from the tool suite."""
+import importlib
 
 from varats import tables as __TABLES__
+from varats.utils.registry_manifest import (
+    RegistryManifestTy,
+    get_registry_manifest,
+)
 
 
 def initialize_tables() -> None:
     # Discover and initialize all plots
     __TABLES__.discover()
+
+
+def get_table_generator_manifest() -> RegistryManifestTy:
+    """
+    Get a mapping from the names of all table generators in the tool suite to
+    the modules that define them without importing these modules.
+
+    Returns:
+        a dict mapping table generator names to manifest entries
+    """
+    return get_registry_manifest(__TABLES__, "generator_name")
+
+
+def initialize_table_generator(generator_name: str) -> None:
+    """
+    Import only the module that defines the given table generator.
+
+    If the generator is not known from the manifest, all tables are discovered.
+
+    Args:
+        generator_name: name of the table generator
+    """
+    entry = get_table_generator_manifest().get(generator_name, None)
+    if entry:
+        importlib.import_module(entry.module_name)
+    else:
+        initialize_tables()
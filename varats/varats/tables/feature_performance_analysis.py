@@ -1,7 +1,9 @@
 """Module for feature performance analysis tables."""
 import logging
 import typing as tp
+from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 from pandas import CategoricalDtype
 
@@ -14,7 +16,6 @@ from varats.report.tef_report import (
     TEFReport,
     WorkloadSpecificTEFReportAggregate,
     TraceEventType,
-    TraceEvent,
 )
 from varats.revision.revisions import get_processed_revisions_files
 from varats.table.table import Table
@@ -24,6 +25,122 @@ from varats.utils.git_util import CommitHash
 
 LOG = logging.Logger(__name__)
 
+# uuid, interaction names up to and including the event, begin timestamp
+_OpenEvent = tp.Tuple[int, tp.Tuple[str, ...], int]
+
+
+class _FeaturePerformanceEngine():
+    """
+    Computes feature performances from the columnar trace events of TEF
+    reports.
+
+    Open feature regions are tracked on one stack per (pid, tid) and closing
+    events are matched by their uuid. Interaction strings are cached by the
+    names of the involved regions, so they are only built once per distinct
+    nesting.
+    """
+
+    def __init__(self) -> None:
+        self.__interaction_cache: tp.Dict[tp.Tuple[str, ...], str] = {}
+
+    def interaction_string(self, names: tp.Tuple[str, ...]) -> str:
+        """Returns the interaction string for the given region names."""
+        interaction_string = self.__interaction_cache.get(names)
+        if interaction_string is None:
+            interaction_string = FeaturePerformanceAnalysisTable\
+                .get_interactions_from_fr_string(",".join(names))
+            self.__interaction_cache[names] = interaction_string
+        return interaction_string
+
+    @staticmethod
+    def __find_opening_event(
+        open_events: tp.List[_OpenEvent], uuid: int
+    ) -> int:
+        for idx in range(len(open_events) - 1, -1, -1):
+            if open_events[idx][0] == uuid:
+                return idx
+
+        # Without a matching uuid, the innermost open region is closed.
+        return len(open_events) - 1
+
+    def feature_performance(self, tef_report: TEFReport) -> tp.Dict[str, int]:
+        """Extract feature performance from a TEFReport."""
+        feature_performances: tp.Dict[str, int] = {}
+
+        feature_category_id = tef_report.category_id_mapper.find_id("Feature")
+        if feature_category_id is None:
+            return feature_performances
+
+        begin_phase = str(TraceEventType.DURATION_EVENT_BEGIN).encode()
+        end_phase = str(TraceEventType.DURATION_EVENT_END).encode()
+
+        trace_events = tef_report.trace_event_columns
+        trace_events = trace_events[
+            (trace_events["category_id"] == feature_category_id) &
+            np.isin(trace_events["phase"], (begin_phase, end_phase))]
+        names = list(tef_report.name_id_mapper)
+
+        open_events: tp.DefaultDict[tp.Tuple[int, int],
+                                    tp.List[_OpenEvent]] = defaultdict(list)
+
+        for name_id, phase, timestamp, pid, tid, uuid in zip(
+            trace_events["name_id"].tolist(), trace_events["phase"].tolist(),
+            trace_events["ts"].tolist(), trace_events["pid"].tolist(),
+            trace_events["tid"].tolist(), trace_events["uuid"].tolist()
+        ):
+            thread_open_events = open_events[(pid, tid)]
+
+            if phase == begin_phase:
+                parent_names = thread_open_events[-1][1] \
+                    if thread_open_events else ()
+                thread_open_events.append(
+                    (uuid, parent_names + (names[name_id],), timestamp)
+                )
+                continue
+
+            if not thread_open_events:
+                LOG.warning(
+                    f"Found end of feature region {names[name_id]} without "
+                    f"a matching begin in {tef_report.path}."
+                )
+                continue
+
+            idx = self.__find_opening_event(thread_open_events, uuid)
+            begin_timestamp = thread_open_events.pop(idx)[2]
+            parent_names = thread_open_events[idx - 1][1] if idx > 0 else ()
+
+            # Regions that were opened after the closed one are no longer
+            # nested in it.
+            for outer_idx in range(idx, len(thread_open_events)):
+                outer_uuid, outer_names, outer_timestamp = \
+                    thread_open_events[outer_idx]
+                nested_names = thread_open_events[outer_idx - 1][1] \
+                    if outer_idx > 0 else ()
+                thread_open_events[outer_idx] = (
+                    outer_uuid, nested_names + outer_names[-1:], outer_timestamp
+                )
+
+            duration = timestamp - begin_timestamp
+
+            # Subtract feature duration from parent duration such that it is
+            # not counted twice, similar to behavior in Performance-Influence
+            # models.
+            if parent_names:
+                # Parent is equivalent to interaction of all open events.
+                interaction_string = self.interaction_string(parent_names)
+                feature_performances[interaction_string] = (
+                    feature_performances.get(interaction_string, 0) - duration
+                )
+
+            interaction_string = self.interaction_string(
+                parent_names + (names[name_id],)
+            )
+            feature_performances[interaction_string] = (
+                feature_performances.get(interaction_string, 0) + duration
+            )
+
+        return feature_performances
+
 
 class FeaturePerformanceAnalysisTable(
     Table, table_name="feature_perf_analysis_table"
@@ -55,58 +172,39 @@ class FeaturePerformanceAnalysisTable(
         tef_report: TEFReport,
     ) -> tp.Dict[str, int]:
         """Extract feature performance from a TEFReport."""
-        open_events: tp.List[TraceEvent] = []
+        return _FeaturePerformanceEngine().feature_performance(tef_report)
 
-        feature_performances: tp.Dict[str, int] = {}
+    @staticmethod
+    def get_feature_performances_from_tef_reports(
+        agg_tef_report: WorkloadSpecificTEFReportAggregate,
+        max_reports_per_workload: tp.Optional[int] = None,
+        engine: tp.Optional[_FeaturePerformanceEngine] = None
+    ) -> tp.Dict[str, tp.List[tp.Dict[str, int]]]:
+        """
+        Extract the feature performances of all reports in an aggregate.
 
-        for trace_event in tef_report.trace_events:
-            if trace_event.category == "Feature":
-                if (
-                    trace_event.event_type ==
-                    TraceEventType.DURATION_EVENT_BEGIN
-                ):
-                    open_events.append(trace_event)
-                elif (
-                    trace_event.event_type == TraceEventType.DURATION_EVENT_END
-                ):
-                    opening_event = open_events.pop()
-
-                    end_timestamp = trace_event.timestamp
-                    begin_timestamp = opening_event.timestamp
-
-                    # Subtract feature duration from parent duration such that
-                    # it is not counted twice, similar to behavior in
-                    # Performance-Influence models.
-                    interactions = [event.name for event in open_events]
-                    if open_events:
-                        # Parent is equivalent to interaction of all open
-                        # events.
-                        interaction_string = FeaturePerformanceAnalysisTable\
-                            .get_interactions_from_fr_string(
-                                ",".join(interactions)
-                            )
-                        if interaction_string in feature_performances:
-                            feature_performances[interaction_string] -= (
-                                end_timestamp - begin_timestamp
-                            )
-                        else:
-                            feature_performances[interaction_string] = -(
-                                end_timestamp - begin_timestamp
-                            )
-
-                    interaction_string = FeaturePerformanceAnalysisTable\
-                        .get_interactions_from_fr_string(
-                            ",".join(interactions + [trace_event.name])
-                        )
-
-                    current_performance = feature_performances.get(
-                        interaction_string, 0
-                    )
-                    feature_performances[interaction_string] = (
-                        current_performance + end_timestamp - begin_timestamp
-                    )
+        All reports are analysed with one engine, so interaction strings are
+        only computed once for all reports.
 
-        return feature_performances
+        Args:
+            agg_tef_report: aggregate with the reports of all workloads
+            max_reports_per_workload: only analyse the first reports of each
+                                      workload; analyse all if ``None``
+            engine: engine to share with other aggregates
+
+        Returns:
+            a mapping from workload names to the feature performances of each
+            analysed report of that workload
+        """
+        if engine is None:
+            engine = _FeaturePerformanceEngine()
+
+        return {
+            workload: [
+                engine.feature_performance(tef_report) for tef_report in
+                agg_tef_report.reports(workload)[:max_reports_per_workload]
+            ] for workload in agg_tef_report.workload_names()
+        }
 
     @staticmethod
     def sort_revisions(case_study: CaseStudy,
@@ -125,6 +223,7 @@ class FeaturePerformanceAnalysisTable(
         case_study: CaseStudy,
         agg_tef_report: WorkloadSpecificTEFReportAggregate,
         workload: str,
+        feature_performances: tp.Optional[tp.Dict[str, int]] = None
     ) -> tp.Dict[str, tp.Union[str, CommitHash, tp.Dict[str, int],
                                tp.Optional[int]]]:
         """Returns a dict with information about feature performances from a
@@ -135,9 +234,9 @@ class FeaturePerformanceAnalysisTable(
                 "Table can currently handle only one TEFReport per "
                 "revision, workload and config. Ignoring others."
             )
-        feature_performances = self.get_feature_performance_from_tef_report(
-            tef_report[0]
-        )
+        if feature_performances is None:
+            feature_performances = \
+                self.get_feature_performance_from_tef_report(tef_report[0])
         return {
             "Project": case_study.project_name,
             "Revision": agg_tef_report.filename.commit_hash,
@@ -162,6 +261,7 @@ class FeaturePerformanceAnalysisTable(
 
             workloads = set()
             revisions = set()
+            engine = _FeaturePerformanceEngine()
 
             for report_filepath in report_files:
                 agg_tef_report = WorkloadSpecificTEFReportAggregate(
@@ -170,11 +270,18 @@ class FeaturePerformanceAnalysisTable(
                 report_file = agg_tef_report.filename
                 revisions.add(report_file.commit_hash)
 
-                for workload in agg_tef_report.workload_names():
+                # only the first report of a workload is shown
+                workload_performances = self\
+                    .get_feature_performances_from_tef_reports(
+                        agg_tef_report, 1, engine
+                    )
+                for workload, feature_performances in \
+                        workload_performances.items():
                     workloads.add(workload)
                     df = df.append(
                         self.get_feature_performances_row(
-                            case_study, agg_tef_report, workload
+                            case_study, agg_tef_report, workload,
+                            feature_performances[0]
                         ),
                         ignore_index=True,
                     )
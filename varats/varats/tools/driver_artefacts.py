@@ -14,17 +14,19 @@ import click
 import yaml
 from rich.progress import Progress
 
-from varats.data.discover_reports import initialize_reports
 from varats.paper.paper_config import get_paper_config
 from varats.paper_mgmt.artefacts import (
     Artefact,
+    generate_artefacts,
+    get_artefact_fingerprint,
     initialize_artefact_types,
+    load_artefact_fingerprints,
     load_artefacts,
 )
 from varats.plot.plots import PlotArtefact
-from varats.plots.discover_plots import initialize_plots
-from varats.projects.discover_projects import initialize_projects
-from varats.tables.discover_tables import initialize_tables
+from varats.projects.discover_projects import (
+    initialize_paper_config_projects,
+)
 from varats.ts_utils.cli_util import initialize_cli_tool
 from varats.ts_utils.html_util import (
     CSS_IMAGE_MATRIX,
@@ -47,10 +49,7 @@ def main() -> None:
     `vara-art`
     """
     initialize_cli_tool()
-    initialize_projects()
-    initialize_reports()
-    initialize_tables()
-    initialize_plots()
+    initialize_paper_config_projects()
     initialize_artefact_types()
 
 
@@ -91,18 +90,35 @@ def show(name: str) -> None:
     multiple=True,
     help="Only generate artefacts with the given names."
 )
-def generate(only: tp.Optional[str]) -> None:
+@click.option(
+    "-j",
+    "--jobs",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of processes used to generate artefacts in parallel. "
+    "Use 0 for one process per available core."
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Regenerate artefacts even if their inputs did not change."
+)
+def generate(only: tp.Optional[str], jobs: int, force: bool) -> None:
     """
     Generate artefacts.
 
-    By default, all artefacts are generated.
+    By default, all artefacts are generated. Artefacts whose inputs did not
+    change since they were last generated are skipped unless ``force`` is set.
 
     Args:
         only: generate only this artefact
+        jobs: number of processes used to generate artefacts
+        force: regenerate artefacts even if their inputs did not change
     """
     if not Artefact.base_output_dir().exists():
         Artefact.base_output_dir().mkdir(parents=True)
-    artefacts: tp.Iterable[Artefact]
+    artefacts: tp.List[Artefact]
 
     if only:
         artefacts = [
@@ -110,17 +126,54 @@ def generate(only: tp.Optional[str]) -> None:
             if art.name in only
         ]
     else:
-        artefacts = load_artefacts(get_paper_config())
+        artefacts = list(load_artefacts(get_paper_config()))
+
+    fingerprints = load_artefact_fingerprints()
+    file_infos = {
+        artefact.name: artefact.get_artefact_file_infos()
+        for artefact in artefacts
+    }
+    # result files are digested before generation, so that results written
+    # while artefacts are generated are picked up by the next run
+    project_result_digests: tp.Dict[str, str] = {}
+    project_cache_digests: tp.Dict[str, str] = {}
+    outdated_artefacts: tp.List[Artefact] = []
+    for artefact in artefacts:
+        fingerprint = get_artefact_fingerprint(
+            artefact, file_infos[artefact.name], project_result_digests,
+            project_cache_digests
+        )
+        if not force and fingerprints.is_up_to_date(
+            artefact, fingerprint, file_infos[artefact.name]
+        ):
+            print(f"Skipping unchanged artefact {artefact.name}")
+        else:
+            outdated_artefacts.append(artefact)
+
+    if len(outdated_artefacts) < len(artefacts):
+        print(
+            f"Skipped {len(artefacts) - len(outdated_artefacts)} of "
+            f"{len(artefacts)} artefacts, use --force to regenerate them."
+        )
 
     with Progress() as progress:
-        for artefact in progress.track(
-            list(artefacts), description="Generating artefacts"
-        ):
-            LOG.info(
-                f"Generating artefact {artefact.name} in location "
-                f"{artefact.output_dir}"
+        failed_artefacts = generate_artefacts(
+            outdated_artefacts, progress, jobs
+        )
+
+    # generating artefacts can update the data cache, so only the data cache
+    # files are digested again after generation
+    project_cache_digests = {}
+    for artefact in outdated_artefacts:
+        if artefact.name not in failed_artefacts:
+            fingerprints.update(
+                artefact,
+                get_artefact_fingerprint(
+                    artefact, file_infos[artefact.name], project_result_digests,
+                    project_cache_digests
+                )
             )
-            artefact.generate_artefact(progress)
+    fingerprints.store()
 
     # generate index.html
     _generate_index_html(artefacts, Artefact.base_output_dir() / "index.html")
@@ -131,6 +184,11 @@ def generate(only: tp.Optional[str]) -> None:
         Artefact.base_output_dir() / "plot_matrix.html"
     )
 
+    if failed_artefacts:
+        raise click.ClickException(
+            f"Failed to generate artefacts: {', '.join(failed_artefacts)}"
+        )
+
 
 __INDEX_TABLE_TEMPLATE = """      <h2>{heading}</h2>
       <p><table>
@@ -10,7 +10,6 @@ import click
 from plumbum import FG, colors, local
 
 from varats.base.sampling_method import NormalSamplingMethod
-from varats.data.discover_reports import initialize_reports
 from varats.experiment.experiment_util import VersionExperiment
 from varats.experiments.szz.pydriller_szz_experiment import (
     PyDrillerSZZExperiment,
@@ -44,7 +43,10 @@ from varats.project.project_util import (
     get_primary_project_source,
     get_local_project_repo,
 )
-from varats.projects.discover_projects import initialize_projects
+from varats.projects.discover_projects import (
+    initialize_paper_config_projects,
+    initialize_project,
+)
 from varats.provider.release.release_provider import ReleaseType
 from varats.report.report import FileStatusExtension, BaseReport, ReportFilepath
 from varats.revision.revisions import (
@@ -53,6 +55,7 @@ from varats.revision.revisions import (
 )
 from varats.tools.tool_util import configuration_lookup_error_handler
 from varats.ts_utils.cli_util import (
+    LazyMultiCommand,
     cli_list_choice,
     initialize_cli_tool,
     cli_yn_choice,
@@ -87,8 +90,7 @@ def create_plot_type_choice() -> TypedChoice[tp.Type[Plot]]:
 def main() -> None:
     """Allow easier management of case studies."""
     initialize_cli_tool()
-    initialize_projects()
-    initialize_reports()
+    initialize_paper_config_projects()
 
 
 @main.command("status")
@@ -192,6 +194,7 @@ def __casestudy_gen(
 ) -> None:
     """Generate or extend a CaseStudy Sub commands can be chained to for example
     sample revisions but also add the latest."""
+    initialize_project(project)
     ctx.ensure_object(dict)
     ctx.obj['project'] = project
     ctx.obj['ignore_blocked'] = ignore_blocked
@@ -373,20 +376,24 @@ def __gen_per_year(
     store_case_study(ctx.obj['case_study'], ctx.obj['path'])
 
 
-class SmoothPlotCLI(click.MultiCommand):
+class SmoothPlotCLI(LazyMultiCommand):
     """Command factory for plots."""
 
-    def __init__(self, **attrs: tp.Any):
-        initialize_plots()
-        super().__init__(**attrs)
-
     def list_commands(self, ctx: click.Context) -> tp.List[str]:
-        return list(PlotGenerator.GENERATORS.keys())
+        return PlotGenerator.get_plot_generator_names()
+
+    def get_command_help(self, ctx: click.Context, cmd_name: str) -> str:
+        return PlotGenerator.get_plot_generator_help(cmd_name)
 
     def get_command(self, ctx: click.Context,
                     cmd_name: str) -> tp.Optional[click.Command]:
 
-        generator_cls = PlotGenerator.GENERATORS[cmd_name]
+        try:
+            generator_cls = PlotGenerator.get_class_for_plot_generator_type(
+                cmd_name
+            )
+        except LookupError:
+            return None
 
         @click.pass_context
         def command_template(context: click.Context, **kwargs: tp.Any) -> None:
@@ -567,6 +574,7 @@ def __casestudy_view(
     commit_hash: ShortCommitHash, newest_only: bool
 ) -> None:
     """View report files."""
+    initialize_project(project)
     try:
         commit_hash = __init_commit_hash(
             project, experiment_type, report_type, commit_hash
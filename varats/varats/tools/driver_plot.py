@@ -13,7 +13,10 @@ import click
 from rich.progress import Progress
 
 from varats.paper.paper_config import get_paper_config
-from varats.paper_mgmt.artefacts import load_artefacts
+from varats.paper_mgmt.artefacts import (
+    initialize_artefact_types,
+    load_artefacts,
+)
 from varats.plot.plots import (
     PlotGenerator,
     CommonPlotOptions,
@@ -21,28 +24,34 @@ from varats.plot.plots import (
     PlotGeneratorFailed,
     PlotArtefact,
 )
-from varats.plots.discover_plots import initialize_plots
 from varats.projects.discover_projects import initialize_projects
-from varats.tables.discover_tables import initialize_tables
-from varats.ts_utils.cli_util import initialize_cli_tool, add_cli_options
+from varats.ts_utils.cli_util import (
+    LazyMultiCommand,
+    initialize_cli_tool,
+    add_cli_options,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-class PlotCLI(click.MultiCommand):
+class PlotCLI(LazyMultiCommand):
     """Command factory for plots."""
 
-    def __init__(self, **attrs: tp.Any):
-        initialize_plots()
-        super().__init__(**attrs)
-
     def list_commands(self, ctx: click.Context) -> tp.List[str]:
-        return list(PlotGenerator.GENERATORS.keys())
+        return PlotGenerator.get_plot_generator_names()
+
+    def get_command_help(self, ctx: click.Context, cmd_name: str) -> str:
+        return PlotGenerator.get_plot_generator_help(cmd_name)
 
     def get_command(self, ctx: click.Context,
                     cmd_name: str) -> tp.Optional[click.Command]:
 
-        generator_cls = PlotGenerator.GENERATORS[cmd_name]
+        try:
+            generator_cls = PlotGenerator.get_class_for_plot_generator_type(
+                cmd_name
+            )
+        except LookupError:
+            return None
 
         @click.pass_context
         def command_template(context: click.Context, **kwargs: tp.Any) -> None:
@@ -108,8 +117,7 @@ def main(context: click.Context, **kwargs: tp.Any) -> None:
 
     initialize_cli_tool()
     initialize_projects()
-    initialize_tables()
-    initialize_plots()
+    initialize_artefact_types()
 
 
 if __name__ == '__main__':
@@ -22,7 +22,7 @@ from plumbum.commands import ProcessExecutionError
 
 from varats.paper.case_study import CaseStudy
 from varats.paper.paper_config import get_paper_config
-from varats.projects.discover_projects import initialize_projects
+from varats.projects.discover_projects import initialize_project
 from varats.ts_utils.cli_util import initialize_cli_tool, tee
 from varats.ts_utils.click_param_types import (
     create_multi_experiment_type_choice,
@@ -121,7 +121,6 @@ def main(
     """
     # pylint: disable=too-many-branches
     initialize_cli_tool()
-    initialize_projects()
 
     bb_command_args: tp.List[str] = ["--force-watch-unbuffered"]
     bb_extra_args: tp.List[str] = []
@@ -164,6 +163,9 @@ def main(
             cs.project_name for cs in get_paper_config().get_all_case_studies()
         })
 
+    for project in projects:
+        initialize_project(project.rsplit('@', maxsplit=1)[0])
+
     bb_args = list(
         itertools.chain(
             bb_command_args, *[["-E", e.NAME] for e in experiment], projects,
@@ -13,8 +13,10 @@ import click
 from rich.progress import Progress
 
 from varats.paper.paper_config import get_paper_config
-from varats.paper_mgmt.artefacts import load_artefacts
-from varats.plots.discover_plots import initialize_plots
+from varats.paper_mgmt.artefacts import (
+    initialize_artefact_types,
+    load_artefacts,
+)
 from varats.projects.discover_projects import initialize_projects
 from varats.table.tables import (
     TableGenerator,
@@ -23,26 +25,33 @@ from varats.table.tables import (
     TableArtefact,
     TableGeneratorFailed,
 )
-from varats.tables.discover_tables import initialize_tables
-from varats.ts_utils.cli_util import initialize_cli_tool, add_cli_options
+from varats.ts_utils.cli_util import (
+    LazyMultiCommand,
+    initialize_cli_tool,
+    add_cli_options,
+)
 
 LOG = logging.getLogger(__name__)
 
 
-class TableCLI(click.MultiCommand):
+class TableCLI(LazyMultiCommand):
     """Command factory for tables."""
 
-    def __init__(self, **attrs: tp.Any):
-        initialize_tables()
-        super().__init__(**attrs)
-
     def list_commands(self, ctx: click.Context) -> tp.List[str]:
-        return list(TableGenerator.GENERATORS.keys())
+        return TableGenerator.get_table_generator_names()
+
+    def get_command_help(self, ctx: click.Context, cmd_name: str) -> str:
+        return TableGenerator.get_table_generator_help(cmd_name)
 
     def get_command(self, ctx: click.Context,
                     cmd_name: str) -> tp.Optional[click.Command]:
 
-        generator_cls = TableGenerator.GENERATORS[cmd_name]
+        try:
+            generator_cls = TableGenerator.get_class_for_table_generator_type(
+                cmd_name
+            )
+        except LookupError:
+            return None
 
         @click.pass_context
         def command_template(context: click.Context, **kwargs: tp.Any) -> None:
@@ -109,8 +118,7 @@ def main(context: click.Context, **kwargs: tp.Any) -> None:
 
     initialize_cli_tool()
     initialize_projects()
-    initialize_tables()
-    initialize_plots()
+    initialize_artefact_types()
 
 
 if __name__ == '__main__':
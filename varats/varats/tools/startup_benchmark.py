@@ -0,0 +1,428 @@
+"""
+Benchmark harness for the startup time of the tool suite's entry points.
+
+All measurements are taken in fresh interpreter processes:
+
+- cold startup: importing an entry point without any cached bytecode
+- warm startup: importing an entry point with warm bytecode caches
+- CLI startup: invoking an entry point like its console script, e.g.,
+  ``vara-plot --help``, which includes the time until the first output
+- import time breakdown per module, as reported by ``python -X importtime``
+- time spent loading the configurations and in the ``initialize_*``
+  discovery functions
+
+Results can be stored as a baseline and later runs can be checked for
+regressions against it, e.g., with
+``python -m varats.tools.startup_benchmark --baseline startup.json``.
+"""
+import json
+import subprocess
+import sys
+import tempfile
+import time
+import typing as tp
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import click
+
+ImportTimesTy = tp.Dict[str, 'ImportTime']
+
+ENTRY_POINTS: tp.Dict[str, str] = {
+    "vara-run": "varats.tools.driver_run",
+    "vara-cs": "varats.tools.driver_casestudy",
+    "vara-plot": "varats.tools.driver_plot",
+    "vara-table": "varats.tools.driver_table",
+    "vara-art": "varats.tools.driver_artefacts",
+}
+"""Entry points of the tool suite mapped to the modules that implement
+them."""
+
+ENTRY_POINT_ARGS: tp.Dict[str, tp.List[str]] = {
+    "vara-run": ["--help"],
+    "vara-cs": ["status", "--help"],
+    "vara-plot": ["--help"],
+    "vara-table": ["--help"],
+    "vara-art": ["list", "--help"],
+}
+"""Arguments the entry points are invoked with to measure their CLI startup.
+
+Subcommand help runs the main command's setup, like ``initialize_cli_tool``,
+before anything is printed."""
+
+SETUP_STEPS: tp.List[tp.Tuple[str, str]] = [
+    ("varats.utils.settings", "vara_cfg"),
+    ("varats.utils.settings", "bb_cfg"),
+    ("varats.projects.discover_projects", "initialize_projects"),
+    ("varats.data.discover_reports", "initialize_reports"),
+    ("varats.experiments.discover_experiments", "initialize_experiments"),
+    ("varats.tables.discover_tables", "initialize_tables"),
+    ("varats.plots.discover_plots", "initialize_plots"),
+]
+"""Setup functions that are timed in the given order."""
+
+_SETUP_STEPS_SCRIPT = """
+import importlib, json, sys, time
+timings = {}
+for module_name, function_name in json.loads(sys.argv[1]):
+    function = getattr(importlib.import_module(module_name), function_name)
+    start = time.perf_counter()
+    function()
+    timings[function_name] = time.perf_counter() - start
+print(json.dumps(timings))
+"""
+
+_CLI_SCRIPT = """
+import importlib, sys
+entry_point, module_name = sys.argv[1:3]
+del sys.argv[1:3]
+sys.argv[0] = entry_point
+sys.exit(importlib.import_module(module_name).main())
+"""
+
+
+@dataclass
+class ImportTime:
+    """Time spent importing a module in seconds."""
+
+    self_time: float
+    cumulative_time: float
+
+
+@dataclass
+class StartupBenchmarkResult:
+    """Results of a startup benchmark run; all times are in seconds."""
+
+    cold_startup: tp.Dict[str, float] = field(default_factory=dict)
+    warm_startup: tp.Dict[str, float] = field(default_factory=dict)
+    setup_steps: tp.Dict[str, float] = field(default_factory=dict)
+    import_times: tp.Dict[str, ImportTimesTy] = field(default_factory=dict)
+    cli_startup: tp.Dict[str, float] = field(default_factory=dict)
+
+    def store(self, file_path: Path) -> None:
+        """Store the results as a json file."""
+        with open(file_path, "w") as result_file:
+            json.dump(asdict(self), result_file, indent=2)
+
+    @staticmethod
+    def load(file_path: Path) -> 'StartupBenchmarkResult':
+        """Load results from a json file."""
+        with open(file_path, "r") as result_file:
+            raw_result = json.load(result_file)
+
+        # baselines of older versions did not measure the CLI startup
+        return StartupBenchmarkResult(
+            raw_result["cold_startup"],
+            raw_result["warm_startup"],
+            raw_result["setup_steps"], {
+                entry_point: {
+                    module: ImportTime(**import_time)
+                    for module, import_time in module_times.items()
+                } for entry_point, module_times in
+                raw_result["import_times"].items()
+            },
+            cli_startup=raw_result.get("cli_startup", {})
+        )
+
+
+def parse_import_times(importtime_output: str) -> ImportTimesTy:
+    """
+    Parse the output of ``python -X importtime``.
+
+    Args:
+        importtime_output: the stderr output of the interpreter
+
+    Returns:
+        the import times of all imported modules
+    """
+    import_times: ImportTimesTy = {}
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, cumulative_time, module = line[len("import time:"):].split(
+            "|", maxsplit=2
+        )
+        if not self_time.strip().isdigit():
+            # table header
+            continue
+
+        # importtime reports microseconds
+        import_time = ImportTime(
+            int(self_time) / 1e6,
+            int(cumulative_time) / 1e6
+        )
+        import_times[module.strip()] = import_time
+    return import_times
+
+
+def _run_python(
+    args: tp.List[str]
+) -> tp.Tuple[float, subprocess.CompletedProcess]:  # type: ignore[type-arg]
+    """Run a fresh interpreter and measure its wall clock time."""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, *args],
+                             capture_output=True,
+                             text=True,
+                             check=True)
+    return time.perf_counter() - start, process
+
+
+def measure_startup(module: str,
+                    runs: int = 3) -> tp.Tuple[float, float, ImportTimesTy]:
+    """
+    Measure the time it takes to start an interpreter and import a module.
+
+    For cold startups, every run uses an empty bytecode cache. Of all runs, the
+    fastest one is reported to reduce the influence of noise.
+
+    Args:
+        module: name of the module to import
+        runs: number of cold and warm runs
+
+    Returns:
+        the cold and warm startup time and the import times of the warm
+        startup
+    """
+    cold_times: tp.List[float] = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as pycache_prefix:
+            cold_time, _ = _run_python([
+                "-X", f"pycache_prefix={pycache_prefix}", "-c",
+                f"import {module}"
+            ])
+            cold_times.append(cold_time)
+
+    warm_times: tp.List[float] = []
+    import_times: ImportTimesTy = {}
+    for _ in range(runs):
+        warm_time, process = _run_python([
+            "-X", "importtime", "-c", f"import {module}"
+        ])
+        if not warm_times or warm_time < min(warm_times):
+            import_times = parse_import_times(process.stderr)
+        warm_times.append(warm_time)
+
+    return min(cold_times), min(warm_times), import_times
+
+
+def measure_cli_startup(entry_point: str, runs: int = 3) -> float:
+    """
+    Measure the time it takes to invoke an entry point like its console script
+    until it exits.
+
+    In contrast to :func:`measure_startup`, this includes everything the entry
+    point does before printing its first output, e.g., parsing the command
+    line, rendering the help text, and setting up the tool. The entry point is
+    invoked with the arguments in :data:`ENTRY_POINT_ARGS`. Of all runs, the
+    fastest one is reported.
+
+    Args:
+        entry_point: name of the entry point to invoke
+        runs: number of runs
+
+    Returns:
+        the CLI startup time
+    """
+    cli_times: tp.List[float] = []
+    for _ in range(runs):
+        cli_time, _ = _run_python([
+            "-c", _CLI_SCRIPT, entry_point, ENTRY_POINTS[entry_point],
+            *ENTRY_POINT_ARGS.get(entry_point, ["--help"])
+        ])
+        cli_times.append(cli_time)
+
+    return min(cli_times)
+
+
+def measure_setup_steps(
+    setup_steps: tp.Optional[tp.List[tp.Tuple[str, str]]] = None
+) -> tp.Dict[str, float]:
+    """
+    Measure the time spent in setup functions, i.e., configuration loading and
+    discovery functions.
+
+    The functions are called in the given order in a fresh interpreter.
+
+    Args:
+        setup_steps: module and name of the functions to time; defaults to
+                     :data:`SETUP_STEPS`
+
+    Returns:
+        the time spent in each function
+    """
+    _, process = _run_python([
+        "-c", _SETUP_STEPS_SCRIPT,
+        json.dumps(setup_steps or SETUP_STEPS)
+    ])
+    # setup functions may print to stdout, the timings are on the last line
+    timings = process.stdout.splitlines()[-1]
+    return tp.cast(tp.Dict[str, float], json.loads(timings))
+
+
+def run_startup_benchmark(
+    entry_points: tp.Optional[tp.List[str]] = None,
+    runs: int = 3
+) -> StartupBenchmarkResult:
+    """
+    Run the startup benchmark.
+
+    Args:
+        entry_points: names of the entry points to benchmark; defaults to all
+                      entry points in :data:`ENTRY_POINTS`
+        runs: number of runs per entry point
+
+    Returns:
+        the benchmark results
+    """
+    result = StartupBenchmarkResult()
+    for entry_point in entry_points or list(ENTRY_POINTS):
+        cold_time, warm_time, import_times = measure_startup(
+            ENTRY_POINTS[entry_point], runs
+        )
+        result.cold_startup[entry_point] = cold_time
+        result.warm_startup[entry_point] = warm_time
+        result.import_times[entry_point] = import_times
+        result.cli_startup[entry_point] = measure_cli_startup(entry_point, runs)
+
+    result.setup_steps = measure_setup_steps()
+    return result
+
+
+def find_regressions(
+    result: StartupBenchmarkResult,
+    baseline: StartupBenchmarkResult,
+    max_slowdown: float = 1.5,
+    min_difference: float = 0.1
+) -> tp.List[str]:
+    """
+    Compare benchmark results against a baseline.
+
+    A measurement regressed if it is more than ``max_slowdown`` times slower
+    than the baseline and also slower by at least ``min_difference`` seconds,
+    so that noise in very fast measurements is not reported.
+
+    Args:
+        result: the results to check
+        baseline: the baseline results
+        max_slowdown: the maximum accepted slowdown factor
+        min_difference: the minimum difference in seconds to report
+
+    Returns:
+        a description of every regressed measurement
+    """
+    regressions: tp.List[str] = []
+    for kind, times, baseline_times in [
+        ("cold startup", result.cold_startup, baseline.cold_startup),
+        ("warm startup", result.warm_startup, baseline.warm_startup),
+        ("CLI startup", result.cli_startup, baseline.cli_startup),
+        ("setup step", result.setup_steps, baseline.setup_steps),
+    ]:
+        for name, measured_time in times.items():
+            if name not in baseline_times:
+                continue
+
+            baseline_time = baseline_times[name]
+            if measured_time > baseline_time * max_slowdown and \
+                    measured_time - baseline_time >= min_difference:
+                regressions.append(
+                    f"{kind} of {name}: {measured_time:.2f}s "
+                    f"(baseline {baseline_time:.2f}s)"
+                )
+    return regressions
+
+
+def _print_result(result: StartupBenchmarkResult, top_modules: int) -> None:
+    print("Startup times (cold import / warm import / CLI):")
+    for entry_point, cold_time in result.cold_startup.items():
+        print(
+            f"  {entry_point}: {cold_time:.2f}s / "
+            f"{result.warm_startup[entry_point]:.2f}s / "
+            f"{result.cli_startup[entry_point]:.2f}s"
+        )
+        slowest_modules = sorted(
+            result.import_times[entry_point].items(),
+            key=lambda item: item[1].self_time,
+            reverse=True
+        )[:top_modules]
+        for module, import_time in slowest_modules:
+            print(
+                f"    {module}: {import_time.self_time:.3f}s self, "
+                f"{import_time.cumulative_time:.3f}s cumulative"
+            )
+
+    print("Setup steps:")
+    for step, step_time in result.setup_steps.items():
+        print(f"  {step}: {step_time:.2f}s")
+
+
+@click.command(
+    help="Benchmark the startup time of the tool suite's entry points.",
+    context_settings={"help_option_names": ['-h', '--help']}
+)
+@click.option(
+    "--entry-point",
+    "entry_points",
+    type=click.Choice(list(ENTRY_POINTS)),
+    multiple=True,
+    help="Only benchmark the given entry points."
+)
+@click.option(
+    "--runs",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of runs per entry point."
+)
+@click.option(
+    "--top-modules",
+    type=int,
+    default=5,
+    show_default=True,
+    help="Number of modules with the highest import time to show."
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Baseline to compare the results against."
+)
+@click.option(
+    "--store-baseline",
+    is_flag=True,
+    help="Store the results as new baseline instead of comparing them."
+)
+@click.option(
+    "--max-slowdown",
+    type=float,
+    default=1.5,
+    show_default=True,
+    help="Maximum accepted slowdown factor compared to the baseline."
+)
+def main(
+    entry_points: tp.Tuple[str, ...], runs: int, top_modules: int,
+    baseline: tp.Optional[Path], store_baseline: bool, max_slowdown: float
+) -> None:
+    """Run the startup benchmark and compare it against a baseline."""
+    result = run_startup_benchmark(list(entry_points) or None, runs)
+    _print_result(result, top_modules)
+
+    if not baseline:
+        return
+
+    if store_baseline or not baseline.exists():
+        result.store(baseline)
+        print(f"Stored baseline in {baseline}.")
+        return
+
+    regressions = find_regressions(
+        result, StartupBenchmarkResult.load(baseline), max_slowdown
+    )
+    if regressions:
+        raise click.ClickException(
+            "Startup time regressed:\n  " + "\n  ".join(regressions)
+        )
+    print("No startup time regressions.")
+
+
+if __name__ == '__main__':
+    main()  # pylint: disable=no-value-for-parameter
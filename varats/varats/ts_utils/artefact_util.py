@@ -3,6 +3,7 @@ import typing as tp
 
 from benchbuild.experiment import ExperimentRegistry
 
+from varats.data.discover_reports import get_report_type
 from varats.experiment.experiment_util import VersionExperiment
 from varats.paper.case_study import CaseStudy
 from varats.paper.paper_config import get_loaded_paper_config, PaperConfig
@@ -65,7 +66,7 @@ class ReportTypeConverter(CLIOptionConverter[tp.Type[BaseReport]]):
     ) -> tp.Union[tp.Type[BaseReport], tp.List[tp.Type[BaseReport]]]:
         if isinstance(str_value, tp.List):
             raise ValueError("Conversion for lists not implemented.")
-        return BaseReport.REPORT_TYPES[str_value]
+        return get_report_type(str_value)
 
 
 class ExperimentTypeConverter(CLIOptionConverter[tp.Type[VersionExperiment]]):
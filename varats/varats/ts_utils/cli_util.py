@@ -122,6 +122,46 @@ def add_cli_options(command: CommandTy, *options: CLIOptionTy) -> CommandTy:
     return command
 
 
+class LazyMultiCommand(click.MultiCommand):
+    """
+    A click multi command whose subcommands are only created when they are
+    invoked.
+
+    Creating a subcommand can require to import heavy modules, e.g., the module
+    of a plot generator. Therefore, the help page of a lazy multi command lists
+    its subcommands with the help texts from :meth:`get_command_help` instead
+    of creating them.
+    """
+
+    def get_command_help(self, ctx: click.Context, cmd_name: str) -> str:
+        """
+        Get the short help text of a subcommand without creating it.
+
+        Args:
+            ctx: the click context
+            cmd_name: name of the subcommand
+
+        Returns:
+            the help text of the subcommand
+        """
+        # pylint: disable=unused-argument
+        return ""
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        commands = self.list_commands(ctx)
+        if commands:
+            limit = formatter.width - 6 - max(map(len, commands))
+            with formatter.section("Commands"):
+                formatter.write_dl([(
+                    command,
+                    click.utils.make_default_short_help(
+                        self.get_command_help(ctx, command), limit
+                    )
+                ) for command in commands])
+
+
 # ------------------------------------------------------------------------------
 # CLIOptionConverter
 # ------------------------------------------------------------------------------
@@ -7,7 +7,7 @@ import click
 from benchbuild.experiment import ExperimentRegistry
 from click import ParamType
 
-from varats.data.discover_reports import initialize_reports
+from varats.data.discover_reports import get_report_type, get_report_type_names
 from varats.experiments.discover_experiments import initialize_experiments
 from varats.paper.paper_config import get_paper_config
 from varats.report.report import BaseReport
@@ -48,6 +48,31 @@ class TypedChoice(click.Choice, tp.Generic[ChoiceTy]):
             super(TypedChoice, self).convert(value, param, ctx)]
 
 
+class LazyTypedChoice(click.Choice, tp.Generic[ChoiceTy]):
+    """Typed choice parameter type that only loads the value of the selected
+    choice, e.g., to import only the module that defines it."""
+
+    name = "lazy typed choice"
+
+    def __init__(
+        self,
+        choices: tp.List[str],
+        load_choice: tp.Callable[[str], ChoiceTy],
+        case_sensitive: bool = True
+    ):
+        self.__load_choice = load_choice
+        super().__init__(choices, case_sensitive)
+
+    def convert(
+        self, value: tp.Any, param: tp.Optional[click.Parameter],
+        ctx: tp.Optional[click.Context]
+    ) -> ChoiceTy:
+        return self.__load_choice(
+            #  pylint: disable=super-with-arguments
+            super(LazyTypedChoice, self).convert(value, param, ctx)
+        )
+
+
 class TypedMultiChoice(click.Choice, tp.Generic[ChoiceTy]):
     """
     Typed choice parameter type allows giving multiple values.
@@ -140,10 +165,9 @@ def create_single_case_study_choice() -> TypedChoice['CaseStudy']:
     return TypedChoice(value_dict)
 
 
-def create_report_type_choice() -> TypedChoice[tp.Type[BaseReport]]:
+def create_report_type_choice() -> LazyTypedChoice[tp.Type[BaseReport]]:
     """Create a choice parameter type that allows selecting a report type."""
-    initialize_reports()
-    return TypedChoice(BaseReport.REPORT_TYPES)
+    return LazyTypedChoice(get_report_type_names(), get_report_type)
 
 
 def is_experiment_excluded(experiment_name: str) -> bool: